@@ -7,7 +7,7 @@ import logging
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, List, Set, Dict, Tuple, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Set, Dict, Tuple, Optional, Union
 
 import hashlib
 import lizard
@@ -17,10 +17,22 @@ from git.objects import Commit as GitCommit
 from git.objects.base import IndexObject
 
 from gitanalyzer.domain.developer import Developer
+from gitanalyzer.domain.patch import BytesPatch, Hunk, ParsedPatch, parse_patch, parse_patch_bytes
+from gitanalyzer.utils.blob_reader import BlobReader
+from gitanalyzer.utils.metrics_cache import BlobMetrics, shared_metrics_cache
+from gitanalyzer.utils.pathspecs import file_type_pathspecs
+
+if TYPE_CHECKING:
+    # The cache module imports this one, so the type is only needed for annotations
+    from gitanalyzer.domain.commit_record import FileStat
+    from gitanalyzer.utils.analysis_cache import AnalysisCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Marks lazily loaded FileChange values that have not been read yet (None is a valid value)
+_NOT_LOADED = object()
+
 
 class ChangeType(Enum):
     """
@@ -77,6 +89,16 @@ class CodeMethod:
         self.total_lines: int = function.length
         self.max_nesting: int = function.top_nesting_level
 
+    @classmethod
+    def from_fields(cls, fields: Dict[str, Any]) -> "CodeMethod":
+        """
+        Rebuilds a CodeMethod from the attributes of a previously analyzed one,
+        as stored by the analysis cache.
+        """
+        method = cls.__new__(cls)
+        method.__dict__.update(fields)
+        return method
+
     def __eq__(self, other) -> bool:
         """
         Compare two methods for equality based on name and parameters.
@@ -117,21 +139,36 @@ class FileChange:
     changes and metrics.
     """
 
-    def __init__(self, diff_object: Diff):
+    def __init__(self, diff_object: Diff, blob_reader: Optional[BlobReader] = None,
+                 analysis_cache: Optional["AnalysisCache"] = None):
         """
         Creates a new FileChange instance to track modifications to a file.
         
         Args:
             diff_object: Git diff object containing change information
+            blob_reader: Shared repository blob reader; when omitted, blobs are
+                read through GitPython
+            analysis_cache: Persistent cache for per-blob code metrics
         """
         self._diff = diff_object
+        self._blob_reader = blob_reader
+        self._analysis_cache = analysis_cache
         
         # Lazy-loaded properties
+        self._content: Any = _NOT_LOADED
+        self._previous_content: Any = _NOT_LOADED
+        self._current_code: Any = _NOT_LOADED
+        self._previous_code: Any = _NOT_LOADED
         self._cached_nloc = None
         self._cached_complexity = None
         self._cached_tokens = None
         self._methods_current: List[CodeMethod] = []
         self._methods_previous: List[CodeMethod] = []
+        self._current_analyzed = False
+        self._previous_analyzed = False
+        self._released_counts: Optional[Tuple[int, int]] = None
+        self._binary: Optional[bool] = None
+        self._patch: Optional[Union[ParsedPatch, BytesPatch]] = None
 
     def __hash__(self) -> int:
         """
@@ -164,9 +201,28 @@ class FileChange:
     def diff_text(self) -> str:
         """
         Returns the diff text in UTF-8 format.
+        Raises ValueError if the patch was dropped by release_memory().
         """
+        if self._released_counts is not None:
+            raise ValueError(f"Patch text of {self.filename} was released")
         return self._decode_text(self._diff.diff) or ''
 
+    def release_memory(self) -> None:
+        """
+        Drops the patch text and any loaded file contents. Line counts are kept;
+        file contents are read again from the repository if accessed later.
+        """
+        if self._released_counts is None:
+            self._released_counts = (self.lines_added, self.lines_removed)
+            self._binary = self.is_binary
+            self._diff.diff = None
+            self._patch = None
+
+        self._content = _NOT_LOADED
+        self._previous_content = _NOT_LOADED
+        self._current_code = _NOT_LOADED
+        self._previous_code = _NOT_LOADED
+
     def _decode_text(self, content: Union[str, bytes, None]) -> Optional[str]:
         """
         Safely decodes content to UTF-8 string format.
@@ -185,56 +241,113 @@ class FileChange:
     def content(self) -> Optional[bytes]:
         """
         Returns the current file content in raw bytes.
+        The blob is read once and kept for later accesses.
         """
-        return self._get_raw_content(self._diff.b_blob)
+        if self._content is _NOT_LOADED:
+            self._content = self._get_raw_content(self._diff.b_blob)
+        return self._content
 
     @property
     def previous_content(self) -> Optional[bytes]:
         """
         Returns the previous version's content in raw bytes.
+        The blob is read once and kept for later accesses.
         """
-        return self._get_raw_content(self._diff.a_blob)
+        if self._previous_content is _NOT_LOADED:
+            self._previous_content = self._get_raw_content(self._diff.a_blob)
+        return self._previous_content
 
     def _get_raw_content(self, blob: Optional[IndexObject]) -> Optional[bytes]:
         """
-        Extracts raw content from a git blob object.
+        Extracts raw content from a git blob object, preferring the shared blob reader.
         """
-        return blob.data_stream.read() if blob is not None else None
+        if blob is None:
+            return None
+        if self._blob_reader is not None:
+            return self._blob_reader.read(blob.hexsha)
+        return blob.data_stream.read()
 
     @property
     def current_code(self) -> Optional[str]:
         """
         Returns the current version's source code as text.
         """
-        if self.content and isinstance(self.content, bytes):
-            return self._decode_text(self.content)
-        return None
+        if self._current_code is _NOT_LOADED:
+            content = self.content
+            self._current_code = self._decode_text(content) if content and isinstance(content, bytes) else None
+        return self._current_code
 
     @property
     def previous_code(self) -> Optional[str]:
         """
         Returns the previous version's source code as text.
         """
-        if self.previous_content and isinstance(self.previous_content, bytes):
-            return self._decode_text(self.previous_content)
-        return None
+        if self._previous_code is _NOT_LOADED:
+            content = self.previous_content
+            self._previous_code = self._decode_text(content) if content and isinstance(content, bytes) else None
+        return self._previous_code
+
+    @property
+    def patch(self) -> Union[ParsedPatch, BytesPatch]:
+        """
+        Returns the parsed patch. The diff is walked once, on first access,
+        and every derived property is served from the result. Raw patches are
+        parsed without decoding, so line counts and hunks never pay for UTF-8
+        decoding; line contents are decoded only when read.
+        """
+        if self._patch is None:
+            raw = self._diff.diff
+            if isinstance(raw, bytes) and self._released_counts is None:
+                self._patch = parse_patch_bytes(raw)
+            else:
+                self._patch = parse_patch(self.diff_text)
+        return self._patch
 
     @property
     def lines_added(self) -> int:
         """
         Counts the number of lines added in this change.
         """
-        return sum(1 for line in self.diff_text.replace("\r", "").split("\n")
-                  if line.startswith("+") and not line.startswith("+++"))
+        if self._released_counts is not None:
+            return self._released_counts[0]
+        return self.patch.lines_added
 
     @property
     def lines_removed(self) -> int:
         """
         Counts the number of lines removed in this change.
         """
-        return sum(1 for line in self.diff_text.replace("\r", "").split("\n")
-                  if line.startswith("-") and not line.startswith("---"))
-    
+        if self._released_counts is not None:
+            return self._released_counts[1]
+        return self.patch.lines_removed
+
+    @property
+    def hunks(self) -> List[Hunk]:
+        """
+        Returns the boundaries of every ``@@`` section of the patch.
+        """
+        return self.patch.hunks
+
+    @property
+    def change_blocks(self) -> int:
+        """
+        Counts the runs of consecutive added or removed lines in the patch.
+        """
+        return self.patch.change_blocks
+
+    @property
+    def is_binary(self) -> bool:
+        """
+        Indicates whether git reported the file as binary, in which case
+        the patch holds no lines.
+        """
+        if self._binary is None:
+            raw = self._diff.diff
+            if isinstance(raw, str):
+                raw = raw.encode("utf-8", "ignore")
+            self._binary = isinstance(raw, bytes) and raw.startswith((b"Binary files ", b"GIT binary patch"))
+        return self._binary
+
     @property
     def original_path(self) -> Optional[str]:
         """
@@ -309,55 +422,12 @@ class FileChange:
             Dictionary with keys 'added' and 'deleted', each containing a list of
             tuples (line_number, line_content)
         """
-        diff_lines = self.diff_text.split("\n")
-        changes = {
-            "added": [],
-            "deleted": [],
+        patch = self.patch
+        return {
+            "added": patch.added,
+            "deleted": patch.deleted,
         }
 
-        deletion_counter = addition_counter = 0
-
-        for line in diff_lines:
-            line = line.rstrip()
-            deletion_counter += 1
-            addition_counter += 1
-
-            if line.startswith("@@"):
-                deletion_counter, addition_counter = self._parse_chunk_header(line)
-                continue
-
-            if line.startswith("-"):
-                changes["deleted"].append((deletion_counter, line[1:]))
-                addition_counter -= 1
-            elif line.startswith("+"):
-                changes["added"].append((addition_counter, line[1:]))
-                deletion_counter -= 1
-            elif line == r"\ No newline at end of file":
-                deletion_counter -= 1
-                addition_counter -= 1
-
-        return changes
-    
-    @staticmethod
-    def _parse_chunk_header(line: str) -> Tuple[int, int]:
-        """
-        Extracts line numbers from a git diff chunk header.
-        
-        Args:
-            line: Diff chunk header line starting with @@
-            
-        Returns:
-            Tuple of (deletion_start, addition_start) line numbers
-        """
-        chunks = line.split(" ")
-        old_file_info = chunks[1]
-        new_file_info = chunks[2]
-        
-        deletion_start = int(old_file_info.split(",")[0].replace("-", "")) - 1
-        addition_start = int(new_file_info.split(",")[0]) - 1
-        
-        return deletion_start, addition_start
-
     @property
     def current_methods(self) -> List[CodeMethod]:
         """
@@ -384,19 +454,19 @@ class FileChange:
         """
         current = self.current_methods
         previous = self.previous_methods
-        additions = self.parsed_diff["added"]
-        deletions = self.parsed_diff["deleted"]
+        additions = self.patch.added_line_numbers
+        deletions = self.patch.deleted_line_numbers
 
         # Find methods affected by additions
         changed_in_current = {
-            method for line_num, _ in additions
+            method for line_num in additions
             for method in current
             if method.line_start <= line_num <= method.line_end
         }
 
         # Find methods affected by deletions
         changed_in_previous = {
-            method for line_num, _ in deletions
+            method for line_num in deletions
             for method in previous
             if method.line_start <= line_num <= method.line_end
         }
@@ -448,6 +518,7 @@ class FileChange:
     def _compute_code_metrics(self, analyze_previous: bool = False) -> None:
         """
         Analyzes code metrics using Lizard for current and optionally previous versions.
+        Results are looked up by blob SHA first, so each blob is analyzed once.
         
         Args:
             analyze_previous: Whether to analyze the previous version of the code
@@ -456,31 +527,75 @@ class FileChange:
             return
 
         # Analyze current version if not already done
-        if self.current_code and self._cached_nloc is None:
-            metrics = lizard.analyze_file.analyze_source_code(
-                self.filename, 
-                self.current_code
-            )
-            
-            # Store basic metrics
-            self._cached_nloc = metrics.nloc
-            self._cached_complexity = metrics.CCN
-            self._cached_tokens = metrics.token_count
-            
-            # Process methods
-            self._methods_current = [CodeMethod(func) for func in metrics.function_list]
+        if not self._current_analyzed:
+            self._current_analyzed = True
+            if self.current_code:
+                metrics = self._blob_metrics(self._diff.b_blob, self.current_code)
+                
+                # Store basic metrics
+                self._cached_nloc = metrics.nloc
+                self._cached_complexity = metrics.complexity
+                self._cached_tokens = metrics.token_count
+                self._methods_current = metrics.methods
 
         # Analyze previous version if requested
-        if (analyze_previous and 
-            self.previous_code and 
-            not self._methods_previous):
-            
-            previous_metrics = lizard.analyze_file.analyze_source_code(
-                self.filename,
-                self.previous_code
-            )
+        if analyze_previous and not self._previous_analyzed:
+            self._previous_analyzed = True
+            if self.previous_code:
+                self._methods_previous = self._blob_metrics(
+                    self._diff.a_blob, self.previous_code
+                ).methods
+
+    def _blob_metrics(self, blob: Optional[IndexObject], code: str) -> BlobMetrics:
+        """
+        Returns the Lizard results for a blob, checking the process-wide cache
+        and then the persistent analysis cache before running Lizard.
+        
+        Args:
+            blob: Blob holding the analyzed version of the file
+            code: Decoded content of the blob
             
-            self._methods_previous = [CodeMethod(func) for func in previous_metrics.function_list]
+        Returns:
+            BlobMetrics for the blob
+        """
+        extension = Path(self.filename).suffix
+        blob_sha = blob.hexsha if blob is not None else None
+
+        if blob_sha:
+            metrics = shared_metrics_cache.get(blob_sha, extension)
+            if metrics is None and self._analysis_cache is not None:
+                metrics = self._analysis_cache.load_blob_metrics(blob_sha, extension)
+                if metrics is not None:
+                    shared_metrics_cache.put(blob_sha, extension, metrics)
+            if metrics is not None:
+                return self._attach_source_file(metrics)
+
+        analysis = lizard.analyze_file.analyze_source_code(self.filename, code)
+        metrics = BlobMetrics(
+            analysis.nloc,
+            analysis.CCN,
+            analysis.token_count,
+            [CodeMethod(func) for func in analysis.function_list]
+        )
+
+        if blob_sha:
+            shared_metrics_cache.put(blob_sha, extension, metrics)
+            if self._analysis_cache is not None:
+                self._analysis_cache.store_blob_metrics(blob_sha, extension, metrics)
+        return metrics
+
+    def _attach_source_file(self, metrics: BlobMetrics) -> BlobMetrics:
+        """
+        Points the methods of cached metrics at this file. Files with the same
+        content share one cache entry, whose methods carry the name of the
+        file that was analyzed first.
+        """
+        if all(method.source_file == self.filename for method in metrics.methods):
+            return metrics
+        return metrics._replace(methods=[
+            CodeMethod.from_fields({**vars(method), "source_file": self.filename})
+            for method in metrics.methods
+        ])
 
     def _decode_content(self, content: bytes) -> Optional[str]:
         """
@@ -526,6 +641,7 @@ class CommitInfo:
         self._commit = git_commit
         self._config = config
         self._cached_stats = None
+        self._file_changes: Optional[List[FileChange]] = None
 
     def __hash__(self) -> int:
         """
@@ -646,6 +762,12 @@ class CommitInfo:
         if self._cached_stats is not None:
             return self._cached_stats
 
+        cache = self._config.get("analysis_cache")
+        if cache is not None:
+            self._cached_stats = cache.load_commit_stats(self.sha, self._analysis_options_key())
+            if self._cached_stats is not None:
+                return self._cached_stats
+
         if not self.parent_commits:
             # For commits without parents (initial commits)
             raw_stats = self._config.get('git').repo.git.diff_tree(
@@ -672,8 +794,30 @@ class CommitInfo:
             )
 
         self._cached_stats = self._parse_git_stats(processed_stats)
+        if cache is not None:
+            cache.store_commit_stats(self.sha, self._analysis_options_key(), self._cached_stats)
         return self._cached_stats
 
+    def _analysis_options_key(self, restricted: bool = False) -> str:
+        """
+        Returns the analysis cache key part for the diff options in use.
+
+        Args:
+            restricted: Include the file type pathspecs, for results derived from file_changes
+        """
+        from gitanalyzer.utils.analysis_cache import options_key
+        return options_key(
+            histogram=bool(self._config.get("histogram")),
+            ignore_whitespace=bool(self._config.get("skip_whitespaces")),
+            pathspecs=self._diff_pathspecs() if restricted else None
+        )
+
+    def _diff_pathspecs(self) -> Optional[List[str]]:
+        """
+        Returns the pathspecs file_changes is restricted to, None to diff every file.
+        """
+        return file_type_pathspecs(self._config.get("only_modifications_with_file_types"))
+
     def _parse_git_stats(self, stats_text: str) -> dict:
         """
         Parses git diff statistics into a structured format.
@@ -741,7 +885,13 @@ class CommitInfo:
         of parsing merge conflicts. See:
         - https://haacked.com/archive/2014/02/21/reviewing-merge-commits/
         - https://github.com/ishepard/pydriller/issues/89#issuecomment-590243707
+
+        The diff is computed once per commit; use invalidate_file_changes() to
+        force a new diff and release_file_changes() to bound memory use.
         """
+        if self._file_changes is not None:
+            return self._file_changes
+
         diff_options = {}
         
         # Apply configuration options
@@ -750,12 +900,15 @@ class CommitInfo:
         if self._config.get("skip_whitespaces"):
             diff_options["w"] = True
 
+        # Only diff the files of the requested types
+        paths = self._diff_pathspecs()
+
         # Handle different commit scenarios
         if len(self.parent_commits) == 1:
             # Normal commit with one parent
             diff_data: Any = self._commit.parents[0].diff(
                 other=self._commit,
-                paths=None,
+                paths=paths,
                 create_patch=True,
                 **diff_options
             )
@@ -767,12 +920,34 @@ class CommitInfo:
             # Initial commit - compare with empty tree
             diff_data = self._commit.diff(
                 NULL_TREE,
-                paths=None,
+                paths=paths,
                 create_patch=True,
                 **diff_options
             )
 
-        return self._process_diff_data(diff_data)
+        self._file_changes = self._process_diff_data(diff_data)
+        return self._file_changes
+
+    @property
+    def modified_files(self) -> List[FileChange]:
+        """
+        Alias of file_changes, sharing the same memoized diff.
+        """
+        return self.file_changes
+
+    def invalidate_file_changes(self) -> None:
+        """
+        Forgets the memoized file changes so the next access diffs the commit again.
+        """
+        self._file_changes = None
+
+    def release_file_changes(self) -> None:
+        """
+        Drops patch text and file contents held by the memoized file changes,
+        keeping their paths, change types and line counts.
+        """
+        for change in self._file_changes or []:
+            change.release_memory()
 
     def _process_diff_data(self, diff_data: List[Diff]) -> List[FileChange]:
         """
@@ -784,7 +959,42 @@ class CommitInfo:
         Returns:
             List of FileChange objects representing the modifications
         """
-        return [FileChange(diff=diff) for diff in diff_data]
+        blob_reader = self._config.get("blob_reader")
+        analysis_cache = self._config.get("analysis_cache")
+        return [
+            FileChange(diff, blob_reader=blob_reader, analysis_cache=analysis_cache)
+            for diff in diff_data
+        ]
+
+    @property
+    def file_summaries(self) -> List["FileStat"]:
+        """
+        Returns the change type, paths and line counts of every modified file.
+        Unlike file_changes, the summaries are served from the analysis cache
+        when one is configured, so no diff has to be computed for known commits.
+        """
+        from gitanalyzer.domain.commit_record import FileStat
+
+        cache = self._config.get("analysis_cache")
+        key = self._analysis_options_key(restricted=True)
+        if cache is not None:
+            cached = cache.load_file_summaries(self.sha, key)
+            if cached is not None:
+                return cached
+
+        summaries = [
+            FileStat(
+                change.modification_type,
+                change.original_path,
+                change.current_path,
+                change.lines_added,
+                change.lines_removed
+            )
+            for change in self.file_changes
+        ]
+        if cache is not None:
+            cache.store_file_summaries(self.sha, key, summaries)
+        return summaries
 
     @property
     def is_in_main_branch(self) -> bool:
@@ -797,7 +1007,16 @@ class CommitInfo:
     def containing_branches(self) -> Set[str]:
         """
         Returns all branches that contain this commit.
-        """
+        Answered from the repository's branch index when one is configured.
+        """
+        branch_index = self._config.get("branch_index")
+        if branch_index is not None:
+            return branch_index.branches_containing(
+                self.sha,
+                include_remotes=bool(self._config.get("include_remotes")),
+                include_refs=bool(self._config.get("include_refs"))
+            )
+
         git = Git(str(self._config.get("path_to_repo")))
         branch_set = set()
         
@@ -0,0 +1,249 @@
+"""
+Lightweight commit and file records produced by the streaming ``git log`` engine
+and by the process-pool executor.
+
+Unlike CommitInfo and FileChange, these objects do not hold a GitPython
+object and never call back into git: every field is filled in up front,
+which also makes them picklable.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from gitanalyzer.domain.commit import ChangeType, CommitInfo, FileChange
+from gitanalyzer.domain.developer import Developer
+
+
+class FileStat:
+    """
+    Per-file summary of a change taken from ``--raw`` and ``--numstat`` output.
+    Binary files report zero added and removed lines.
+    """
+
+    __slots__ = ("modification_type", "original_path", "current_path",
+                 "lines_added", "lines_removed", "is_binary",
+                 "lines_of_code", "cyclomatic_complexity", "token_count")
+
+    def __init__(self,
+                 modification_type: ChangeType,
+                 original_path: Optional[str],
+                 current_path: Optional[str],
+                 lines_added: int = 0,
+                 lines_removed: int = 0,
+                 is_binary: bool = False,
+                 lines_of_code: Optional[int] = None,
+                 cyclomatic_complexity: Optional[int] = None,
+                 token_count: Optional[int] = None) -> None:
+        """
+        Creates a new FileStat record.
+
+        Args:
+            modification_type: Kind of change applied to the file
+            original_path: Path before the change, None for added files
+            current_path: Path after the change, None for removed files
+            lines_added: Number of lines added
+            lines_removed: Number of lines removed
+            is_binary: Whether git reported the file as binary
+            lines_of_code: Lizard nloc of the new version, if computed
+            cyclomatic_complexity: Lizard CCN of the new version, if computed
+            token_count: Lizard token count of the new version, if computed
+        """
+        self.modification_type = modification_type
+        self.original_path = original_path
+        self.current_path = current_path
+        self.lines_added = lines_added
+        self.lines_removed = lines_removed
+        self.is_binary = is_binary
+        self.lines_of_code = lines_of_code
+        self.cyclomatic_complexity = cyclomatic_complexity
+        self.token_count = token_count
+
+    @classmethod
+    def from_file_change(cls, file_change: FileChange) -> "FileStat":
+        """
+        Materializes a FileChange, running its diff parsing and code metrics once.
+
+        Args:
+            file_change: File change backed by a GitPython diff
+
+        Returns:
+            FileStat: Detached copy of the file change summary
+        """
+        return cls(
+            modification_type=file_change.modification_type,
+            original_path=file_change.original_path,
+            current_path=file_change.current_path,
+            lines_added=file_change.lines_added,
+            lines_removed=file_change.lines_removed,
+            is_binary=file_change.is_binary,
+            lines_of_code=file_change.lines_of_code,
+            cyclomatic_complexity=file_change.cyclomatic_complexity,
+            token_count=file_change.token_count
+        )
+
+    @property
+    def filename(self) -> str:
+        """
+        Extracts the base filename, preferring the current path.
+        """
+        path = self.current_path or self.original_path
+        assert path, "At least one path must exist"
+        return Path(path).name
+
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}({self.modification_type.name}, "
+                f"{self.original_path!r} -> {self.current_path!r}, "
+                f"+{self.lines_added}/-{self.lines_removed})")
+
+
+class CommitRecord:
+    """
+    Fully materialized commit metadata, read from a single ``git log`` pass or
+    detached from a CommitInfo by a worker process. Property names mirror
+    CommitInfo so records can be consumed by the same code for metadata-only
+    analyses.
+    """
+
+    __slots__ = ("sha", "parent_commits", "author", "code_reviewer",
+                 "creation_date", "commit_date", "author_timezone_offset",
+                 "commit_timezone_offset", "message", "file_stats",
+                 "maintainability_size_metric", "maintainability_complexity_metric",
+                 "maintainability_interface_metric")
+
+    def __init__(self,
+                 sha: str,
+                 parent_commits: List[str],
+                 author: Developer,
+                 code_reviewer: Developer,
+                 creation_date: datetime,
+                 commit_date: datetime,
+                 author_timezone_offset: int,
+                 commit_timezone_offset: int,
+                 message: str,
+                 file_stats: Optional[List[FileStat]] = None) -> None:
+        """
+        Creates a new CommitRecord.
+
+        Args:
+            sha: Commit hash
+            parent_commits: Hashes of the parent commits
+            author: Commit author
+            code_reviewer: Committer
+            creation_date: Author date
+            commit_date: Committer date
+            author_timezone_offset: Author offset in seconds west of UTC
+            commit_timezone_offset: Committer offset in seconds west of UTC
+            message: Commit message, stripped
+            file_stats: Per-file stats, None if the stream was run without them
+        """
+        self.sha = sha
+        self.parent_commits = parent_commits
+        self.author = author
+        self.code_reviewer = code_reviewer
+        self.creation_date = creation_date
+        self.commit_date = commit_date
+        self.author_timezone_offset = author_timezone_offset
+        self.commit_timezone_offset = commit_timezone_offset
+        self.message = message
+        self.file_stats = file_stats
+        self.maintainability_size_metric: Optional[float] = None
+        self.maintainability_complexity_metric: Optional[float] = None
+        self.maintainability_interface_metric: Optional[float] = None
+
+    @classmethod
+    def from_commit_info(cls, commit: CommitInfo) -> "CommitRecord":
+        """
+        Materializes a CommitInfo into a detached, picklable record.
+
+        All lazily computed values (file changes, code metrics and the Delta
+        Maintainability Model scores) are evaluated here, so this is the step
+        worth running in a worker process.
+
+        Args:
+            commit: Commit backed by a GitPython object
+
+        Returns:
+            CommitRecord: Record holding the computed values
+        """
+        record = cls(
+            sha=commit.sha,
+            parent_commits=commit.parent_commits,
+            author=commit.author,
+            code_reviewer=commit.code_reviewer,
+            creation_date=commit.creation_date,
+            commit_date=commit.commit_date,
+            author_timezone_offset=commit.author_timezone_offset,
+            commit_timezone_offset=commit.commit_timezone_offset,
+            message=commit.message,
+            file_stats=[FileStat.from_file_change(change) for change in commit.file_changes]
+        )
+        record.maintainability_size_metric = commit.maintainability_size_metric
+        record.maintainability_complexity_metric = commit.maintainability_complexity_metric
+        record.maintainability_interface_metric = commit.maintainability_interface_metric
+        return record
+
+    @property
+    def hash(self) -> str:
+        """
+        Alias of sha, used by the commit filters.
+        """
+        return self.sha
+
+    @property
+    def committer_date(self) -> datetime:
+        """
+        Alias of commit_date, used by the commit filters.
+        """
+        return self.commit_date
+
+    @property
+    def is_merge(self) -> bool:
+        """
+        Indicates if this is a merge commit.
+        """
+        return len(self.parent_commits) > 1
+
+    def _require_stats(self) -> List[FileStat]:
+        if self.file_stats is None:
+            raise ValueError(f"Commit {self.sha} was streamed without file statistics")
+        return self.file_stats
+
+    @property
+    def added_lines(self) -> int:
+        """
+        Returns the total number of lines added in this commit.
+        """
+        return sum(stat.lines_added for stat in self._require_stats())
+
+    @property
+    def removed_lines(self) -> int:
+        """
+        Returns the total number of lines removed in this commit.
+        """
+        return sum(stat.lines_removed for stat in self._require_stats())
+
+    @property
+    def total_changes(self) -> int:
+        """
+        Returns the total number of line changes (additions + deletions).
+        """
+        return self.added_lines + self.removed_lines
+
+    @property
+    def changed_files(self) -> int:
+        """
+        Returns the number of files modified in this commit.
+        """
+        return len(self._require_stats())
+
+    def __hash__(self) -> int:
+        return hash(self.sha)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CommitRecord):
+            return NotImplemented
+        return self.sha == other.sha
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.sha!r})"
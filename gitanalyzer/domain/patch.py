@@ -0,0 +1,238 @@
+"""
+Single-pass parser for the unified diff of one file.
+
+Patches can be parsed from text (parse_patch) or straight from the raw bytes
+GitPython returns (parse_patch_bytes). The bytes parser only records the
+offsets of the changed lines, so counting lines and reading hunk headers
+never decodes the patch; line contents are decoded on first access.
+"""
+
+from array import array
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+NO_NEWLINE_MARKER = r"\ No newline at end of file"
+NO_NEWLINE_MARKER_BYTES = NO_NEWLINE_MARKER.encode()
+# ASCII whitespace removed by str.rstrip() at the end of a patch line
+WHITESPACE_BYTES = b" \t\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+
+class Hunk(NamedTuple):
+    """
+    Boundaries of one ``@@`` section of a patch.
+    """
+    old_start: int
+    old_count: int
+    new_start: int
+    new_count: int
+
+
+class ParsedPatch(NamedTuple):
+    """
+    Everything derived from a patch, computed in one walk over its lines.
+
+    Attributes:
+        lines_added: Number of added lines
+        lines_removed: Number of removed lines
+        change_blocks: Number of runs of consecutive added or removed lines
+        hunks: Boundaries of every ``@@`` section
+        added: (line number in the new file, content) of every added line
+        deleted: (line number in the old file, content) of every removed line
+    """
+    lines_added: int
+    lines_removed: int
+    change_blocks: int
+    hunks: List[Hunk]
+    added: List[Tuple[int, str]]
+    deleted: List[Tuple[int, str]]
+
+    @property
+    def added_line_numbers(self) -> List[int]:
+        return [number for number, _ in self.added]
+
+    @property
+    def deleted_line_numbers(self) -> List[int]:
+        return [number for number, _ in self.deleted]
+
+
+class BytesPatch:
+    """
+    A patch parsed from bytes. Exposes the same fields as ParsedPatch, but the
+    changed lines are kept as offsets into a memoryview of the patch and
+    decoded only when ``added`` or ``deleted`` is first read.
+    """
+
+    __slots__ = ("lines_added", "lines_removed", "change_blocks", "hunks",
+                 "_data", "_added_lines", "_deleted_lines", "_added", "_deleted")
+
+    def __init__(self, data: memoryview) -> None:
+        self._data = data
+        self.lines_added = 0
+        self.lines_removed = 0
+        self.change_blocks = 0
+        self.hunks: List[Hunk] = []
+        # Flattened (line number, start offset, end offset) triples
+        self._added_lines = array('q')
+        self._deleted_lines = array('q')
+        self._added: Optional[List[Tuple[int, str]]] = None
+        self._deleted: Optional[List[Tuple[int, str]]] = None
+
+    @property
+    def added(self) -> List[Tuple[int, str]]:
+        if self._added is None:
+            self._added = self._decode(self._added_lines)
+        return self._added
+
+    @property
+    def deleted(self) -> List[Tuple[int, str]]:
+        if self._deleted is None:
+            self._deleted = self._decode(self._deleted_lines)
+        return self._deleted
+
+    @property
+    def added_line_numbers(self) -> List[int]:
+        return self._added_lines[0::3].tolist()
+
+    @property
+    def deleted_line_numbers(self) -> List[int]:
+        return self._deleted_lines[0::3].tolist()
+
+    def _decode(self, lines: array) -> List[Tuple[int, str]]:
+        data = self._data
+        return [
+            (lines[index], str(data[lines[index + 1]:lines[index + 2]], "utf-8", "ignore").rstrip())
+            for index in range(0, len(lines), 3)
+        ]
+
+
+def _parse_range(text: Union[str, bytes]) -> Tuple[int, int]:
+    """Parses ``start,count`` or ``start`` of a hunk header; the count defaults to 1."""
+    if isinstance(text, bytes):
+        start, _, count = text.lstrip(b"-+").partition(b",")
+    else:
+        start, _, count = text.lstrip("-+").partition(",")
+    return int(start), int(count) if count else 1
+
+
+def parse_hunk_header(line: Union[str, bytes]) -> Hunk:
+    """
+    Extracts the boundaries from a ``@@ -a,b +c,d @@`` line.
+
+    Args:
+        line: Hunk header line, as text or bytes
+
+    Returns:
+        Hunk: Start and length of the section in the old and new file
+    """
+    chunks = line.split(b" " if isinstance(line, bytes) else " ")  # type: ignore
+    old_start, old_count = _parse_range(chunks[1])
+    new_start, new_count = _parse_range(chunks[2])
+    return Hunk(old_start, old_count, new_start, new_count)
+
+
+def parse_patch(diff_text: str) -> ParsedPatch:
+    """
+    Walks a patch once and collects line counts, hunks and changed lines.
+
+    Args:
+        diff_text: Unified diff of one file, as found in FileChange.diff_text
+
+    Returns:
+        ParsedPatch: Counts, hunk boundaries and added/deleted line tables
+    """
+    added: List[Tuple[int, str]] = []
+    deleted: List[Tuple[int, str]] = []
+    hunks: List[Hunk] = []
+    lines_added = lines_removed = change_blocks = 0
+    deletion_counter = addition_counter = 0
+    in_block = False
+
+    for line in diff_text.split("\n"):
+        line = line.rstrip()
+        deletion_counter += 1
+        addition_counter += 1
+        first = line[:1]
+
+        if first == "+" or first == "-":
+            if not in_block:
+                in_block = True
+                change_blocks += 1
+        else:
+            in_block = False
+
+        if line.startswith("@@"):
+            hunk = parse_hunk_header(line)
+            hunks.append(hunk)
+            deletion_counter, addition_counter = hunk.old_start - 1, hunk.new_start - 1
+        elif first == "-":
+            deleted.append((deletion_counter, line[1:]))
+            addition_counter -= 1
+            if not line.startswith("---"):
+                lines_removed += 1
+        elif first == "+":
+            added.append((addition_counter, line[1:]))
+            deletion_counter -= 1
+            if not line.startswith("+++"):
+                lines_added += 1
+        elif line == NO_NEWLINE_MARKER:
+            deletion_counter -= 1
+            addition_counter -= 1
+
+    return ParsedPatch(lines_added, lines_removed, change_blocks, hunks, added, deleted)
+
+
+def parse_patch_bytes(diff: bytes) -> BytesPatch:
+    """
+    Walks a raw patch once without decoding it.
+
+    Produces the same counts, hunks and line tables as parse_patch on the
+    UTF-8 decoded patch, but only the positions of the changed lines are
+    stored until their contents are requested.
+
+    Args:
+        diff: Unified diff of one file, as returned by GitPython
+
+    Returns:
+        BytesPatch: Counts, hunk boundaries and lazily decoded line tables
+    """
+    patch = BytesPatch(memoryview(diff))
+    added, deleted = patch._added_lines, patch._deleted_lines
+    deletion_counter = addition_counter = 0
+    in_block = False
+    offset = 0
+
+    # Splitting in C and dropping each line right away beats a find() loop
+    # in Python; only the offsets of the changed lines outlive the scan
+    for line in diff.split(b"\n"):
+        start = offset
+        offset += len(line) + 1
+        line = line.rstrip(WHITESPACE_BYTES)
+        deletion_counter += 1
+        addition_counter += 1
+        first = line[:1]
+
+        if first == b"+" or first == b"-":
+            if not in_block:
+                in_block = True
+                patch.change_blocks += 1
+        else:
+            in_block = False
+
+        if line.startswith(b"@@"):
+            hunk = parse_hunk_header(line)
+            patch.hunks.append(hunk)
+            deletion_counter, addition_counter = hunk.old_start - 1, hunk.new_start - 1
+        elif first == b"-":
+            deleted.extend((deletion_counter, start + 1, start + len(line)))
+            addition_counter -= 1
+            if not line.startswith(b"---"):
+                patch.lines_removed += 1
+        elif first == b"+":
+            added.extend((addition_counter, start + 1, start + len(line)))
+            deletion_counter -= 1
+            if not line.startswith(b"+++"):
+                patch.lines_added += 1
+        elif line == NO_NEWLINE_MARKER_BYTES:
+            deletion_counter -= 1
+            addition_counter -= 1
+
+    return patch
@@ -5,19 +5,107 @@ This module contains the GitRepo class for Git repository analysis.
 """
 
 import os
+import re
 import logging
+import subprocess
+import threading
+import concurrent.futures
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Generator
+from typing import List, Dict, Iterable, Optional, Set, Generator, Tuple
 
 from git import Repo, GitCommandError
 from git.objects import Commit as GitPythonCommit
 
 from gitanalyzer.domain.commit import Commit, ChangeType, ChangedFile
+from gitanalyzer.domain.commit_record import CommitRecord
+from gitanalyzer.utils.analysis_cache import AnalysisCache
+from gitanalyzer.utils.blob_reader import BlobReader
+from gitanalyzer.utils.branch_index import BranchIndex
 from gitanalyzer.utils.config import Configuration
+from gitanalyzer.utils.diff_stream import DiffRecord, GitDiffStream
+from gitanalyzer.utils.log_stream import GitLogStream
 
 # Configure logging
 log = logging.getLogger(__name__)
 
+# First line of a ``git blame --porcelain`` entry: <sha> <original line> <final line> [<group size>]
+BLAME_HEADER = re.compile(r"^([0-9a-f]{40}|[0-9a-f]{64}) \d+ (\d+)")
+
+
+def _parse_porcelain_blame(output: str) -> Dict[int, str]:
+    """
+    Map each blamed line number of ``git blame --porcelain`` output to its commit hash.
+    """
+    origins: Dict[int, str] = {}
+    current: Optional[Tuple[str, int]] = None
+    for line in output.split('\n'):
+        if line.startswith('\t'):
+            if current is not None:
+                origins[current[1]] = current[0]
+            current = None
+            continue
+        if line == 'unblamable':
+            current = None
+            continue
+        header = BLAME_HEADER.match(line)
+        if header:
+            current = (header.group(1), int(header.group(2)))
+
+    return origins
+
+
+class _BlameRunner:
+    """
+    Runs ``git blame`` processes for the thread pool of a parallel batch and
+    keeps a handle to each running one, so a cancelled batch can kill them
+    instead of waiting for them to finish.
+    """
+
+    def __init__(self, repository_path: str, timeout: Optional[float]):
+        self.repository_path = repository_path
+        self.timeout = timeout
+        self._running: Set[subprocess.Popen] = set()
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def run(self, blame_args: List[str]) -> Optional[Dict[int, str]]:
+        """
+        Blame one file. Returns None if git fails, exceeds the timeout or is
+        killed by stop(); a timed out process is killed as well.
+        """
+        with self._lock:
+            if self._stopped:
+                return None
+            process = subprocess.Popen(
+                ["git", "-C", self.repository_path, "blame", *blame_args],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, errors="replace"
+            )
+            self._running.add(process)
+
+        try:
+            output, _ = process.communicate(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            log.warning(f"git blame timed out after {self.timeout}s: {' '.join(blame_args[-3:])}")
+            return None
+        finally:
+            with self._lock:
+                self._running.discard(process)
+
+        if process.returncode != 0:
+            return None
+        return _parse_porcelain_blame(output)
+
+    def stop(self) -> None:
+        """
+        Kill the running blames and refuse to start new ones.
+        """
+        with self._lock:
+            self._stopped = True
+            for process in self._running:
+                process.kill()
+
 
 class GitRepo:
     """
@@ -71,6 +159,23 @@ class GitRepo:
         if self.git_repo:
             self.repository.git.clear_cache()
 
+        blob_reader = self.config.get("blob_reader")
+        if blob_reader is not None:
+            blob_reader.close()
+
+        analysis_cache = self.config.get("analysis_cache")
+        if analysis_cache is not None:
+            analysis_cache.close()
+
+        # A mailmap factory may hold a git check-mailmap process for this repository
+        close_developer_factory = getattr(self.config.get("developer_factory"), "close", None)
+        if close_developer_factory is not None:
+            close_developer_factory()
+
+        # These belong to this repository; the next one opens its own
+        for key in ("blob_reader", "analysis_cache", "branch_index"):
+            self.config.update(key, None)
+
     def _initialize_repository(self):
         """Set up the Git repository connection and configure basic settings."""
         self.git_repo = Repo(str(self.repo_path))
@@ -80,6 +185,19 @@ class GitRepo:
             "blame", "markUnblamableLines", "true"
         ).release()
 
+        # One cat-file process per repository, shared by all file changes
+        if self.config.get("blob_reader") is None:
+            self.config.update("blob_reader", BlobReader(str(self.repo_path)))
+
+        # Branch containment is computed once per repository, on first use
+        if self.config.get("branch_index") is None:
+            self.config.update("branch_index", BranchIndex(str(self.repo_path)))
+
+        # Persistent results from earlier runs, if a cache location was given
+        cache_path = self.config.get("analysis_cache_path")
+        if cache_path is not None and self.config.get("analysis_cache") is None:
+            self.config.update("analysis_cache", AnalysisCache(cache_path))
+
         # Detect primary branch if not set
         if self.config.get("primary_branch") is None:
             self._detect_primary_branch()
@@ -128,6 +246,97 @@ class GitRepo:
             else:
                 raise Exception(f"Failed to retrieve commits: {error}")
 
+    def stream_commits(self, revision='HEAD', with_file_stats: bool = False,
+                       **kwargs) -> Generator[CommitRecord, None, None]:
+        """
+        Generate lightweight commit records from a single streaming ``git log`` process.
+
+        Unlike get_commits, no GitPython objects are built and no further git
+        calls are made per commit, which makes this the faster choice for
+        metadata-only traversals.
+
+        Args:
+            revision (str): Starting revision/commit (defaults to HEAD)
+            with_file_stats (bool): Include per-file ``--raw --numstat`` information
+            **kwargs: Additional git log options, same as get_commits
+
+        Yields:
+            Generator[CommitRecord]: A sequence of commit records
+        """
+        kwargs.setdefault('reverse', True)
+
+        stream = GitLogStream(
+            str(self.repo_path),
+            with_file_stats=with_file_stats,
+            developer_factory=self.config.get("developer_factory")
+        )
+        yield from stream.iter_commits(revision, **kwargs)
+
+    def get_listed_commits(self, commit_hashes: Iterable[str], **kwargs) -> Generator[Commit, None, None]:
+        """
+        Generate the given commits without traversing the history.
+
+        The hashes are resolved in one batch and read by a single
+        ``git log --no-walk --stdin``, so the cost grows with the number of
+        requested commits instead of the size of the repository. Unknown
+        hashes are skipped. Commits are yielded oldest first, or newest first
+        with reverse=False; other git log filters such as author or since
+        still apply.
+
+        Args:
+            commit_hashes (Iterable[str]): Full hashes of the commits to analyze
+            **kwargs: Additional git log options, same as get_commits
+
+        Yields:
+            Generator[Commit]: A sequence of commit objects
+        """
+        for record in self.stream_listed_commits(commit_hashes, **kwargs):
+            yield self._convert_git_commit(self.repository.commit(record.sha))
+
+    def stream_listed_commits(self, commit_hashes: Iterable[str], with_file_stats: bool = False,
+                              **kwargs) -> Generator[CommitRecord, None, None]:
+        """
+        Generate lightweight records of the given commits without traversing the history.
+        See get_listed_commits and stream_commits.
+
+        Args:
+            commit_hashes (Iterable[str]): Full hashes of the commits to analyze
+            with_file_stats (bool): Include per-file ``--raw --numstat`` information
+            **kwargs: Additional git log options, same as get_commits
+
+        Yields:
+            Generator[CommitRecord]: A sequence of commit records
+        """
+        kwargs.setdefault('reverse', True)
+
+        stream = GitLogStream(
+            str(self.repo_path),
+            with_file_stats=with_file_stats,
+            developer_factory=self.config.get("developer_factory")
+        )
+        yield from stream.iter_listed_commits(self._existing_commits(commit_hashes), keep_order=False, **kwargs)
+
+    def _existing_commits(self, commit_hashes: Iterable[str]) -> List[str]:
+        """
+        Keep the hashes naming a commit, checked in one ``git cat-file --batch-check`` call.
+        """
+        hashes = list(dict.fromkeys(commit_hashes))
+        if not hashes:
+            return []
+
+        result = subprocess.run(
+            ["git", "-C", str(self.repo_path), "cat-file", "--batch-check=%(objectname) %(objecttype)"],
+            input="".join(f"{commit_hash}\n" for commit_hash in hashes),
+            capture_output=True, text=True, errors="replace", check=True
+        )
+        existing = []
+        for commit_hash, line in zip(hashes, result.stdout.splitlines()):
+            if line.endswith(" commit"):
+                existing.append(commit_hash)
+            else:
+                log.debug(f"Skipping unknown commit {commit_hash}")
+        return existing
+
     def _convert_git_commit(self, git_commit: GitPythonCommit) -> Commit:
         """
         Convert a GitPython commit to a GitAnalyzer commit object.
@@ -244,7 +453,9 @@ class GitRepo:
     def analyze_commit_changes(self, 
                              commit: Commit,
                              specific_file: Optional[ChangedFile] = None,
-                             ignore_commits_file: Optional[str] = None) -> Dict[str, Set[str]]:
+                             ignore_commits_file: Optional[str] = None,
+                             blame_workers: int = 1,
+                             blame_timeout: Optional[float] = None) -> Dict[str, Set[str]]:
         """
         Analyze which commits last modified the lines changed in a given commit.
         Implements SZZ algorithm to track line modifications.
@@ -258,108 +469,276 @@ class GitRepo:
             commit (Commit): Target commit to analyze
             specific_file (ChangedFile, optional): Limit analysis to specific file
             ignore_commits_file (str, optional): Path to file listing commits to ignore
+            blame_workers (int): Number of processes blaming files in parallel
+            blame_timeout (float, optional): Seconds after which the blame of a single
+                file is abandoned
 
         Returns:
             Dict[str, Set[str]]: Mapping of files to sets of commit hashes
         """
         modifications = [specific_file] if specific_file else commit.modified_files
-        return self._calculate_last_commits(commit, modifications, ignore_commits_file)
+        return self._calculate_last_commits(
+            commit, modifications, ignore_commits_file, blame_workers, blame_timeout
+        )
     
-    def compare_commits(self, start_commit: str, end_commit: str) -> List[ChangedFile]:
+    def analyze_fix_commits(self,
+                            commits: List[Commit],
+                            ignore_commits_file: Optional[str] = None,
+                            workers: int = 1,
+                            timeout: Optional[float] = None,
+                            cancel_event: Optional[threading.Event] = None) -> Dict[str, Dict[str, Set[str]]]:
         """
-        Compare two commits and get the list of modified files between them.
+        Batched SZZ: find the commits that last modified the lines removed by
+        many bug-fixing commits at once.
+
+        Blame requests are grouped by (parent commit, path), so fixes sharing a
+        parent blame each file once, and each blame only covers the line ranges
+        holding deleted lines (``git blame --porcelain -L``).
 
         Args:
-            start_commit (str): Hash of the starting commit
-            end_commit (str): Hash of the ending commit
+            commits (List[Commit]): Bug-fixing commits to analyze
+            ignore_commits_file (str, optional): Path to file listing commits to ignore
+            workers (int): Number of git blame processes running in parallel
+            timeout (float, optional): Seconds after which a single blame is killed;
+                the lines of that file are then left unattributed
+            cancel_event (threading.Event, optional): When set, queued blames are
+                dropped, running ones are killed and CancelledError is raised
 
         Returns:
-            List[ChangedFile]: List of files modified between the commits
+            Dict[str, Dict[str, Set[str]]]: For each fix commit hash, a mapping of
+            files to the hashes of the commits that introduced the removed lines
         """
-        start = self.repository.commit(start_commit)
-        end = self.repository.commit(end_commit)
-        diff_index = start.diff(
-            other=end,
-            paths=None,
-            create_patch=True
+        return self._blame_deleted_lines(
+            [(commit, commit.modified_files) for commit in commits],
+            ignore_commits_file, workers, timeout, cancel_event
         )
 
-        return [ChangedFile(diff=diff) for diff in diff_index]
+    def _calculate_last_commits(self,
+                                commit: Commit,
+                                modifications: List[ChangedFile],
+                                ignore_commits_file: Optional[str] = None,
+                                workers: int = 1,
+                                timeout: Optional[float] = None) -> Dict[str, Set[str]]:
+        """
+        Single-commit form of analyze_fix_commits, restricted to the given modifications.
+        """
+        history = self._blame_deleted_lines([(commit, modifications)], ignore_commits_file, workers, timeout)
+        return history.get(commit.sha, {})
+
+    def _group_blame_requests(self,
+                              fixes: List[Tuple[Commit, List[ChangedFile]]]
+                              ) -> Dict[Tuple[str, str], List[Tuple[str, str, List[int]]]]:
+        """
+        Collect the significant deleted lines of every fix, keyed by the
+        (parent commit, path) to blame.
+
+        Returns:
+            Mapping of (parent, blamed path) to (fix hash, reported path, line numbers) entries
+        """
+        requests: Dict[Tuple[str, str], List[Tuple[str, str, List[int]]]] = {}
+
+        for commit, changes in fixes:
+            if not commit.parent_commits:
+                log.debug(f"Commit {commit.sha} has no parent to blame")
+                continue
+            parent = commit.parent_commits[0]
+
+            for change in changes:
+                blamed_path = change.current_path
+                if change.modification_type in (ChangeType.MOVED, ChangeType.REMOVED):
+                    blamed_path = change.original_path
+                # Lines of a renamed file are reported under its new name
+                reported_path = change.current_path if change.modification_type == ChangeType.MOVED else blamed_path
+
+                if blamed_path is None or reported_path is None:
+                    raise ValueError("File path could not be determined")
+
+                line_numbers = [
+                    line_number for line_number, content in change.parsed_diff["deleted"]
+                    if self._is_significant_line(content.strip())
+                ]
+                if line_numbers:
+                    requests.setdefault((parent, blamed_path), []).append(
+                        (commit.sha, reported_path, line_numbers)
+                    )
+
+        return requests
+
+    def _blame_deleted_lines(self,
+                             fixes: List[Tuple[Commit, List[ChangedFile]]],
+                             ignore_commits_file: Optional[str] = None,
+                             workers: int = 1,
+                             timeout: Optional[float] = None,
+                             cancel_event: Optional[threading.Event] = None) -> Dict[str, Dict[str, Set[str]]]:
+        """
+        Run one ranged blame per (parent, path) and distribute the origins to the fixes.
+        With workers > 1 the blames run as git processes started from a thread pool.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        history: Dict[str, Dict[str, Set[str]]] = {commit.sha: {} for commit, _ in fixes}
+        ignored = self._read_ignored_commits(ignore_commits_file)
+        requests = self._group_blame_requests(fixes)
+
+        def merge(entries: List[Tuple[str, str, List[int]]], origins: Dict[int, str]) -> None:
+            for fix_hash, reported_path, lines in entries:
+                for line in lines:
+                    origin = origins.get(line)
+                    # Lines attributed to an ignored commit could not be blamed elsewhere
+                    if origin is None or origin in ignored:
+                        continue
+                    history[fix_hash].setdefault(reported_path, set()).add(origin)
+
+        if workers == 1:
+            for (parent, path), entries in requests.items():
+                if cancel_event is not None and cancel_event.is_set():
+                    raise concurrent.futures.CancelledError("Blame batch was cancelled")
+                try:
+                    output = self.repository.git.blame(
+                        *self._blame_arguments(parent, path, entries, ignore_commits_file),
+                        kill_after_timeout=timeout
+                    )
+                except GitCommandError:
+                    log.debug(f"Could not blame {path} in commit {parent}. Possible double rename or timeout.")
+                    continue
+                merge(entries, _parse_porcelain_blame(output))
+            return history
+
+        runner = _BlameRunner(str(self.repo_path), timeout)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        try:
+            pending = {
+                executor.submit(
+                    runner.run, self._blame_arguments(parent, path, entries, ignore_commits_file)
+                ): (parent, path)
+                for (parent, path), entries in requests.items()
+            }
+            while pending:
+                done, _ = concurrent.futures.wait(
+                    pending, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                if cancel_event is not None and cancel_event.is_set():
+                    raise concurrent.futures.CancelledError("Blame batch was cancelled")
+                for future in done:
+                    parent, path = pending.pop(future)
+                    origins = future.result()
+                    if origins is None:
+                        log.debug(f"Could not blame {path} in commit {parent}")
+                        continue
+                    merge(requests[(parent, path)], origins)
+        except BaseException:
+            # Queued blames are dropped and running ones killed, so shutting
+            # down below only waits for their threads to notice
+            runner.stop()
+            raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
-    def _analyze_commit_history(self, commit: Commit,
-                              changes: List[ChangedFile],
-                              ignore_hashes_file: Optional[str] = None) -> Dict[str, Set[str]]:
+        return history
+
+    def _blame_arguments(self, revision: str, file_path: str,
+                         entries: List[Tuple[str, str, List[int]]],
+                         ignore_commits_file: Optional[str] = None) -> List[str]:
         """
-        Analyze the commit history to find the origin of changed lines.
+        Build the ``git blame`` arguments covering only the deleted lines of the given entries.
 
         Args:
-            commit (Commit): The commit to analyze
-            changes (List[ChangedFile]): List of file changes to analyze
-            ignore_hashes_file (Optional[str]): Path to file containing commit hashes to ignore
+            revision (str): Revision holding the blamed version of the file
+            file_path (str): Path to the file
+            entries (List[Tuple[str, str, List[int]]]): Fix entries sharing this revision and path
+            ignore_commits_file (Optional[str]): Path to file containing hashes to ignore
 
         Returns:
-            Dict[str, Set[str]]: Mapping of file paths to sets of related commit hashes
+            List[str]: Arguments following ``git blame``
         """
-        commit_history: Dict[str, Set[str]] = {}
+        line_numbers = sorted({line for _, _, lines in entries for line in lines})
+        blame_args = ['--porcelain', '-w']
+        for start, end in self._line_ranges(line_numbers):
+            blame_args.extend(['-L', f'{start},{end}'])
 
-        for change in changes:
-            file_path = change.new_path
-            if change.change_type in [ChangeType.RENAME, ChangeType.DELETE]:
-                file_path = change.old_path
+        if ignore_commits_file:
+            if self.repository.git.version_info >= (2, 23):
+                blame_args.extend(["--ignore-revs-file", ignore_commits_file])
+            else:
+                log.info("Git version < 2.23 does not support --ignore-revs-file")
 
-            removed_lines = change.diff_parsed['deleted']
-            
-            if file_path is None:
-                raise ValueError("File path could not be determined")
+        return blame_args + [revision, '--', file_path]
 
-            try:
-                blame_info = self._get_file_blame(commit.hash, file_path, ignore_hashes_file)
-                
-                for line_num, content in removed_lines:
-                    if self._is_significant_line(content.strip()):
-                        origin_commit = blame_info[line_num - 1].split(' ')[0].replace('^', '')
+    @staticmethod
+    def _line_ranges(line_numbers: List[int]) -> List[Tuple[int, int]]:
+        """
+        Coalesce sorted line numbers into inclusive (start, end) ranges.
+        """
+        ranges: List[Tuple[int, int]] = []
+        for line in line_numbers:
+            if ranges and line == ranges[-1][1] + 1:
+                ranges[-1] = (ranges[-1][0], line)
+            else:
+                ranges.append((line, line))
+        return ranges
 
-                        # Skip lines marked as unblameable
-                        if origin_commit.startswith("*"):
-                            continue
+    @staticmethod
+    def _read_ignored_commits(ignore_commits_file: Optional[str]) -> Set[str]:
+        """
+        Read the full hashes listed in an ignore-revs file.
+        """
+        if not ignore_commits_file:
+            return set()
+        with open(ignore_commits_file) as handle:
+            return {
+                line.split('#', 1)[0].strip() for line in handle
+                if line.split('#', 1)[0].strip()
+            }
+
+    def compare_commits(self, start_commit: str, end_commit: str) -> List[ChangedFile]:
+        """
+        Compare two commits and get the list of modified files between them.
 
-                        # Update path for renamed files
-                        if change.change_type == ChangeType.RENAME:
-                            file_path = change.new_path
+        Args:
+            start_commit (str): Hash of the starting commit
+            end_commit (str): Hash of the ending commit
 
-                        if file_path is None:
-                            raise ValueError("File path could not be determined")
-                            
-                        commit_history.setdefault(file_path, set()).add(
-                            self.get_commit_by_hash(origin_commit).hash
-                        )
-            except GitCommandError:
-                log.debug(f"File {change.filename} not found in commit {commit.hash}. Possible double rename.")
+        Returns:
+            List[ChangedFile]: List of files modified between the commits
+        """
+        start = self.repository.commit(start_commit)
+        end = self.repository.commit(end_commit)
+        diff_index = start.diff(
+            other=end,
+            paths=None,
+            create_patch=True
+        )
 
-        return commit_history
+        return [ChangedFile(diff=diff) for diff in diff_index]
 
-    def _get_file_blame(self, commit_hash: str, file_path: str, 
-                       ignore_hashes_file: Optional[str] = None) -> List[str]:
+    def stream_diff(self, start_commit: str, end_commit: str,
+                    max_file_bytes: Optional[int] = None,
+                    max_file_lines: Optional[int] = None) -> Generator[DiffRecord, None, None]:
         """
-        Get git blame information for a file at a specific commit.
+        Stream the diff between two commits without holding the whole patch.
+
+        Unlike compare_commits, the patch is parsed while git writes it: each
+        hunk is yielded once read, followed by a DiffFile summary per file.
+        Files whose patch exceeds a cap are marked truncated and their
+        remaining lines are only counted.
 
         Args:
-            commit_hash (str): Hash of the commit
-            file_path (str): Path to the file
-            ignore_hashes_file (Optional[str]): Path to file containing hashes to ignore
+            start_commit (str): Hash of the starting commit
+            end_commit (str): Hash of the ending commit
+            max_file_bytes (int, optional): Patch size cap per file
+            max_file_lines (int, optional): Patch line cap per file
 
-        Returns:
-            List[str]: Lines of git blame output
+        Yields:
+            Generator[DiffRecord]: DiffHunk and DiffFile records, in patch order
         """
-        blame_args = ['-w', f'{commit_hash}^']
-        
-        if ignore_hashes_file:
-            if self.repository.git.version_info >= (2, 23):
-                blame_args.extend(["--ignore-revs-file", ignore_hashes_file])
-            else:
-                log.info("Git version < 2.23 does not support --ignore-revs-file")
-                
-        return self.repository.git.blame(*blame_args, '--', file_path).split('\n')
+        stream = GitDiffStream(str(self.repo_path), max_file_bytes, max_file_lines)
+        options = {}
+        if self.config.get("histogram"):
+            options["histogram"] = True
+        if self.config.get("skip_whitespaces"):
+            options["w"] = True
+        yield from stream.iter_diff(start_commit, end_commit, **options)
 
     @staticmethod
     def _is_significant_line(line: str) -> bool:
@@ -373,9 +752,10 @@ class GitRepo:
             bool: True if the line contains significant code, False otherwise
         """
         comment_markers = [
-            '', '//', '#', '/*', "'''", '"""', '*'
+            '//', '#', '/*', "'''", '"""', '*'
         ]
-        return not any(line.startswith(marker) for marker in comment_markers)
+        # Every string starts with '', so blank lines are checked separately
+        return bool(line) and not any(line.startswith(marker) for marker in comment_markers)
 
     def get_file_commit_history(self, file_path: str, include_deletions: bool = False) -> List[str]:
         """
@@ -0,0 +1,517 @@
+"""
+Accumulators computing the process metrics from a single shared traversal.
+
+Each accumulator receives one CommitChanges per commit, with file paths
+already resolved through the rename history, and turns what it collected
+into the same result shape as the corresponding process metric class.
+
+Accumulators can also be saved and combined: ``get_state`` returns plain
+JSON-compatible data (the constructor options are kept apart and returned
+by ``get_config``), ``rename_paths`` moves the collected data to newer
+file names, and ``merge`` adds the data of another accumulator of the same
+kind that covered a different set of commits. Accumulators whose
+aggregates can be undone also implement ``evict``, which rolling windows
+use to drop commits that fall out of the window.
+"""
+import copy
+from abc import ABC, abstractmethod
+from datetime import datetime
+from collections import Counter
+from math import log
+from statistics import median
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from gitanalyzer.domain.commit import ChangeType
+
+
+class PathChange(NamedTuple):
+    """
+    One modified file of a commit, keyed by its latest known path.
+    """
+    path: str
+    change_type: ChangeType
+    lines_added: int
+    lines_removed: int
+    hunks: Optional[int] = None
+
+
+class CommitChanges(NamedTuple):
+    """
+    The data of one commit that process metrics depend on.
+    """
+    sha: str
+    author_email: str
+    commit_date: datetime
+    files: List[PathChange]
+
+
+def _merge_table(target: Dict[str, Any], source: Dict[str, Any],
+                 combine: Callable[[Any, Any], Any]) -> None:
+    """Adds the per-path values of source into target, combining shared paths."""
+    for path, value in source.items():
+        if path in target:
+            target[path] = combine(target[path], value)
+        else:
+            target[path] = copy.deepcopy(value)
+
+
+def _rename_table(table: Dict[str, Any], renames: Dict[str, str],
+                  combine: Callable[[Any, Any], Any]) -> Dict[str, Any]:
+    """Returns the table keyed by the new names, combining paths that collapse into one."""
+    renamed: Dict[str, Any] = {}
+    for path, value in table.items():
+        _merge_table(renamed, {renames.get(path, path): value}, combine)
+    return renamed
+
+
+def _add(first: int, second: int) -> int:
+    return first + second
+
+
+def _add_lines(first: Dict[str, int], second: Dict[str, int]) -> Dict[str, int]:
+    combined = dict(first)
+    _merge_table(combined, second, _add)
+    return combined
+
+
+def _subtract(table: Dict[Any, int], key: Any, amount: int) -> None:
+    """Lowers a count, dropping the key once nothing is left."""
+    remaining = table[key] - amount
+    if remaining:
+        table[key] = remaining
+    else:
+        del table[key]
+
+
+class MetricAccumulator(ABC):
+    """
+    Base class for process metric accumulators.
+
+    Subclasses set ``name`` (the key of their result in the engine output),
+    ``needs_patch`` when they depend on patch text rather than line counts
+    and ``config_fields`` to the attributes holding their constructor options.
+    """
+
+    name = ""
+    needs_patch = False
+    config_fields: Tuple[str, ...] = ()
+
+    @abstractmethod
+    def update(self, commit: CommitChanges) -> None:
+        """
+        Account for one commit.
+
+        Args:
+            commit: Changes of the commit, with rename-resolved paths
+        """
+
+    @abstractmethod
+    def finalize(self) -> Any:
+        """
+        Build the metric result from the accumulated state.
+
+        Returns:
+            Any: Metric result, shaped like the matching process metric's output
+        """
+
+    def evict(self, commit: CommitChanges) -> None:
+        """
+        Undo an earlier update with the same commit. Optional: only accumulators
+        used in rolling windows implement it.
+
+        Args:
+            commit: Commit previously passed to update
+
+        Raises:
+            NotImplementedError: If the accumulated data cannot be undone
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support evicting commits")
+
+    @abstractmethod
+    def merge(self, other: "MetricAccumulator") -> None:
+        """
+        Add the data another accumulator of the same kind collected from other commits.
+
+        Args:
+            other: Accumulator whose paths already use the names of this one
+        """
+
+    def rename_paths(self, renames: Dict[str, str]) -> None:
+        """
+        Move the data collected under old file names to their new names.
+
+        Args:
+            renames: Mapping from old path to the latest path of the file
+        """
+
+    def get_config(self) -> Dict[str, Any]:
+        """
+        Export the options the accumulator was created with.
+
+        Returns:
+            Dict[str, Any]: Value of every attribute listed in config_fields
+        """
+        return {field: getattr(self, field) for field in self.config_fields}
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Export the accumulated state, without the options.
+
+        Returns:
+            Dict[str, Any]: JSON-compatible copy of the state
+        """
+        return copy.deepcopy({key: value for key, value in vars(self).items()
+                              if key not in self.config_fields})
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Replace the accumulated state with one exported by get_state.
+        The options of this accumulator are kept.
+
+        Args:
+            state: State of an accumulator of the same kind
+        """
+        self.__dict__.update(copy.deepcopy({key: value for key, value in state.items()
+                                            if key not in self.config_fields}))
+
+
+class ChangeVolumeAccumulator(MetricAccumulator):
+    """
+    Code churn per file, as computed by ChangeVolume.
+    """
+
+    name = "change_volume"
+    config_fields = ("skip_new_files", "use_total_changes")
+
+    def __init__(self, skip_new_files: bool = False, use_total_changes: bool = False) -> None:
+        self.skip_new_files = skip_new_files
+        self.use_total_changes = use_total_changes
+        self.total: Dict[str, int] = {}
+        self.peak: Dict[str, int] = {}
+        self.count: Dict[str, int] = {}
+
+    def _volume(self, change: PathChange) -> Optional[int]:
+        """Churn of one file change, or None if the change is not counted."""
+        if self.skip_new_files and change.change_type == ChangeType.ADDITION:
+            return None
+        if self.use_total_changes:
+            return change.lines_added + change.lines_removed
+        return change.lines_added - change.lines_removed
+
+    def update(self, commit: CommitChanges) -> None:
+        for change in commit.files:
+            volume = self._volume(change)
+            if volume is None:
+                continue
+
+            self.total[change.path] = self.total.get(change.path, 0) + volume
+            self.peak[change.path] = max(self.peak.get(change.path, volume), volume)
+            self.count[change.path] = self.count.get(change.path, 0) + 1
+
+    def finalize(self) -> Dict[str, Dict[str, int]]:
+        return {
+            "total": dict(self.total),
+            "peak": dict(self.peak),
+            "average": {path: round(self.total[path] / self.count[path]) for path in self.total}
+        }
+
+    def merge(self, other: MetricAccumulator) -> None:
+        _merge_table(self.total, other.total, _add)
+        _merge_table(self.peak, other.peak, max)
+        _merge_table(self.count, other.count, _add)
+
+    def rename_paths(self, renames: Dict[str, str]) -> None:
+        self.total = _rename_table(self.total, renames, _add)
+        self.peak = _rename_table(self.peak, renames, max)
+        self.count = _rename_table(self.count, renames, _add)
+
+
+class WindowedChangeVolumeAccumulator(ChangeVolumeAccumulator):
+    """
+    ChangeVolumeAccumulator that supports evict, for rolling windows. It keeps
+    the volumes of each file's changes so the peak can be recomputed once the
+    largest change has left the window.
+    """
+
+    def __init__(self, skip_new_files: bool = False, use_total_changes: bool = False) -> None:
+        super().__init__(skip_new_files, use_total_changes)
+        self.volumes: Dict[str, Counter] = {}
+
+    def update(self, commit: CommitChanges) -> None:
+        super().update(commit)
+        for change in commit.files:
+            volume = self._volume(change)
+            if volume is not None:
+                self.volumes.setdefault(change.path, Counter())[volume] += 1
+
+    def evict(self, commit: CommitChanges) -> None:
+        for change in commit.files:
+            volume = self._volume(change)
+            if volume is None:
+                continue
+
+            volumes = self.volumes[change.path]
+            _subtract(volumes, volume, 1)
+            if not volumes:
+                for table in (self.total, self.peak, self.count, self.volumes):
+                    del table[change.path]
+                continue
+
+            self.total[change.path] -= volume
+            self.count[change.path] -= 1
+            if volume == self.peak[change.path] and volume not in volumes:
+                self.peak[change.path] = max(volumes)
+
+
+class CommitCountAccumulator(MetricAccumulator):
+    """
+    Number of commits touching each file, as computed by FileCommitCounter.
+    """
+
+    name = "commit_count"
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+
+    def update(self, commit: CommitChanges) -> None:
+        for change in commit.files:
+            self.counts[change.path] = self.counts.get(change.path, 0) + 1
+
+    def evict(self, commit: CommitChanges) -> None:
+        for change in commit.files:
+            _subtract(self.counts, change.path, 1)
+
+    def finalize(self) -> Dict[str, int]:
+        return dict(self.counts)
+
+    def merge(self, other: MetricAccumulator) -> None:
+        _merge_table(self.counts, other.counts, _add)
+
+    def rename_paths(self, renames: Dict[str, str]) -> None:
+        self.counts = _rename_table(self.counts, renames, _add)
+
+
+class _AuthorLinesAccumulator(MetricAccumulator):
+    """
+    Shared state of the contributor metrics: changed lines per file and author.
+    """
+
+    def __init__(self) -> None:
+        self.contributions: Dict[str, Dict[str, int]] = {}
+        # Commits per file and author, so authors of changes without lines can be evicted
+        self.touches: Dict[str, Dict[str, int]] = {}
+
+    def update(self, commit: CommitChanges) -> None:
+        for change in commit.files:
+            authors = self.contributions.setdefault(change.path, {})
+            authors[commit.author_email] = (
+                authors.get(commit.author_email, 0) + change.lines_added + change.lines_removed
+            )
+            touches = self.touches.setdefault(change.path, {})
+            touches[commit.author_email] = touches.get(commit.author_email, 0) + 1
+
+    def evict(self, commit: CommitChanges) -> None:
+        for change in commit.files:
+            authors = self.contributions[change.path]
+            authors[commit.author_email] -= change.lines_added + change.lines_removed
+            _subtract(self.touches[change.path], commit.author_email, 1)
+            if commit.author_email not in self.touches[change.path]:
+                del authors[commit.author_email]
+            if not authors:
+                del self.contributions[change.path]
+                del self.touches[change.path]
+
+    def merge(self, other: MetricAccumulator) -> None:
+        _merge_table(self.contributions, other.contributions, _add_lines)
+        _merge_table(self.touches, other.touches, _add_lines)
+
+    def rename_paths(self, renames: Dict[str, str]) -> None:
+        self.contributions = _rename_table(self.contributions, renames, _add_lines)
+        self.touches = _rename_table(self.touches, renames, _add_lines)
+
+
+class ContributorsAccumulator(_AuthorLinesAccumulator):
+    """
+    Contributor counts per file, as computed by FileContributorMetrics.
+    """
+
+    name = "contributors"
+
+    def finalize(self) -> Dict[str, Dict[str, int]]:
+        total: Dict[str, int] = {}
+        minor: Dict[str, int] = {}
+        for path, contributions in self.contributions.items():
+            total_lines = sum(contributions.values())
+            # Skip files with no changes
+            if total_lines == 0:
+                continue
+            total[path] = len(contributions)
+            minor[path] = sum(1 for lines in contributions.values() if lines / total_lines < 0.05)
+        return {"total": total, "minor": minor}
+
+
+class AuthorshipAccumulator(_AuthorLinesAccumulator):
+    """
+    Share of the top contributor per file, as computed by FileAuthorshipDistribution.
+    """
+
+    name = "authorship"
+
+    def finalize(self) -> Dict[str, float]:
+        result = {}
+        for path, contributions in self.contributions.items():
+            total_lines = sum(contributions.values())
+            if total_lines > 0:
+                result[path] = round(max(contributions.values()) * 100 / total_lines, 2)
+        return result
+
+
+class HistoryComplexityAccumulator(MetricAccumulator):
+    """
+    History complexity period factor per file, as computed by FileHistoryMetric.
+    """
+
+    name = "history_complexity"
+
+    def __init__(self) -> None:
+        self.changed_lines: Dict[str, int] = {}
+
+    def update(self, commit: CommitChanges) -> None:
+        for change in commit.files:
+            size = change.lines_added + change.lines_removed
+            if size > 0:
+                self.changed_lines[change.path] = self.changed_lines.get(change.path, 0) + size
+
+    def evict(self, commit: CommitChanges) -> None:
+        for change in commit.files:
+            size = change.lines_added + change.lines_removed
+            if size > 0:
+                _subtract(self.changed_lines, change.path, size)
+
+    def merge(self, other: MetricAccumulator) -> None:
+        _merge_table(self.changed_lines, other.changed_lines, _add)
+
+    def rename_paths(self, renames: Dict[str, str]) -> None:
+        self.changed_lines = _rename_table(self.changed_lines, renames, _add)
+
+    def finalize(self) -> Dict[str, float]:
+        total_volume = sum(self.changed_lines.values())
+        file_count = len(self.changed_lines)
+        shares = {path: lines / total_volume for path, lines in self.changed_lines.items()}
+
+        entropy = 0.0
+        if file_count > 1:
+            entropy = -sum(share * log(share + 1e-10, file_count) for share in shares.values())
+
+        return {path: round(share * entropy * 100, 2) for path, share in shares.items()}
+
+
+class ChangeBlocksAccumulator(MetricAccumulator):
+    """
+    Median number of hunks per file, as computed by ChangeBlockCounter.
+    """
+
+    name = "change_blocks"
+    needs_patch = True
+
+    def __init__(self) -> None:
+        self.blocks: Dict[str, List[int]] = {}
+
+    def update(self, commit: CommitChanges) -> None:
+        for change in commit.files:
+            self.blocks.setdefault(change.path, []).append(change.hunks or 0)
+
+    def finalize(self) -> Dict[str, float]:
+        return {path: median(blocks) for path, blocks in self.blocks.items()}
+
+    def merge(self, other: MetricAccumulator) -> None:
+        _merge_table(self.blocks, other.blocks, _add)
+
+    def rename_paths(self, renames: Dict[str, str]) -> None:
+        self.blocks = _rename_table(self.blocks, renames, _add)
+
+
+class LineChangesAccumulator(MetricAccumulator):
+    """
+    Added and removed line statistics per file, as computed by FileLineMetrics.
+    """
+
+    name = "line_changes"
+
+    def __init__(self) -> None:
+        # Per path: [total added, max added, total removed, max removed, commit count]
+        self.stats: Dict[str, List[int]] = {}
+
+    def update(self, commit: CommitChanges) -> None:
+        for change in commit.files:
+            stats = self.stats.setdefault(change.path, [0, 0, 0, 0, 0])
+            stats[0] += change.lines_added
+            stats[1] = max(stats[1], change.lines_added)
+            stats[2] += change.lines_removed
+            stats[3] = max(stats[3], change.lines_removed)
+            stats[4] += 1
+
+    def finalize(self) -> Dict[str, Dict[str, int]]:
+        return {
+            "total_changes": {path: stats[0] + stats[2] for path, stats in self.stats.items()},
+            "total_additions": {path: stats[0] for path, stats in self.stats.items()},
+            "max_additions": {path: stats[1] for path, stats in self.stats.items()},
+            "average_additions": {path: round(stats[0] / stats[4]) for path, stats in self.stats.items()},
+            "total_deletions": {path: stats[2] for path, stats in self.stats.items()},
+            "max_deletions": {path: stats[3] for path, stats in self.stats.items()},
+            "average_deletions": {path: round(stats[2] / stats[4]) for path, stats in self.stats.items()},
+        }
+
+    @staticmethod
+    def _combine(first: List[int], second: List[int]) -> List[int]:
+        return [first[0] + second[0], max(first[1], second[1]),
+                first[2] + second[2], max(first[3], second[3]),
+                first[4] + second[4]]
+
+    def merge(self, other: MetricAccumulator) -> None:
+        _merge_table(self.stats, other.stats, self._combine)
+
+    def rename_paths(self, renames: Dict[str, str]) -> None:
+        self.stats = _rename_table(self.stats, renames, self._combine)
+
+
+class ChangeSetAccumulator(MetricAccumulator):
+    """
+    Files changed per commit, as computed by CommitFileSetAnalyzer.
+    """
+
+    name = "change_set"
+
+    def __init__(self) -> None:
+        self.commits = 0
+        self.files = 0
+        self.maximum = 0
+
+    def update(self, commit: CommitChanges) -> None:
+        self.commits += 1
+        self.files += len(commit.files)
+        self.maximum = max(self.maximum, len(commit.files))
+
+    def finalize(self) -> Dict[str, int]:
+        average = round(self.files / self.commits) if self.commits else 0
+        return {"max": self.maximum, "average": average}
+
+    def merge(self, other: MetricAccumulator) -> None:
+        self.commits += other.commits
+        self.files += other.files
+        self.maximum = max(self.maximum, other.maximum)
+
+
+ACCUMULATORS = {
+    accumulator.name: accumulator
+    for accumulator in (
+        ChangeVolumeAccumulator,
+        CommitCountAccumulator,
+        ContributorsAccumulator,
+        AuthorshipAccumulator,
+        HistoryComplexityAccumulator,
+        ChangeBlocksAccumulator,
+        LineChangesAccumulator,
+        ChangeSetAccumulator,
+    )
+}
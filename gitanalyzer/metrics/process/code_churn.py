@@ -2,11 +2,12 @@
 Calculates and analyzes code churn metrics for repository files.
 Code churn represents the magnitude of changes in terms of line modifications.
 """
-from statistics import mean
+from array import array
 from typing import Dict, Optional, Tuple
 
 from gitanalyzer import ModificationType
 from gitanalyzer.metrics.process.base_metric import BaseProcessMetric
+from gitanalyzer.metrics.process.columnar import ColumnarChangeStore
 
 
 class ChangeVolume(BaseProcessMetric):
@@ -52,7 +53,7 @@ class ChangeVolume(BaseProcessMetric):
         self.skip_new_files = skip_new_files
         self.use_total_changes = use_total_changes
         self.line_changes: Dict[str, Tuple[int, int]] = {}
-        self.file_changes: Dict[str, list] = {}
+        self.file_changes = ColumnarChangeStore()
         self._collect_changes()
 
     def _collect_changes(self) -> None:
@@ -62,6 +63,7 @@ class ChangeVolume(BaseProcessMetric):
         file_renames = {}
 
         for commit in self.repository.traverse_commits():
+            commit_index = self.file_changes.add_commit()
             for changed_file in commit.modified_files:
                 current_path = file_renames.get(
                     changed_file.new_path,
@@ -72,6 +74,15 @@ class ChangeVolume(BaseProcessMetric):
                 if changed_file.change_type == ModificationType.RENAME:
                     file_renames[changed_file.old_path] = current_path
 
+                # Store change history; new files are left out when the volumes are reduced
+                self.file_changes.append(
+                    commit_index,
+                    current_path,
+                    changed_file.added_lines,
+                    changed_file.deleted_lines,
+                    changed_file.change_type
+                )
+
                 # Skip new files if configured
                 if self.skip_new_files and changed_file.change_type == ModificationType.ADD:
                     continue
@@ -81,16 +92,15 @@ class ChangeVolume(BaseProcessMetric):
                 deletions = changed_file.deleted_lines
                 self.line_changes[current_path] = (additions, deletions)
 
-                # Calculate change volume based on configuration
-                if self.use_total_changes:
-                    change_volume = additions + deletions
-                else:
-                    change_volume = additions - deletions
-
-                # Store change history
-                if current_path not in self.file_changes:
-                    self.file_changes[current_path] = []
-                self.file_changes[current_path].append(change_volume)
+    def _change_volumes(self) -> Tuple[array, Optional[array]]:
+        """
+        Change volume of every stored change, based on configuration, and the
+        mask of the changes to count.
+        """
+        mask = None
+        if self.skip_new_files:
+            mask = self.file_changes.rows_without(ModificationType.ADD)
+        return self.file_changes.volumes(self.use_total_changes), mask
 
     def get_line_modifications(self) -> Dict[str, Tuple[int, int]]:
         """
@@ -108,10 +118,7 @@ class ChangeVolume(BaseProcessMetric):
         Returns:
             Dictionary mapping file paths to total change volumes
         """
-        return {
-            path: sum(changes)
-            for path, changes in self.file_changes.items()
-        }
+        return self.file_changes.sum_by_path(*self._change_volumes())
 
     def peak_change(self) -> Dict[str, int]:
         """
@@ -120,10 +127,7 @@ class ChangeVolume(BaseProcessMetric):
         Returns:
             Dictionary mapping file paths to maximum change volumes
         """
-        return {
-            path: max(changes)
-            for path, changes in self.file_changes.items()
-        }
+        return self.file_changes.max_by_path(*self._change_volumes())
 
     def average_change(self) -> Dict[str, int]:
         """
@@ -132,7 +136,4 @@ class ChangeVolume(BaseProcessMetric):
         Returns:
             Dictionary mapping file paths to rounded average change volumes
         """
-        return {
-            path: round(mean(changes))
-            for path, changes in self.file_changes.items()
-        }
+        return self.file_changes.average_by_path(*self._change_volumes())
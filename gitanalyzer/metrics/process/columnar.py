@@ -0,0 +1,202 @@
+"""
+Columnar storage of per-file, per-commit line changes with group-by reductions.
+"""
+import logging
+from array import array
+from typing import Dict, List, Optional, Sequence
+
+from gitanalyzer.domain.commit import ChangeType
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, the reductions fall back to plain loops
+    numpy = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class ColumnarChangeStore:
+    """
+    Stores one row per file change in typed arrays instead of per-file lists
+    of Python ints: path id, commit index, lines added, lines removed and
+    change type. Paths are interned once and referenced by id.
+
+    Reductions group the rows by path. With numpy installed they run
+    vectorized over zero-copy views of the arrays; otherwise they fall back
+    to a single loop over the columns.
+    """
+
+    def __init__(self) -> None:
+        self.paths: List[str] = []
+        self._path_ids: Dict[str, int] = {}
+        self.path_ids = array('l')
+        self.commit_indexes = array('l')
+        self.added = array('q')
+        self.removed = array('q')
+        self.change_types = array('b')
+        self.commit_count = 0
+
+    def __len__(self) -> int:
+        return len(self.path_ids)
+
+    def add_commit(self) -> int:
+        """
+        Start the rows of a new commit.
+
+        Returns:
+            int: Index of the commit, in traversal order
+        """
+        self.commit_count += 1
+        return self.commit_count - 1
+
+    def append(self, commit_index: int, path: str, lines_added: int, lines_removed: int,
+               change_type: ChangeType) -> None:
+        """
+        Add one file change.
+
+        Args:
+            commit_index: Index returned by add_commit
+            path: Path of the file, after rename resolution
+            lines_added: Lines added to the file
+            lines_removed: Lines removed from the file
+            change_type: Kind of change
+        """
+        path_id = self._path_ids.get(path)
+        if path_id is None:
+            path_id = self._path_ids[path] = len(self.paths)
+            self.paths.append(path)
+
+        self.path_ids.append(path_id)
+        self.commit_indexes.append(commit_index)
+        self.added.append(lines_added)
+        self.removed.append(lines_removed)
+        self.change_types.append(change_type.value)
+
+    def volumes(self, use_total_changes: bool = False) -> array:
+        """
+        Compute the churn of every row.
+
+        Args:
+            use_total_changes: Sum additions and deletions instead of subtracting them
+
+        Returns:
+            array: Churn per row
+        """
+        if numpy is not None:
+            added = numpy.frombuffer(self.added, dtype=numpy.int64)
+            removed = numpy.frombuffer(self.removed, dtype=numpy.int64)
+            churn = added + removed if use_total_changes else added - removed
+            return array('q', churn.tobytes())
+
+        if use_total_changes:
+            return array('q', map(int.__add__, self.added, self.removed))
+        return array('q', map(int.__sub__, self.added, self.removed))
+
+    def rows_without(self, change_type: ChangeType) -> array:
+        """
+        Select the rows whose change is not of the given type.
+
+        Args:
+            change_type: Kind of change to leave out
+
+        Returns:
+            array: Row mask, 1 for the selected rows
+        """
+        value = change_type.value
+        return array('b', (kind != value for kind in self.change_types))
+
+    def sum_by_path(self, values: Sequence[int], mask: Optional[array] = None) -> Dict[str, int]:
+        """
+        Sum a column per path.
+
+        Args:
+            values: One value per row, e.g. self.added
+            mask: Optional row mask from rows_without
+
+        Returns:
+            Dict[str, int]: Sum per path having selected rows
+        """
+        if numpy is not None:
+            path_ids, column = self._numpy_columns(values, mask)
+            totals = numpy.zeros(len(self.paths), dtype=numpy.int64)
+            numpy.add.at(totals, path_ids, column)
+            return self._by_path(totals.tolist(), numpy.unique(path_ids).tolist())
+
+        totals: Dict[int, int] = {}
+        for row, path_id in enumerate(self.path_ids):
+            if mask is None or mask[row]:
+                totals[path_id] = totals.get(path_id, 0) + values[row]
+        return {self.paths[path_id]: total for path_id, total in totals.items()}
+
+    def max_by_path(self, values: Sequence[int], mask: Optional[array] = None) -> Dict[str, int]:
+        """
+        Maximum of a column per path.
+
+        Args:
+            values: One value per row
+            mask: Optional row mask from rows_without
+
+        Returns:
+            Dict[str, int]: Maximum per path having selected rows
+        """
+        if numpy is not None:
+            path_ids, column = self._numpy_columns(values, mask)
+            maxima = numpy.full(len(self.paths), numpy.iinfo(numpy.int64).min, dtype=numpy.int64)
+            numpy.maximum.at(maxima, path_ids, column)
+            return self._by_path(maxima.tolist(), numpy.unique(path_ids).tolist())
+
+        maxima: Dict[int, int] = {}
+        for row, path_id in enumerate(self.path_ids):
+            if mask is None or mask[row]:
+                value = values[row]
+                if path_id not in maxima or value > maxima[path_id]:
+                    maxima[path_id] = value
+        return {self.paths[path_id]: maximum for path_id, maximum in maxima.items()}
+
+    def count_by_path(self, mask: Optional[array] = None) -> Dict[str, int]:
+        """
+        Number of rows per path.
+
+        Args:
+            mask: Optional row mask from rows_without
+
+        Returns:
+            Dict[str, int]: Row count per path having selected rows
+        """
+        if numpy is not None:
+            path_ids, _ = self._numpy_columns(self.path_ids, mask)
+            counts = numpy.bincount(path_ids, minlength=len(self.paths))
+            return self._by_path(counts.tolist(), numpy.unique(path_ids).tolist())
+
+        counts: Dict[int, int] = {}
+        for row, path_id in enumerate(self.path_ids):
+            if mask is None or mask[row]:
+                counts[path_id] = counts.get(path_id, 0) + 1
+        return {self.paths[path_id]: count for path_id, count in counts.items()}
+
+    def average_by_path(self, values: Sequence[int], mask: Optional[array] = None) -> Dict[str, int]:
+        """
+        Rounded mean of a column per path.
+
+        Args:
+            values: One value per row
+            mask: Optional row mask from rows_without
+
+        Returns:
+            Dict[str, int]: Rounded mean per path having selected rows
+        """
+        counts = self.count_by_path(mask)
+        return {path: round(total / counts[path]) for path, total in self.sum_by_path(values, mask).items()}
+
+    def _numpy_columns(self, values: Sequence[int], mask: Optional[array]):
+        """Zero-copy numpy views of the path ids and a value column, restricted to the mask."""
+        path_ids = numpy.frombuffer(self.path_ids, dtype=numpy.dtype(f"i{self.path_ids.itemsize}"))
+        column = numpy.frombuffer(values, dtype=numpy.dtype(f"i{values.itemsize}"))  # type: ignore
+        if mask is not None:
+            selected = numpy.frombuffer(mask, dtype=numpy.int8).astype(bool)
+            path_ids, column = path_ids[selected], column[selected]
+        return path_ids, column
+
+    def _by_path(self, per_id: List[int], path_ids: List[int]) -> Dict[str, int]:
+        return {self.paths[path_id]: per_id[path_id] for path_id in path_ids}
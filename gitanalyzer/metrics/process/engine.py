@@ -0,0 +1,421 @@
+"""
+Computes several process metrics from a single traversal of the repository history.
+"""
+import concurrent.futures
+import copy
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from gitanalyzer.domain.commit import ChangeType
+from gitanalyzer.git import GitHandler
+from gitanalyzer.metrics.process.accumulators import (
+    ACCUMULATORS, CommitChanges, MetricAccumulator, PathChange
+)
+from gitanalyzer.repository import GitRepo
+from gitanalyzer.utils.config import Configuration
+from gitanalyzer.utils.log_stream import GitLogStream
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 2
+
+
+# Accumulators of a stretch of history, with the renames seen in it
+Partition = Tuple[List[MetricAccumulator], Dict[str, str]]
+
+
+def _commit_changes(commit: Any, changes: Iterable[Any], renames: Dict[str, str],
+                    needs_patch: bool) -> CommitChanges:
+    """
+    Converts one commit into CommitChanges, resolving paths through the renames
+    seen so far and recording the renames the commit makes.
+
+    Args:
+        commit: Commit or commit record providing sha, author and commit_date
+        changes: FileChange objects or numstat FileStat records of the commit
+        renames: Rename map of the newer commits, from old path to latest path
+        needs_patch: Whether hunks must be counted from the patch text
+    """
+    files = []
+    for change in changes:
+        changed_path = change.current_path or change.original_path
+        path = renames.get(changed_path, changed_path)
+
+        if change.modification_type == ChangeType.MOVED:
+            renames[change.original_path] = path
+
+        files.append(PathChange(
+            path,
+            change.modification_type,
+            change.lines_added,
+            change.lines_removed,
+            change.change_blocks if needs_patch else None
+        ))
+
+    return CommitChanges(commit.sha, commit.author.email.strip(), commit.commit_date, files)
+
+
+def _compute_partition(repository_path: str, accumulators: List[MetricAccumulator],
+                       commit_hashes: List[str], use_numstat: bool,
+                       analysis_cache_path: Optional[str] = None) -> Partition:
+    """
+    Feeds a contiguous stretch of commits, newest first, to fresh accumulators
+    inside a worker process.
+
+    Returns:
+        Partition: The updated accumulators and the renames seen in the stretch
+    """
+    needs_patch = any(accumulator.needs_patch for accumulator in accumulators)
+    git = None
+    if not use_numstat:
+        git = GitHandler(repository_path, Configuration({
+            "repository_path": repository_path,
+            "analysis_cache_path": analysis_cache_path
+        }))
+    renames: Dict[str, str] = {}
+
+    try:
+        for record in GitLogStream(repository_path, with_file_stats=use_numstat).iter_listed_commits(commit_hashes):
+            if use_numstat:
+                changes = record.file_stats
+            elif needs_patch:
+                changes = git.get_commit_by_hash(record.sha).file_changes  # type: ignore
+            else:
+                changes = git.get_commit_by_hash(record.sha).file_summaries  # type: ignore
+            commit = _commit_changes(record, changes, renames, needs_patch)
+            for accumulator in accumulators:
+                accumulator.update(commit)
+    finally:
+        if git is not None:
+            git.cleanup()
+
+    return accumulators, renames
+
+
+def merge_partitions(partitions: List[Partition]) -> Partition:
+    """
+    Combines the results of consecutive stretches of history, given newest first.
+
+    The paths of each older stretch are moved to the names they have at the
+    end of the newest one, so rename chains crossing stretch boundaries are
+    resolved before the data is merged.
+
+    Args:
+        partitions: Accumulators and renames of each stretch, newest first
+
+    Returns:
+        Partition: The merged accumulators and the combined rename map
+    """
+    accumulators, renames = partitions[0]
+    for older, older_renames in partitions[1:]:
+        for accumulator, previous in zip(accumulators, older):
+            previous.rename_paths(renames)
+            accumulator.merge(previous)
+        renames = dict(renames)
+        renames.update({old: renames.get(new, new) for old, new in older_renames.items()})
+    return accumulators, renames
+
+
+def save_checkpoint(checkpoint: Dict[str, Any], path: str) -> None:
+    """
+    Writes a checkpoint produced by ProcessMetricsEngine.checkpoint to a JSON file.
+
+    Args:
+        checkpoint: Engine checkpoint
+        path: Destination file
+    """
+    with open(path, "w", encoding="utf-8") as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file)
+
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """
+    Reads a checkpoint written by save_checkpoint.
+
+    Args:
+        path: Checkpoint file
+
+    Returns:
+        Dict[str, Any]: Engine checkpoint
+
+    Raises:
+        ValueError: If the file was written by an incompatible version
+    """
+    with open(path, encoding="utf-8") as checkpoint_file:
+        checkpoint = json.load(checkpoint_file)
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {checkpoint.get('version')}")
+    return checkpoint
+
+
+class ProcessMetricsEngine:
+    """
+    Traverses a commit range once and feeds every requested metric accumulator.
+
+    Rename tracking and patch parsing are shared: paths are resolved to their
+    latest name once per file change, and hunks are only counted when a
+    requested metric needs them. Computing all metrics costs about as much
+    as computing one.
+
+    When no requested metric needs patch text, the history is read from a
+    single ``git log --raw --numstat -M -z`` stream: no patches are generated
+    and no blobs are read.
+
+    A computation can be resumed: ``checkpoint()`` captures the state of
+    every metric, the rename map and the newest processed commit, and an
+    engine created with that checkpoint only processes the commits added
+    since then. The checkpoint also records the start of the range and the
+    metric options, and is rejected by an engine configured differently.
+
+    ``compute(workers=N)`` splits the range into N contiguous partitions
+    computed in worker processes and merges their accumulators, resolving
+    renames that cross partition boundaries.
+
+    Example:
+        engine = ProcessMetricsEngine(path, ["commit_count", "line_changes"],
+                                      start_date=since, end_date=until)
+        results = engine.compute()
+        results["commit_count"]["src/main.py"]
+
+        # Later, process only the new commits
+        engine = ProcessMetricsEngine(path, ["commit_count", "line_changes"],
+                                      checkpoint=engine.checkpoint())
+        results = engine.compute()
+    """
+
+    def __init__(self, repository_path: str,
+                 metrics: Iterable[Union[str, MetricAccumulator]],
+                 start_date: Optional[datetime] = None,
+                 end_date: Optional[datetime] = None,
+                 initial_commit: Optional[str] = None,
+                 final_commit: Optional[str] = None,
+                 use_numstat: Optional[bool] = None,
+                 checkpoint: Optional[Dict[str, Any]] = None,
+                 analysis_cache_path: Optional[str] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            repository_path (str): Local path to the git repository
+            metrics: Metric names (see ACCUMULATORS) or configured accumulator instances
+            start_date (datetime, optional): Beginning date for analysis
+            end_date (datetime, optional): End date for analysis
+            initial_commit (str, optional): Starting commit hash (alternative to start_date)
+            final_commit (str, optional): Ending commit hash (alternative to end_date)
+            use_numstat (bool, optional): Read line counts from the numstat stream
+                instead of GitPython diffs; by default it is used whenever no
+                requested metric needs patch text
+            checkpoint (dict, optional): Checkpoint of an earlier computation with the
+                same metrics and metric options; the range then starts after its last
+                commit and ends at final_commit, end_date or HEAD. start_date and
+                initial_commit may be omitted, if given they must match the checkpoint
+            analysis_cache_path (str, optional): SQLite file of the analysis cache; with
+                GitPython diffs, the per-file summaries of every commit are stored there
+                and served from it when the range is computed again
+
+        Raises:
+            ValueError: If the range is incomplete, a metric name is unknown,
+                use_numstat is set while a metric needs patch text, or the
+                checkpoint was computed with a different configuration
+        """
+        if checkpoint:
+            if checkpoint.get("version") != CHECKPOINT_VERSION:
+                raise ValueError(f"Unsupported checkpoint version: {checkpoint.get('version')}")
+            range_start = checkpoint["config"]["range_start"]
+            if (start_date or initial_commit) and self._range_start(start_date, initial_commit) != range_start:
+                raise ValueError("Checkpoint was computed for a different range")
+            initial_commit = checkpoint["last_commit"]
+            start_date = None
+        else:
+            if not (start_date or initial_commit):
+                raise ValueError('Must specify either start_date or initial_commit')
+
+            if not (end_date or final_commit):
+                raise ValueError('Must specify either end_date or final_commit')
+            range_start = self._range_start(start_date, initial_commit)
+
+        self.repository_path = repository_path
+        self.start_date = start_date
+        self.end_date = end_date
+        self.initial_commit = initial_commit
+        self.final_commit = final_commit
+        self.analysis_cache_path = analysis_cache_path
+        self.accumulators: List[MetricAccumulator] = [self._make_accumulator(metric) for metric in metrics]
+
+        needs_patch = any(accumulator.needs_patch for accumulator in self.accumulators)
+        if use_numstat and needs_patch:
+            raise ValueError("Metrics based on patch text cannot be computed from numstat")
+        self.use_numstat = not needs_patch if use_numstat is None else use_numstat
+
+        self._config = {
+            "range_start": range_start,
+            "metrics": {accumulator.name: accumulator.get_config() for accumulator in self.accumulators},
+        }
+        self._checkpoint = checkpoint
+        # Compared in JSON form, as the checkpoint went through save_checkpoint
+        if checkpoint and json.loads(json.dumps(self._config["metrics"])) != checkpoint["config"]["metrics"]:
+            raise ValueError("Checkpoint was computed for different metrics or metric options")
+
+        self.renames: Dict[str, str] = {}
+        self.last_commit: Optional[str] = checkpoint["last_commit"] if checkpoint else None
+
+    @staticmethod
+    def _range_start(start_date: Optional[datetime], initial_commit: Optional[str]) -> Dict[str, Optional[str]]:
+        """Describe where the range of a computation starts, as stored in checkpoints."""
+        return {
+            "start_date": start_date.isoformat() if start_date else None,
+            "initial_commit": initial_commit,
+        }
+
+    @staticmethod
+    def _make_accumulator(metric: Union[str, MetricAccumulator]) -> MetricAccumulator:
+        if isinstance(metric, MetricAccumulator):
+            return metric
+        if metric not in ACCUMULATORS:
+            raise ValueError(f"Unknown process metric: {metric}")
+        return ACCUMULATORS[metric]()
+
+    def compute(self, workers: int = 1) -> Dict[str, Any]:
+        """
+        Traverse the range and compute every requested metric.
+
+        Args:
+            workers (int): Number of worker processes; with more than one the
+                range is split into contiguous partitions computed in parallel
+
+        Returns:
+            Dict[str, Any]: Result of each metric, keyed by metric name
+        """
+        if workers > 1:
+            partitions = self._compute_in_partitions(workers)
+        else:
+            partitions = [self._compute_sequentially()]
+
+        if self._checkpoint:
+            partitions.append(self._checkpoint_partition(self._checkpoint))
+            self._checkpoint = None
+
+        self.accumulators, self.renames = merge_partitions(partitions)
+
+        return {accumulator.name: accumulator.finalize() for accumulator in self.accumulators}
+
+    def _compute_sequentially(self) -> Partition:
+        """Feed every commit of the range to the accumulators in this process."""
+        renames: Dict[str, str] = {}
+        newest = None
+        for commit in self._iter_changes(renames, skip=self.last_commit):
+            # Commits arrive newest first
+            newest = newest or commit.sha
+            for accumulator in self.accumulators:
+                accumulator.update(commit)
+
+        self.last_commit = newest or self.last_commit
+        return self.accumulators, renames
+
+    def _compute_in_partitions(self, workers: int) -> List[Partition]:
+        """
+        Resolve the range once, split it into contiguous partitions and compute
+        each partition in a worker process.
+        """
+        commit_hashes = [
+            commit.sha for commit in self._repository(with_changes=False).analyze_commits()
+            if commit.sha != self.last_commit
+        ]
+        chunks = GitRepo._split_in_chunks(commit_hashes, workers)
+        if not chunks:
+            return [(self.accumulators, {})]
+
+        self.last_commit = commit_hashes[0]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [
+                executor.submit(_compute_partition, self.repository_path,
+                                copy.deepcopy(self.accumulators), chunk, self.use_numstat,
+                                self.analysis_cache_path)
+                for chunk in chunks
+            ]
+            return [future.result() for future in futures]
+
+    def _checkpoint_partition(self, checkpoint: Dict[str, Any]) -> Partition:
+        """Rebuild the accumulators of an earlier computation from its checkpoint."""
+        accumulators = []
+        for accumulator in self.accumulators:
+            previous = copy.deepcopy(accumulator)
+            previous.set_state(checkpoint["metrics"][accumulator.name])
+            accumulators.append(previous)
+        return accumulators, checkpoint["renames"]
+
+    def checkpoint(self) -> Dict[str, Any]:
+        """
+        Capture the state of the computation after compute().
+
+        Returns:
+            Dict[str, Any]: JSON-compatible checkpoint to resume from, including
+                the start of the range and the options of every metric
+        """
+        if self.last_commit is None:
+            raise ValueError("No commits have been processed")
+
+        return {
+            "version": CHECKPOINT_VERSION,
+            "config": copy.deepcopy(self._config),
+            "last_commit": self.last_commit,
+            "renames": dict(self.renames),
+            "metrics": {accumulator.name: accumulator.get_state() for accumulator in self.accumulators},
+        }
+
+    def _repository(self, with_changes: bool = True) -> GitRepo:
+        """
+        Build the traversal over the range, newest commit first.
+
+        Args:
+            with_changes: Whether file changes will be read; when they are not,
+                only commit metadata is streamed
+        """
+        traversal: Dict[str, Any] = {"analysis_cache_path": self.analysis_cache_path}
+        if not with_changes:
+            traversal["traversal_engine"] = "log_stream"
+        elif self.use_numstat:
+            traversal.update({"traversal_engine": "log_stream", "stream_file_stats": True})
+
+        if self.initial_commit and self.initial_commit == self.final_commit:
+            return GitRepo(self.repository_path, target_commit=self.initial_commit, **traversal)
+
+        return GitRepo(
+            self.repository_path,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            start_commit=self.initial_commit,
+            end_commit=self.final_commit,
+            commit_order='reverse',
+            **traversal
+        )
+
+    def _iter_changes(self, renames: Dict[str, str], skip: Optional[str] = None) -> Iterator[CommitChanges]:
+        """
+        Convert each commit into CommitChanges, resolving paths through the
+        renames seen so far. Commits arrive newest first, so every older path
+        maps to the name the file has at the end of the range.
+
+        Args:
+            renames: Rename map to fill, from old path to latest path
+            skip: Commit already processed by an earlier computation
+        """
+        needs_patch = any(accumulator.needs_patch for accumulator in self.accumulators)
+
+        for commit in self._repository().analyze_commits():
+            if commit.sha == skip:
+                continue
+
+            # FileStat records of the numstat stream and file summaries expose the
+            # same fields as FileChange; summaries are served from the analysis
+            # cache when one is configured
+            if self.use_numstat:
+                changes = commit.file_stats
+            elif needs_patch:
+                changes = commit.file_changes
+            else:
+                changes = commit.file_summaries
+            yield _commit_changes(commit, changes, renames, needs_patch)
@@ -36,17 +36,8 @@ class ChangeBlockCounter(ProcessMetric):
                 if changed_file.modification_type == ModificationType.RENAME:
                     path_mapping[changed_file.previous_location] = current_path
 
-                changes = changed_file.diff_content
-                block_started = False
-                block_count = 0
-
-                for change_line in changes.splitlines():
-                    if change_line[0] in {'+', '-'}:
-                        if not block_started:
-                            block_started = True
-                            block_count += 1
-                    else:
-                        block_started = False
+                # Served from the patch parsed once per file change
+                block_count = changed_file.change_blocks
 
                 if current_path in file_blocks:
                     file_blocks[current_path].append(block_count)
@@ -2,10 +2,10 @@
 Analyzes and computes statistics related to line changes (additions/deletions)
 in a git repository's history.
 """
-from statistics import mean
-from typing import Optional, Dict, List
+from typing import Optional, Dict
 from gitanalyzer import ChangeType
 from gitanalyzer.metrics.process.base_metric import BaseProcessMetric
+from gitanalyzer.metrics.process.columnar import ColumnarChangeStore
 
 
 class FileLineMetrics(BaseProcessMetric):
@@ -40,15 +40,16 @@ class FileLineMetrics(BaseProcessMetric):
         )
         self._line_stats = self._collect_line_statistics()
 
-    def _collect_line_statistics(self) -> tuple[Dict[str, List[int]], Dict[str, List[int]]]:
+    def _collect_line_statistics(self) -> ColumnarChangeStore:
         """
-        Analyzes repository history to collect line change statistics.
+        Analyzes repository history to collect line change statistics,
+        one row per file change.
         """
-        additions: Dict[str, List[int]] = {}
-        deletions: Dict[str, List[int]] = {}
+        line_stats = ColumnarChangeStore()
         file_path_mapping = {}
 
         for commit in self.repository.get_commits():
+            commit_index = line_stats.add_commit()
             for changed_file in commit.changed_files:
                 current_path = file_path_mapping.get(
                     changed_file.new_path,
@@ -59,80 +60,54 @@ class FileLineMetrics(BaseProcessMetric):
                 if changed_file.change_type == ChangeType.RENAMED:
                     file_path_mapping[changed_file.old_path] = current_path
 
-                # Update line statistics
-                if current_path not in additions:
-                    additions[current_path] = []
-                if current_path not in deletions:
-                    deletions[current_path] = []
-
-                additions[current_path].append(changed_file.lines_added)
-                deletions[current_path].append(changed_file.lines_removed)
+                line_stats.append(
+                    commit_index,
+                    current_path,
+                    changed_file.lines_added,
+                    changed_file.lines_removed,
+                    changed_file.change_type
+                )
 
-        return additions, deletions
+        return line_stats
 
     def get_total_changes(self) -> Dict[str, int]:
         """
         Calculates total line changes (additions + deletions) per file.
         """
-        results = {}
-        additions, deletions = self._line_stats
-
-        for path in set(additions.keys()) | set(deletions.keys()):
-            total = sum(additions.get(path, [0])) + sum(deletions.get(path, [0]))
-            results[path] = total
-
-        return results
+        return self._line_stats.sum_by_path(self._line_stats.volumes(use_total_changes=True))
 
     def get_total_additions(self) -> Dict[str, int]:
         """
         Calculates total lines added per file.
         """
-        return {
-            path: sum(changes)
-            for path, changes in self._line_stats[0].items()
-        }
+        return self._line_stats.sum_by_path(self._line_stats.added)
 
     def get_max_additions(self) -> Dict[str, int]:
         """
         Finds maximum lines added in a single commit per file.
         """
-        return {
-            path: max(changes)
-            for path, changes in self._line_stats[0].items()
-        }
+        return self._line_stats.max_by_path(self._line_stats.added)
 
     def get_average_additions(self) -> Dict[str, int]:
         """
         Calculates average lines added per commit per file.
         """
-        return {
-            path: round(mean(changes))
-            for path, changes in self._line_stats[0].items()
-        }
+        return self._line_stats.average_by_path(self._line_stats.added)
 
     def get_total_deletions(self) -> Dict[str, int]:
         """
         Calculates total lines deleted per file.
         """
-        return {
-            path: sum(changes)
-            for path, changes in self._line_stats[1].items()
-        }
+        return self._line_stats.sum_by_path(self._line_stats.removed)
 
     def get_max_deletions(self) -> Dict[str, int]:
         """
         Finds maximum lines deleted in a single commit per file.
         """
-        return {
-            path: max(changes)
-            for path, changes in self._line_stats[1].items()
-        }
+        return self._line_stats.max_by_path(self._line_stats.removed)
 
     def get_average_deletions(self) -> Dict[str, int]:
         """
         Calculates average lines deleted per commit per file.
         """
-        return {
-            path: round(mean(changes))
-            for path, changes in self._line_stats[1].items()
-        }
+        return self._line_stats.average_by_path(self._line_stats.removed)
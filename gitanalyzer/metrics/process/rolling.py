@@ -0,0 +1,159 @@
+"""
+Computes process metrics over a sliding time window in a single traversal.
+"""
+import heapq
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from gitanalyzer.metrics.process.accumulators import (
+    AuthorshipAccumulator, CommitChanges, CommitCountAccumulator, ContributorsAccumulator,
+    HistoryComplexityAccumulator, MetricAccumulator, WindowedChangeVolumeAccumulator
+)
+from gitanalyzer.metrics.process.engine import ProcessMetricsEngine
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Metrics whose aggregates can be undone when a commit leaves the window
+WINDOW_ACCUMULATORS = {
+    accumulator.name: accumulator
+    for accumulator in (
+        WindowedChangeVolumeAccumulator,
+        CommitCountAccumulator,
+        ContributorsAccumulator,
+        AuthorshipAccumulator,
+        HistoryComplexityAccumulator,
+    )
+}
+
+
+class WindowResult(NamedTuple):
+    """
+    The metrics of the commits dated within one window, start exclusive and end inclusive.
+    """
+    start: datetime
+    end: datetime
+    metrics: Dict[str, Any]
+
+
+def _aware(date: datetime) -> datetime:
+    """Treats naive datetimes as UTC so they compare with commit dates."""
+    if date.tzinfo is None or date.tzinfo.utcoffset(date) is None:
+        return date.replace(tzinfo=timezone.utc)
+    return date
+
+
+class RollingProcessMetrics(ProcessMetricsEngine):
+    """
+    Computes process metrics as time series: one result per step for the
+    commits of the preceding window, e.g. a 90-day window stepped weekly.
+
+    History is traversed once, then the commits are ordered by commit date,
+    newest first: traversal order does not follow dates when clocks were
+    skewed or commits were rebased or cherry-picked. Each commit is added to
+    the accumulators when the window reaches its date and evicted when the
+    window has moved past it, so the cost grows with the history and not
+    with the number of windows.
+
+    Example:
+        rolling = RollingProcessMetrics(path, ["change_volume", "commit_count"],
+                                        window=timedelta(days=90), step=timedelta(days=7),
+                                        start_date=since, end_date=until)
+        for result in rolling.compute():
+            result.end, result.metrics["commit_count"]
+    """
+
+    def __init__(self, repository_path: str,
+                 metrics: Iterable[Union[str, MetricAccumulator]],
+                 window: timedelta,
+                 step: timedelta,
+                 start_date: datetime,
+                 end_date: datetime,
+                 use_numstat: Optional[bool] = None,
+                 analysis_cache_path: Optional[str] = None):
+        """
+        Initialize the rolling computation.
+
+        Args:
+            repository_path (str): Local path to the git repository
+            metrics: Metric names (see WINDOW_ACCUMULATORS) or configured accumulators
+                implementing evict
+            window (timedelta): Length of each window
+            step (timedelta): Distance between the ends of consecutive windows
+            start_date (datetime): No window starts before this date
+            end_date (datetime): End of the last window
+            use_numstat (bool, optional): See ProcessMetricsEngine
+            analysis_cache_path (str, optional): See ProcessMetricsEngine
+
+        Raises:
+            ValueError: If a metric cannot be evicted, the step is not positive,
+                or the range is shorter than one window
+        """
+        if step <= timedelta(0):
+            raise ValueError('The step must be positive')
+        if end_date - start_date < window:
+            raise ValueError('The range is shorter than one window')
+
+        super().__init__(repository_path, metrics, start_date=start_date, end_date=end_date,
+                         use_numstat=use_numstat, analysis_cache_path=analysis_cache_path)
+        self.window = window
+        self.step = step
+
+        for accumulator in self.accumulators:
+            if type(accumulator).evict is MetricAccumulator.evict:
+                raise ValueError(f"Process metric cannot be computed in windows: {accumulator.name}")
+
+    @staticmethod
+    def _make_accumulator(metric: Union[str, MetricAccumulator]) -> MetricAccumulator:
+        if isinstance(metric, MetricAccumulator):
+            return metric
+        if metric not in WINDOW_ACCUMULATORS:
+            raise ValueError(f"Unknown rolling process metric: {metric}")
+        return WINDOW_ACCUMULATORS[metric]()
+
+    def compute(self) -> List[WindowResult]:  # type: ignore[override]
+        """
+        Traverse the range once and compute the metrics of every window.
+
+        Returns:
+            List[WindowResult]: One result per window, oldest first
+        """
+        start = _aware(self.start_date)  # type: ignore[arg-type]
+        end = _aware(self.end_date)  # type: ignore[arg-type]
+        # Paths are resolved in traversal order, windows are assigned by date
+        commits = iter(sorted(self._iter_changes({}), key=lambda commit: commit.commit_date, reverse=True))
+        upcoming = next(commits, None)
+
+        # Commits in the current window, most recent on top
+        in_window: List[Tuple[float, int, CommitChanges]] = []
+        sequence = 0
+        results = []
+
+        window_end = end
+        while window_end - self.window >= start:
+            window_start = window_end - self.window
+
+            while in_window and -in_window[0][0] > window_end.timestamp():
+                commit = heapq.heappop(in_window)[2]
+                for accumulator in self.accumulators:
+                    accumulator.evict(commit)
+
+            while upcoming is not None and upcoming.commit_date > window_start:
+                # Commits dated after this window end belonged to later windows only
+                if upcoming.commit_date <= window_end:
+                    for accumulator in self.accumulators:
+                        accumulator.update(upcoming)
+                    heapq.heappush(in_window, (-upcoming.commit_date.timestamp(), sequence, upcoming))
+                    sequence += 1
+                upcoming = next(commits, None)
+
+            results.append(WindowResult(
+                window_start,
+                window_end,
+                {accumulator.name: accumulator.finalize() for accumulator in self.accumulators}
+            ))
+            window_end -= self.step
+
+        results.reverse()
+        return results
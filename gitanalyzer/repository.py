@@ -7,21 +7,159 @@ import math
 import logging
 import tempfile
 import shutil
-from typing import List, Generator, Optional, Union
+from typing import Any, AsyncGenerator, Callable, Dict, Iterable, List, Generator, Iterator, NamedTuple, Optional, Set, TypeVar, Union
 from datetime import datetime
 from pathlib import Path
 from contextlib import contextmanager
+import asyncio
 import concurrent.futures
+import multiprocessing
+import queue
+import threading
+from collections import deque
 
 from git import Repo
 
 from gitanalyzer.domain.commit import Commit
+from gitanalyzer.domain.commit_record import CommitRecord
 from gitanalyzer.git import GitHandler
+from gitanalyzer.utils.async_git import AsyncGitLogStream
 from gitanalyzer.utils.config import Configuration
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+TRAVERSAL_ENGINES = ("gitpython", "log_stream")
+EXECUTORS = ("thread", "process", "shard")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _bounded_map(executor: concurrent.futures.Executor,
+                 func: Callable[[T], R],
+                 items: Iterable[T],
+                 max_in_flight: int) -> Generator[R, None, None]:
+    """
+    Ordered replacement for ``executor.map`` that keeps at most max_in_flight tasks queued.
+
+    A new item is only pulled from ``items`` once the consumer has taken a
+    result, so a slow consumer holds back both the executor and the commit
+    generator instead of letting futures pile up for the whole history.
+    """
+    pending: deque = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+# Per-process state of the process-pool workers, set up by _init_commit_worker
+_worker_state: Dict[str, Any] = {}
+
+# Marker a repository producer sends once its history has been fully analyzed
+_REPOSITORY_DONE = object()
+
+# Marker a shard worker sends once all of its commits have been processed
+_SHARD_DONE = "__shard_done__"
+
+# Seconds to wait on an empty shard queue before checking that its workers are alive
+_SHARD_POLL_INTERVAL = 1.0
+
+
+def _init_commit_worker(settings: Dict[str, Any]) -> None:
+    """Open a repository handle owned by the current worker process."""
+    config = Configuration(settings)
+    git_handler = GitHandler(settings["repository_path"], config)
+    config.set_value("git_handler", git_handler)
+    _worker_state["config"] = config
+    _worker_state["git_handler"] = git_handler
+
+
+def _run_shard(settings: Dict[str, Any], shard_index: int, commit_hashes: List[str], results: Any) -> None:
+    """
+    Evaluate one contiguous shard of commits in a dedicated worker process.
+
+    Records are put on the queue as they are produced, followed by a
+    _SHARD_DONE marker; an exception is forwarded to the parent instead.
+    """
+    try:
+        _init_commit_worker(settings)
+        for commit_hash in commit_hashes:
+            record = _materialize_commit(commit_hash)
+            if record is not None:
+                results.put((shard_index, record))
+        results.put((shard_index, _SHARD_DONE))
+    except Exception as error:
+        results.put((shard_index, error))
+
+
+def _drain_shard_queue(results: Any, workers: Dict[int, Any]) -> Generator[CommitRecord, None, None]:
+    """
+    Yield records from a shard queue until every shard writing to it has finished.
+
+    While the queue is empty the worker processes are polled, so a worker
+    that died without reporting (e.g. killed by the OOM killer) fails the
+    traversal instead of blocking it forever. A dead worker is only reported
+    at the poll after the one that found it, giving records it flushed just
+    before exiting time to arrive.
+
+    Args:
+        results: Queue the shards put their records on
+        workers: Worker process of every shard writing to the queue, by shard index
+
+    Raises:
+        Exception: If a shard failed or its worker exited without finishing
+    """
+    pending = dict(workers)
+    exited: Set[int] = set()
+    while pending:
+        try:
+            shard_index, item = results.get(timeout=_SHARD_POLL_INTERVAL)
+        except queue.Empty:
+            for shard_index, worker in pending.items():
+                if worker.exitcode is None:
+                    continue
+                if shard_index in exited:
+                    raise Exception(f"Shard {shard_index} worker exited with code {worker.exitcode} "
+                                    f"before finishing")
+                exited.add(shard_index)
+            continue
+
+        if item == _SHARD_DONE:
+            del pending[shard_index]
+        elif isinstance(item, Exception):
+            raise Exception(f"Shard {shard_index} failed: {item}") from item
+        else:
+            yield item
+
+
+def _materialize_commit(commit_hash: str) -> Optional[CommitRecord]:
+    """
+    Load, filter and fully evaluate one commit inside a worker process.
+
+    Returns:
+        A picklable CommitRecord, or None if the commit is filtered out
+    """
+    config = _worker_state["config"]
+    commit = _worker_state["git_handler"].get_commit_by_hash(commit_hash)
+    if config.should_skip_commit(commit):
+        return None
+    return CommitRecord.from_commit_info(commit)
+
+
+class RepositoryCommit(NamedTuple):
+    """A commit tagged with the name of the repository it belongs to."""
+    repository_name: str
+    commit: Union[Commit, CommitRecord]
+
+
 class GitRepo:
     """
     Primary class of GitAnalyzer that manages repository analysis operations.
@@ -52,7 +190,15 @@ class GitRepo:
                  ignore_whitespace: bool = False,
                  custom_clone_path: Optional[str] = None,
                  commit_order: Optional[str] = None,
-                 enable_mailmap: bool = False):
+                 enable_mailmap: bool = False,
+                 traversal_engine: str = "gitpython",
+                 stream_file_stats: bool = False,
+                 executor: str = "thread",
+                 max_in_flight: Optional[int] = None,
+                 preserve_order: bool = True,
+                 repo_concurrency: int = 1,
+                 analysis_cache_path: Optional[str] = None,
+                 release_patches: bool = False):
         """
         Initialize a GitRepo instance for analysis.
 
@@ -64,8 +210,35 @@ class GitRepo:
         - Commit selection (dates, hashes, tags)
         - Analysis behavior (threading, file types, etc.)
         - Git options (whitespace handling, mailmap usage, etc.)
+        - Traversal engine: "gitpython" yields full Commit objects, "log_stream"
+          yields lightweight CommitRecord objects parsed from a single
+          ``git log`` process (with per-file stats if stream_file_stats is set)
+        - Executor: "thread" (default) or "process"; thread_count sets the pool size.
+          The process pool yields fully materialized CommitRecord objects, in order.
+          "shard" splits the resolved range into thread_count contiguous shards,
+          one worker process each; set preserve_order=False to receive records
+          as soon as any shard produces them
+        - repo_concurrency: Number of repositories cloned and analyzed in parallel
+          when repository_path is a list
+        - max_in_flight: Maximum number of commits scheduled ahead of the consumer
+          (defaults to twice thread_count)
+        - analysis_cache_path: SQLite file storing numstat summaries, per-file
+          summaries and per-blob code metrics across runs, keyed by commit or
+          blob SHA and the diff options
+        - release_patches: Drop patch text and file contents of each commit once
+          the consumer asks for the next one (line counts are kept)
         """
-        
+        if traversal_engine not in TRAVERSAL_ENGINES:
+            raise ValueError(f"Unknown traversal engine: {traversal_engine}")
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}")
+        if max_in_flight is None:
+            max_in_flight = 2 * thread_count
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if repo_concurrency < 1:
+            raise ValueError("repo_concurrency must be at least 1")
+
         # Convert lists to sets for better performance
         extension_set = set(file_extensions) if file_extensions else None
         commit_set = set(commit_list) if commit_list else None
@@ -99,9 +272,18 @@ class GitRepo:
             "enable_histogram": enable_histogram,
             "custom_clone_path": custom_clone_path,
             "commit_order": commit_order,
-            "enable_mailmap": enable_mailmap
+            "enable_mailmap": enable_mailmap,
+            "traversal_engine": traversal_engine,
+            "stream_file_stats": stream_file_stats,
+            "executor": executor,
+            "max_in_flight": max_in_flight,
+            "preserve_order": preserve_order,
+            "repo_concurrency": repo_concurrency,
+            "analysis_cache_path": analysis_cache_path,
+            "release_patches": release_patches
         }
         
+        self._settings = config
         self._config = Configuration(config)
         self._cleanup_required = custom_clone_path is None
 
@@ -174,34 +356,334 @@ class GitRepo:
 
         return url[last_slash + 1:end_pos]
 
-    def analyze_commits(self) -> Generator[Commit, None, None]:
+    def analyze_commits(self) -> Generator[Union[Commit, CommitRecord, RepositoryCommit], None, None]:
         """
         Analyze repository commits based on configured filters.
-        Returns a generator yielding Commit objects.
+        Returns a generator yielding Commit objects, or CommitRecord objects
+        when the "log_stream" traversal engine is selected.
+
+        With repo_concurrency > 1 and several repositories, the repositories are
+        cloned and analyzed in parallel and RepositoryCommit tuples are yielded
+        instead, interleaved round-robin across repositories.
         """
+        if self._config.get("repo_concurrency") > 1 and len(self._config.get('repository_paths')) > 1:
+            yield from self._analyze_repositories_in_parallel()
+            return
+
         for repo_path in self._config.get('repository_paths'):
             with self._prepare_repository(repo_path) as git:
                 logger.info(f'Analyzing repository: {git.path}')
 
-                if self._config.get('target_file'):
-                    self._config.set_value(
-                        'file_commits',
-                        git.get_file_commits(
-                            self._config.get('target_file'),
-                            self._config.get('include_removed')
-                        )
-                    )
+                revision, options = self._load_traversal_options(git)
 
-                if self._config.get('tagged_only'):
-                    self._config.set_value('release_commits', git.get_release_commits())
+                if self._config.get("executor") == "process":
+                    yield from self._analyze_in_processes(git, revision, options)
+                    continue
 
-                revision, options = self._config.get_git_options()
+                if self._config.get("executor") == "shard":
+                    yield from self._analyze_in_shards(git, revision, options)
+                    continue
                 
                 with concurrent.futures.ThreadPoolExecutor(max_workers=self._config.get("thread_count")) as executor:
-                    for result in executor.map(self._process_commit, git.get_commits(revision, **options)):
-                        yield from result
+                    results = _bounded_map(
+                        executor,
+                        self._process_commit,
+                        self._iter_commits(git, revision, options),
+                        self._config.get("max_in_flight")
+                    )
+                    release = self._config.get("release_patches") and self._config.get("traversal_engine") == "gitpython"
+                    for result in results:
+                        for commit in result:
+                            yield commit
+                            # The consumer has moved on, the patches are no longer needed
+                            if release:
+                                commit.release_file_changes()
+
+    async def analyze_commits_async(self, concurrency: int = 4) -> AsyncGenerator[CommitRecord, None]:
+        """
+        Asynchronous variant of analyze_commits for use with ``async for``.
+
+        Git runs through ``asyncio.create_subprocess_exec``: one streaming
+        ``git log`` per repository, plus per-commit ``git diff-tree`` calls for
+        file statistics (if stream_file_stats is set) limited to ``concurrency``
+        processes at a time. Cancelling the consuming task kills the running
+        git processes. Yields CommitRecord objects in the configured order.
+
+        Args:
+            concurrency: Maximum number of concurrent per-commit git processes
+        """
+        loop = asyncio.get_running_loop()
+
+        for repo_path in self._config.get('repository_paths'):
+            context = self._prepare_repository(repo_path)
+            # Cloning and opening the repository block, so keep them off the event loop
+            git = await loop.run_in_executor(None, context.__enter__)
+            try:
+                logger.info(f'Analyzing repository: {git.path}')
+                revision, options = await loop.run_in_executor(None, self._load_traversal_options, git)
+                options.setdefault('reverse', True)
+
+                stream = AsyncGitLogStream(
+                    self._config.get("repository_path"),
+                    with_file_stats=self._config.get("stream_file_stats"),
+                    developer_factory=self._config.get("developer_factory"),
+                    concurrency=concurrency
+                )
+                records = stream.iter_commits_async(revision, max_in_flight=self._config.get("max_in_flight"), **options)
+                try:
+                    async for record in records:
+                        if not self._config.should_skip_commit(record):
+                            yield record
+                finally:
+                    await records.aclose()
+            finally:
+                await loop.run_in_executor(None, context.__exit__, None, None, None)
+
+    def _load_traversal_options(self, git: GitHandler):
+        """Resolve the file and tag based filters, then build the git log revision and options."""
+        if self._config.get('target_file'):
+            self._config.set_value(
+                'file_commits',
+                git.get_file_commits(
+                    self._config.get('target_file'),
+                    self._config.get('include_removed')
+                )
+            )
+
+        if self._config.get('tagged_only'):
+            self._config.set_value('release_commits', git.get_release_commits())
+
+        return self._config.get_git_options()
+
+    def _analyze_repositories_in_parallel(self) -> Generator[RepositoryCommit, None, None]:
+        """
+        Analyze up to repo_concurrency repositories at once and merge their streams.
+
+        Every repository gets its own GitRepo instance (and configuration) running
+        in a thread, writing to its own queue bounded by max_in_flight. The
+        consumer takes at most one commit per repository in turn, so a large
+        repository cannot starve the others, and a slow consumer blocks the
+        producers instead of buffering whole histories.
 
-    def _process_commit(self, commit: Commit) -> Generator[Commit, None, None]:
+        Producers wait on a full queue in short timeouts and give up once the
+        consumer stops, which does not wait for them: a producer busy with a
+        commit ends its analysis as soon as that commit is done.
+        """
+        repo_paths = self._config.get('repository_paths')
+        queues = [queue.Queue(maxsize=self._config.get("max_in_flight")) for _ in repo_paths]
+        available = threading.Semaphore(0)
+        stop = threading.Event()
+
+        def publish(index: int, item: Any) -> None:
+            while not stop.is_set():
+                try:
+                    queues[index].put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                available.release()
+                return
+
+        def produce(index: int, repo_path: str) -> None:
+            if stop.is_set():
+                return
+            name = self._repository_name(repo_path)
+            try:
+                commits = self._for_single_repository(repo_path).analyze_commits()
+                try:
+                    for commit in commits:
+                        if stop.is_set():
+                            return
+                        publish(index, RepositoryCommit(name, commit))
+                finally:
+                    # Releases the repository (and its clone) as soon as the consumer stops
+                    commits.close()
+                publish(index, _REPOSITORY_DONE)
+            except Exception as error:
+                publish(index, error)
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._config.get("repo_concurrency"))
+        for index, repo_path in enumerate(repo_paths):
+            executor.submit(produce, index, repo_path)
+
+        active = list(range(len(repo_paths)))
+        position = 0
+        try:
+            while active:
+                available.acquire()
+                # Round-robin: start after the repository served last
+                for offset in range(len(active)):
+                    slot = (position + offset) % len(active)
+                    try:
+                        item = queues[active[slot]].get_nowait()
+                    except queue.Empty:
+                        continue
+                    break
+
+                if item is _REPOSITORY_DONE:
+                    active.pop(slot)
+                    position = slot
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    position = slot + 1
+                    yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _for_single_repository(self, repo_path: str) -> "GitRepo":
+        """Create an independent GitRepo analyzing only repo_path with the same settings."""
+        settings = dict(self._settings)
+        settings.update({"repository_path": repo_path, "git_handler": None, "repo_concurrency": 1})
+
+        analyzer = GitRepo.__new__(GitRepo)
+        analyzer._settings = settings
+        analyzer._config = Configuration(settings)
+        analyzer._cleanup_required = self._cleanup_required
+        return analyzer
+
+    def _repository_name(self, repo_path: str) -> str:
+        """Name used to tag commits of the given repository."""
+        if self._is_remote_repo(repo_path):
+            return self._extract_repo_name(repo_path)
+        return Path(repo_path).expanduser().resolve().name
+
+    def _analyze_in_processes(self, git: GitHandler, revision, options) -> Generator[CommitRecord, None, None]:
+        """
+        Evaluate commits in a process pool and yield them in the configured commit order.
+
+        Only commit hashes are sent to the workers; each worker opens its own
+        repository handle and sends back a picklable CommitRecord.
+        """
+        commit_hashes = self._iter_commit_hashes(git, revision, options)
+
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._config.get("thread_count"),
+                initializer=_init_commit_worker,
+                initargs=(self._worker_settings(git),)) as executor:
+            records = _bounded_map(executor, _materialize_commit, commit_hashes, self._config.get("max_in_flight"))
+            for record in records:
+                if record is not None:
+                    yield record
+
+    def _analyze_in_shards(self, git: GitHandler, revision, options) -> Generator[CommitRecord, None, None]:
+        """
+        Resolve the commit range once, split it into contiguous shards and evaluate
+        each shard in its own worker process with its own repository handle.
+
+        With preserve_order the shard streams are concatenated in shard order;
+        every shard writes to its own queue bounded by max_in_flight, so later
+        shards run at most that far ahead of the consumer. Otherwise records
+        are yielded as soon as any shard produces them, through a single queue
+        bounded by max_in_flight.
+        """
+        commit_hashes = list(self._iter_commit_hashes(git, revision, options))
+        shards = self._split_in_chunks(commit_hashes, self._config.get("thread_count"))
+        if not shards:
+            return
+
+        context = multiprocessing.get_context()
+        settings = self._worker_settings(git)
+        preserve_order = self._config.get("preserve_order")
+
+        max_in_flight = self._config.get("max_in_flight")
+        if preserve_order:
+            queues = [context.Queue(maxsize=max_in_flight) for _ in shards]
+        else:
+            queues = [context.Queue(maxsize=max_in_flight)] * len(shards)
+
+        workers = [
+            context.Process(target=_run_shard, args=(settings, index, shard, queues[index]), daemon=True)
+            for index, shard in enumerate(shards)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            if preserve_order:
+                for index, shard_queue in enumerate(queues):
+                    yield from _drain_shard_queue(shard_queue, {index: workers[index]})
+            else:
+                yield from _drain_shard_queue(queues[0], dict(enumerate(workers)))
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+
+    def _worker_settings(self, git: GitHandler) -> Dict[str, Any]:
+        """Build the picklable settings a worker needs to rebuild its configuration."""
+        settings = dict(self._settings)
+        settings.update({
+            "git_handler": None,
+            "blob_reader": None,
+            "analysis_cache": None,
+            "branch_index": None,
+            "repository_path": self._config.get("repository_path"),
+            "file_commits": self._config.get("file_commits"),
+            "release_commits": self._config.get("release_commits")
+        })
+        return settings
+
+    @staticmethod
+    def _split_in_chunks(commits: List[T], worker_count: int) -> List[List[T]]:
+        """
+        Divide commits into balanced, contiguous chunks for parallel processing.
+        
+        Args:
+            commits: Complete list of commits (or commit hashes) to process
+            worker_count: Number of parallel workers to distribute work across
+            
+        Returns:
+            List of commit chunks for parallel processing
+        """
+        if not commits:
+            return []
+        chunk_size = math.ceil(len(commits) / worker_count)
+        return [
+            commits[i:i + chunk_size] 
+            for i in range(0, len(commits), chunk_size)
+        ]
+
+    def _iter_commits(self, git: GitHandler, revision, options) -> Iterator[Union[Commit, CommitRecord]]:
+        """Select the commit source according to the configured traversal engine."""
+        commit_list = self._listed_commits(revision)
+        if self._config.get("traversal_engine") == "log_stream":
+            if commit_list:
+                return git.stream_listed_commits(
+                    commit_list,
+                    with_file_stats=self._config.get("stream_file_stats"),
+                    **options
+                )
+            return git.stream_commits(
+                revision,
+                with_file_stats=self._config.get("stream_file_stats"),
+                **options
+            )
+        if commit_list:
+            return git.get_listed_commits(commit_list, **options)
+        return git.get_commits(revision, **options)
+
+    def _iter_commit_hashes(self, git: GitHandler, revision, options) -> Iterator[str]:
+        """Resolve the hashes of the selected commits, for the process based executors."""
+        commit_list = self._listed_commits(revision)
+        if commit_list:
+            records = git.stream_listed_commits(commit_list, **options)
+        else:
+            records = git.stream_commits(revision, **options)
+        return (record.sha for record in records)
+
+    def _listed_commits(self, revision) -> Optional[Set[str]]:
+        """
+        The commit_list to look up directly, instead of traversing the whole
+        history and filtering it. Only used when no other revision or range
+        restricts the traversal.
+        """
+        if revision != 'HEAD':
+            return None
+        return self._config.get("commit_list")
+
+    def _process_commit(self, commit: Union[Commit, CommitRecord]) -> Generator[Union[Commit, CommitRecord], None, None]:
         """Process individual commits and apply filters."""
         logger.info(f'Processing commit {commit.hash} from {commit.author.name} on {commit.committer_date}')
 
@@ -307,24 +789,6 @@ class InvalidRepositoryURL(Exception):
                 # Handle Windows cleanup issues
                 shutil.rmtree(self._tmp_dir.name, ignore_errors=True)
                 
-    @staticmethod
-    def _split_in_chunks(commits: List[Commit], worker_count: int) -> List[List[Commit]]:
-        """
-        Divide commits into balanced chunks for parallel processing.
-        
-        Args:
-            commits: Complete list of commits to process
-            worker_count: Number of parallel workers to distribute work across
-            
-        Returns:
-            List of commit chunks for parallel processing
-        """
-        chunk_size = math.ceil(len(commits) / worker_count)
-        return [
-            commits[i:i + chunk_size] 
-            for i in range(0, len(commits), chunk_size)
-        ]
-
     @staticmethod
     def _extract_repo_name(url: str) -> str:
         """
@@ -0,0 +1,199 @@
+"""
+Persistent SQLite cache for per-commit analysis results.
+
+Commits and blobs are immutable, so results computed for a commit SHA (or a
+blob SHA) stay valid across runs as long as the analysis options match.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from gitanalyzer.domain.commit import ChangeType, CodeMethod
+from gitanalyzer.domain.commit_record import FileStat
+from gitanalyzer.utils.metrics_cache import BlobMetrics
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS commit_stats (
+    commit_sha TEXT NOT NULL,
+    options_key TEXT NOT NULL,
+    insertions INTEGER NOT NULL,
+    deletions INTEGER NOT NULL,
+    lines INTEGER NOT NULL,
+    files INTEGER NOT NULL,
+    PRIMARY KEY (commit_sha, options_key)
+);
+CREATE TABLE IF NOT EXISTS file_summaries (
+    commit_sha TEXT NOT NULL,
+    options_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    change_type TEXT NOT NULL,
+    original_path TEXT,
+    current_path TEXT,
+    lines_added INTEGER NOT NULL,
+    lines_removed INTEGER NOT NULL,
+    PRIMARY KEY (commit_sha, options_key, position)
+);
+CREATE TABLE IF NOT EXISTS file_summary_sets (
+    commit_sha TEXT NOT NULL,
+    options_key TEXT NOT NULL,
+    PRIMARY KEY (commit_sha, options_key)
+);
+CREATE TABLE IF NOT EXISTS blob_metrics (
+    blob_sha TEXT NOT NULL,
+    extension TEXT NOT NULL,
+    nloc INTEGER,
+    complexity INTEGER,
+    token_count INTEGER,
+    methods TEXT NOT NULL,
+    PRIMARY KEY (blob_sha, extension)
+);
+"""
+
+
+def options_key(histogram: bool = False, ignore_whitespace: bool = False,
+                pathspecs: Optional[Sequence[str]] = None) -> str:
+    """
+    Builds the cache key part describing the diff options that affect results.
+
+    Args:
+        histogram: Whether the histogram diff algorithm is used
+        ignore_whitespace: Whether whitespace changes are ignored
+        pathspecs: Pathspecs the diff was restricted to, if any
+
+    Returns:
+        str: Stable key such as ``histogram=0;whitespace=1``
+    """
+    key = f"histogram={int(bool(histogram))};whitespace={int(bool(ignore_whitespace))}"
+    if pathspecs:
+        key += ";paths=" + ",".join(sorted(pathspecs))
+    return key
+
+
+class AnalysisCache:
+    """
+    Stores numstat summaries, per-file diff summaries and per-blob code metrics
+    in a SQLite database, keyed by commit (or blob) SHA and analysis options.
+    """
+
+    def __init__(self, database_path: str) -> None:
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            database_path: Location of the SQLite file
+        """
+        self.database_path = database_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+        self._connection.commit()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def load_commit_stats(self, commit_sha: str, options: str) -> Optional[Dict[str, int]]:
+        """
+        Returns cached numstat totals for a commit, or None on a cache miss.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT insertions, deletions, lines, files FROM commit_stats "
+                "WHERE commit_sha = ? AND options_key = ?",
+                (commit_sha, options)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("insertions", "deletions", "lines", "files"), row))
+
+    def store_commit_stats(self, commit_sha: str, options: str, stats: Dict[str, int]) -> None:
+        """
+        Saves the numstat totals of a commit.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO commit_stats VALUES (?, ?, ?, ?, ?, ?)",
+                (commit_sha, options, stats["insertions"], stats["deletions"], stats["lines"], stats["files"])
+            )
+            self._connection.commit()
+
+    def load_file_summaries(self, commit_sha: str, options: str) -> Optional[List[FileStat]]:
+        """
+        Returns the cached per-file summaries of a commit, or None on a cache miss.
+        """
+        with self._lock:
+            known = self._connection.execute(
+                "SELECT 1 FROM file_summary_sets WHERE commit_sha = ? AND options_key = ?",
+                (commit_sha, options)
+            ).fetchone()
+            if known is None:
+                return None
+            rows = self._connection.execute(
+                "SELECT change_type, original_path, current_path, lines_added, lines_removed "
+                "FROM file_summaries WHERE commit_sha = ? AND options_key = ? ORDER BY position",
+                (commit_sha, options)
+            ).fetchall()
+
+        return [
+            FileStat(ChangeType[change_type], original_path, current_path, lines_added, lines_removed)
+            for change_type, original_path, current_path, lines_added, lines_removed in rows
+        ]
+
+    def store_file_summaries(self, commit_sha: str, options: str, summaries: List[FileStat]) -> None:
+        """
+        Saves the per-file summaries of a commit (an empty list is a valid result).
+        """
+        rows = [
+            (commit_sha, options, position, stat.modification_type.name,
+             stat.original_path, stat.current_path, stat.lines_added, stat.lines_removed)
+            for position, stat in enumerate(summaries)
+        ]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO file_summaries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO file_summary_sets VALUES (?, ?)", (commit_sha, options)
+            )
+            self._connection.commit()
+
+    def load_blob_metrics(self, blob_sha: str, extension: str) -> Optional[BlobMetrics]:
+        """
+        Returns the cached Lizard results for a blob, or None on a cache miss.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT nloc, complexity, token_count, methods FROM blob_metrics "
+                "WHERE blob_sha = ? AND extension = ?",
+                (blob_sha, extension)
+            ).fetchone()
+        if row is None:
+            return None
+
+        nloc, complexity, token_count, methods = row
+        return BlobMetrics(
+            nloc, complexity, token_count,
+            [CodeMethod.from_fields(fields) for fields in json.loads(methods)]
+        )
+
+    def store_blob_metrics(self, blob_sha: str, extension: str, metrics: BlobMetrics) -> None:
+        """
+        Saves the Lizard results computed for a blob.
+        """
+        methods = json.dumps([vars(method) for method in metrics.methods])
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO blob_metrics VALUES (?, ?, ?, ?, ?, ?)",
+                (blob_sha, extension, metrics.nloc, metrics.complexity, metrics.token_count, methods)
+            )
+            self._connection.commit()
@@ -0,0 +1,178 @@
+"""
+Asyncio counterparts of the streaming git readers, built on ``asyncio.create_subprocess_exec``.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, List, Optional, Union
+
+from gitanalyzer.domain.commit_record import CommitRecord, FileStat
+from gitanalyzer.utils.log_stream import GitLogStream, RecordSplitter, READ_CHUNK_SIZE, parse_file_stats
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+async def _kill_process(process: asyncio.subprocess.Process) -> None:
+    """Terminate a git process that is still running, e.g. after cancellation."""
+    if process.returncode is None:
+        process.kill()
+        await process.wait()
+
+
+class AsyncGitLogStream(GitLogStream):
+    """
+    Reads ``git log`` output without blocking the event loop and fetches the
+    per-commit file statistics concurrently, bounded by a semaphore.
+    """
+
+    def __init__(self,
+                 repository_path: str,
+                 with_file_stats: bool = False,
+                 developer_factory: Optional[Any] = None,
+                 concurrency: int = 4) -> None:
+        """
+        Initialize the asynchronous log stream.
+
+        Args:
+            repository_path: Path to the git repository
+            with_file_stats: Fetch per-file statistics for every commit
+            developer_factory: Optional factory exposing ``get_developer(name, email)``
+            concurrency: Maximum number of ``git diff-tree`` processes running at once
+        """
+        # The log itself is read without stats; they are fetched per commit in parallel
+        super().__init__(repository_path, with_file_stats=False, developer_factory=developer_factory)
+        self.fetch_file_stats = with_file_stats
+        self.concurrency = concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._paths: Optional[List[str]] = None
+
+    async def iter_commits_async(self, revision: Union[str, List[str], None] = "HEAD",
+                                 max_in_flight: int = 8,
+                                 **options: Any) -> AsyncGenerator[CommitRecord, None]:
+        """
+        Streams commits for the given revision, preserving git log order.
+
+        Args:
+            revision: Revision or list of revision arguments
+            max_in_flight: Maximum number of commits read ahead of the consumer
+            **options: Additional git log options, GitPython keyword style
+
+        Yields:
+            CommitRecord: One record per commit
+        """
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        # File stats are restricted to the same pathspecs as the log
+        self._paths = options.get("paths")
+        log = self._read_log(self.build_command(revision, options))
+        pending: Deque["asyncio.Future[CommitRecord]"] = deque()
+        try:
+            async for record in log:
+                pending.append(asyncio.ensure_future(self._complete_record(record)))
+                if len(pending) >= max_in_flight:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await log.aclose()
+
+    async def _read_log(self, command: List[str]) -> AsyncGenerator[CommitRecord, None]:
+        """
+        Runs ``git log`` and yields parsed records as their bytes arrive.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        assert process.stdout is not None and process.stderr is not None
+        # Drained alongside stdout: git blocks once it has filled the stderr pipe
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        try:
+            splitter = RecordSplitter()
+            while True:
+                chunk = await process.stdout.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                for raw_record in splitter.feed(chunk):
+                    yield self.parse_record(raw_record)
+            for raw_record in splitter.flush():
+                yield self.parse_record(raw_record)
+
+            stderr = (await stderr_task).decode("utf-8", "replace")
+            if await process.wait() != 0:
+                if "does not have any commits" in stderr or "bad revision 'HEAD'" in stderr:
+                    logger.debug(f"No commits found in {self.repository_path}")
+                else:
+                    raise Exception(f"Failed to retrieve commits: {stderr.strip()}")
+        finally:
+            await _kill_process(process)
+            if not stderr_task.done():
+                stderr_task.cancel()
+            await asyncio.gather(stderr_task, return_exceptions=True)
+
+    async def _complete_record(self, record: CommitRecord) -> CommitRecord:
+        """Attach file statistics to a record if they were requested."""
+        if self.fetch_file_stats:
+            record.file_stats = await self.file_stats(record.sha, self._paths)
+        return record
+
+    async def file_stats(self, commit_hash: str, paths: Optional[List[str]] = None) -> List[FileStat]:
+        """
+        Computes the per-file statistics of a commit against its first parent.
+
+        Args:
+            commit_hash: Hash of the commit
+            paths: Optional pathspecs restricting the statistics
+
+        Returns:
+            List[FileStat]: One entry per modified file, empty for merge commits
+        """
+        command = ["git", "-C", self.repository_path, "diff-tree", "--no-commit-id",
+                   "-r", "-z", "--root", "-M", "--no-abbrev", "--raw", "--numstat", commit_hash]
+        if paths:
+            command.extend(["--", *paths])
+        output = await self._run_git(command)
+        return parse_file_stats([token for token in output.split("\0") if token])
+
+    async def read_blob(self, blob_hash: str) -> bytes:
+        """
+        Reads the raw content of a blob through ``git cat-file``.
+
+        Args:
+            blob_hash: Hash of the blob
+
+        Returns:
+            bytes: Blob content
+        """
+        command = ["git", "-C", self.repository_path, "cat-file", "blob", blob_hash]
+        return await self._run_git(command, decode=False)
+
+    async def _run_git(self, command: List[str], decode: bool = True) -> Any:
+        """
+        Runs a short-lived git command under the concurrency semaphore.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await process.communicate()
+            finally:
+                await _kill_process(process)
+
+        if process.returncode != 0:
+            raise Exception(f"Git command failed: {stderr.decode('utf-8', 'replace').strip()}")
+        return stdout.decode("utf-8", "replace") if decode else stdout
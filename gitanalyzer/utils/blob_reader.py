@@ -0,0 +1,117 @@
+"""
+Blob access through a single long-lived ``git cat-file --batch`` process.
+"""
+
+import logging
+import subprocess
+import threading
+from collections import OrderedDict
+from typing import IO, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class BlobReader:
+    """
+    Reads blob contents by SHA from one ``git cat-file --batch`` process per repository.
+
+    Recently read blobs are kept in an LRU cache bounded by total size, so a
+    blob that shows up as the new version in one commit and as the previous
+    version in the next is only fetched from git once. The reader is safe to
+    share between threads.
+    """
+
+    def __init__(self, repository_path: str, max_cache_bytes: int = DEFAULT_CACHE_BYTES) -> None:
+        """
+        Initialize the blob reader. The git process is started on first use.
+
+        Args:
+            repository_path: Path to the git repository
+            max_cache_bytes: Upper bound on the total size of cached blobs
+        """
+        self.repository_path = repository_path
+        self.max_cache_bytes = max_cache_bytes
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cached_bytes = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def read(self, blob_sha: str) -> Optional[bytes]:
+        """
+        Returns the raw content of a blob.
+
+        Args:
+            blob_sha: Full hexadecimal SHA of the blob
+
+        Returns:
+            Optional[bytes]: Blob content, or None if the object does not exist
+        """
+        with self._lock:
+            content = self._cache.get(blob_sha)
+            if content is not None:
+                self._cache.move_to_end(blob_sha)
+                return content
+
+            content = self._request(blob_sha)
+            if content is not None:
+                self._remember(blob_sha, content)
+            return content
+
+    def close(self) -> None:
+        """
+        Stops the git process and drops the cache.
+        """
+        with self._lock:
+            if self._process is not None:
+                for pipe in (self._process.stdin, self._process.stdout):
+                    if pipe is not None:
+                        pipe.close()
+                self._process.wait()
+                self._process = None
+            self._cache.clear()
+            self._cached_bytes = 0
+
+    def _start(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "-C", self.repository_path, "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        return self._process
+
+    def _request(self, blob_sha: str) -> Optional[bytes]:
+        """
+        Asks the batch process for one object and reads exactly its content from the pipe.
+        """
+        process = self._start()
+        stdin: IO[bytes] = process.stdin  # type: ignore
+        stdout: IO[bytes] = process.stdout  # type: ignore
+
+        stdin.write(blob_sha.encode() + b"\n")
+        stdin.flush()
+
+        header = stdout.readline().decode().split()
+        if len(header) != 3:
+            logger.debug(f"Blob {blob_sha} not found in {self.repository_path}")
+            return None
+
+        size = int(header[2])
+        content = stdout.read(size)
+        # Each object is followed by a newline
+        stdout.read(1)
+        return content
+
+    def _remember(self, blob_sha: str, content: bytes) -> None:
+        if len(content) > self.max_cache_bytes:
+            return
+
+        self._cache[blob_sha] = content
+        self._cached_bytes += len(content)
+        while self._cached_bytes > self.max_cache_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_bytes -= len(evicted)
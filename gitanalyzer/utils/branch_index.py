@@ -0,0 +1,123 @@
+"""
+Branch containment index answering "which branches contain this commit" from memory.
+"""
+
+import logging
+import subprocess
+import threading
+from typing import Dict, List, Optional, Set
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+LOCAL_PREFIX = "refs/heads/"
+REMOTE_PREFIX = "refs/remotes/"
+
+
+class BranchIndex:
+    """
+    Maps every commit reachable from a branch to a bitset of the branches
+    containing it, with one bit per local or remote-tracking branch.
+
+    The index is built on first use from a single ``git rev-list --topo-order
+    --parents`` walk: children are listed before their parents, so each
+    commit's bits are final when it is reached and can be pushed to its
+    parents in one pass.
+    """
+
+    def __init__(self, repository_path: str) -> None:
+        """
+        Initialize the index. Nothing is read from git until the first query.
+
+        Args:
+            repository_path: Path to the git repository
+        """
+        self.repository_path = repository_path
+        self._refs: List[str] = []
+        self._containment: Optional[Dict[str, int]] = None
+        self._lock = threading.Lock()
+
+    def branches_containing(self, commit_hash: str,
+                            include_remotes: bool = False,
+                            include_refs: bool = False) -> Set[str]:
+        """
+        Returns the branches containing a commit, named like ``git branch`` does.
+
+        Args:
+            commit_hash: Full hash of the commit
+            include_remotes: Report remote-tracking branches (``git branch -r``)
+            include_refs: Report local and remote-tracking branches (``git branch -a``)
+
+        Returns:
+            Set[str]: Branch names containing the commit
+        """
+        containment = self._load()
+        bits = containment.get(commit_hash, 0)
+        branches = set()
+
+        for position, ref in enumerate(self._refs):
+            if not bits >> position & 1:
+                continue
+            if ref.startswith(LOCAL_PREFIX) and (include_refs or not include_remotes):
+                branches.add(ref[len(LOCAL_PREFIX):])
+            elif ref.startswith(REMOTE_PREFIX) and include_refs:
+                branches.add("remotes/" + ref[len(REMOTE_PREFIX):])
+            elif ref.startswith(REMOTE_PREFIX) and include_remotes:
+                branches.add(ref[len(REMOTE_PREFIX):])
+
+        return branches
+
+    def _load(self) -> Dict[str, int]:
+        with self._lock:
+            if self._containment is None:
+                self._containment = self._build()
+            return self._containment
+
+    def _build(self) -> Dict[str, int]:
+        """
+        Walks the ancestry of all branch tips once and propagates their bits.
+        """
+        refs = subprocess.run(
+            ["git", "-C", self.repository_path, "for-each-ref",
+             "--format=%(objectname) %(refname)", LOCAL_PREFIX, REMOTE_PREFIX],
+            capture_output=True, text=True
+        )
+        if refs.returncode != 0:
+            raise Exception(f"Failed to list branches: {refs.stderr.strip()}")
+
+        containment: Dict[str, int] = {}
+        tips = []
+        for line in refs.stdout.splitlines():
+            tip, ref = line.split(" ", 1)
+            # Symbolic refs such as origin/HEAD are reported by git branch as aliases
+            if ref.endswith("/HEAD") and ref.startswith(REMOTE_PREFIX):
+                continue
+            containment[tip] = containment.get(tip, 0) | 1 << len(self._refs)
+            self._refs.append(ref)
+            tips.append(tip)
+
+        if not tips:
+            return containment
+
+        process = subprocess.Popen(
+            ["git", "-C", self.repository_path, "rev-list", "--topo-order", "--parents", "--stdin"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        try:
+            process.stdin.write("\n".join(set(tips)) + "\n")  # type: ignore
+            process.stdin.close()  # type: ignore
+            for line in process.stdout:  # type: ignore
+                commit, *parents = line.split()
+                bits = containment.get(commit, 0)
+                for parent in parents:
+                    containment[parent] = containment.get(parent, 0) | bits
+        finally:
+            process.stdout.close()  # type: ignore
+            if process.wait() != 0:
+                raise Exception(f"Failed to walk branch history of {self.repository_path}")
+
+        logger.debug(f"Indexed {len(containment)} commits on {len(self._refs)} branches")
+        return containment
@@ -10,7 +10,9 @@ import pytz
 from gitdb.exc import BadName
 
 from gitanalyzer.domain.commit import Commit
+from gitanalyzer.domain.commit_record import CommitRecord
 from gitanalyzer.utils.developer import BasicDeveloperFactory, MappedDeveloperFactory
+from gitanalyzer.utils.pathspecs import file_type_pathspecs
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -302,6 +304,7 @@ class ConfigurationManager:
         # Add other options
         self._add_boolean_options(options)
         self._add_filter_options(options)
+        self._add_pathspec_options(options)
         
         return options
 
@@ -338,7 +341,26 @@ class ConfigurationManager:
             if value is not None:
                 options[option] = value
 
-    def should_filter_commit(self, commit: Commit) -> bool:
+    def _add_pathspec_options(self, options: Dict[str, Any]) -> None:
+        """
+        Restricts git log to commits touching the requested file types.
+
+        Full history is requested so that git does not simplify merges away
+        and every commit changing a matching file is listed. A single commit
+        is looked up as is, since a pathspec would select an older one.
+        
+        Args:
+            options: Options dictionary to modify
+        """
+        if self.get_setting('single'):
+            return
+
+        pathspecs = file_type_pathspecs(self.get_setting('only_modifications_with_file_types'))
+        if pathspecs:
+            options['paths'] = pathspecs
+            options['full_history'] = True
+
+    def should_filter_commit(self, commit: Union[Commit, CommitRecord]) -> bool:
         """
         Determines if a commit should be filtered out.
         
@@ -363,9 +385,13 @@ class ConfigurationManager:
             for filter_set, commit_value in filter_sets.items()
         )
 
-    def _should_filter_by_file_type(self, commit: Commit) -> bool:
+    def _should_filter_by_file_type(self, commit: Union[Commit, CommitRecord]) -> bool:
         """
         Checks if commit should be filtered based on file types.
+
+        git log already selects commits by pathspec and the diff only holds
+        matching files, so this check no longer diffs unrelated files; it
+        remains for commits git lists without a matching change, such as merges.
         
         Args:
             commit: Commit to check
@@ -377,9 +403,9 @@ class ConfigurationManager:
         if not file_types:
             return False
             
-        return not any(
-            mod.filename.endswith(tuple(file_types))
-            for mod in commit.modified_files
+        filenames = self._changed_filenames(commit)
+        return filenames is not None and not any(
+            filename.endswith(tuple(file_types)) for filename in filenames
         )
 
     def _validate_timezone_settings(self) -> None:
@@ -541,7 +567,7 @@ class ConfigurationManager:
             return [*start, 'HEAD']
         return end
 
-    def should_exclude_commit(self, commit: Commit) -> bool:
+    def should_exclude_commit(self, commit: Union[Commit, CommitRecord]) -> bool:
         """
         Determines if a commit should be excluded based on filters.
         
@@ -569,9 +595,12 @@ class ConfigurationManager:
                 
         return False
 
-    def _should_exclude_by_file_type(self, commit: Commit) -> bool:
+    def _should_exclude_by_file_type(self, commit: Union[Commit, CommitRecord]) -> bool:
         """
         Checks if commit should be excluded based on file type filters.
+
+        Commits are preselected by pathspec in git log and their diff is
+        restricted to the same pathspecs, so only matching files are diffed.
         
         Args:
             commit: Commit to check
@@ -583,11 +612,35 @@ class ConfigurationManager:
         if not allowed_types:
             return False
             
-        return not any(
-            mod.filename.endswith(tuple(allowed_types))
-            for mod in commit.modified_files
+        filenames = self._changed_filenames(commit)
+        return filenames is not None and not any(
+            filename.endswith(tuple(allowed_types)) for filename in filenames
         )
 
+    @staticmethod
+    def _changed_filenames(commit: Union[Commit, CommitRecord]) -> Optional[List[str]]:
+        """
+        Lists the names of the files a commit changed, as seen by the file type filters.
+
+        Streamed records carry FileStat entries instead of file changes. A
+        record streamed without them cannot be checked and is kept, since
+        git log already selected it by pathspec; merges have no file
+        changes and are excluded as for full commits.
+
+        Args:
+            commit: Commit or record to inspect
+
+        Returns:
+            Optional[List[str]]: File names, None if they are unknown
+        """
+        if isinstance(commit, CommitRecord):
+            if commit.is_merge:
+                return []
+            if commit.file_stats is None:
+                return None
+            return [stat.filename for stat in commit.file_stats]
+        return [mod.filename for mod in commit.modified_files]
+
     def ensure_timezone_consistency(self) -> None:
         """Ensures all datetime settings have consistent timezone information."""
         for setting in ('since', 'since_as_filter', 'to'):
@@ -0,0 +1,354 @@
+"""
+Streaming ``git diff`` reader that yields hunks as they are read from the pipe.
+"""
+
+import logging
+import subprocess
+from typing import IO, Any, Dict, Generator, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from gitanalyzer.domain.commit import ChangeType
+from gitanalyzer.domain.patch import Hunk, parse_hunk_header
+from gitanalyzer.utils.log_stream import READ_CHUNK_SIZE, StderrReader, build_git_arguments
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Hash of the empty tree, used as the parent of root commits
+EMPTY_TREE = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+
+
+class DiffHunk(NamedTuple):
+    """
+    One ``@@`` section of a file's patch.
+
+    Attributes:
+        path: Path of the file, the original path for removed files
+        header: Boundaries of the section
+        added: (line number in the new file, content) of every added line
+        deleted: (line number in the old file, content) of every removed line
+        truncated: True if the file hit a cap inside this hunk and its
+            remaining lines were not kept
+    """
+    path: str
+    header: Hunk
+    added: List[Tuple[int, str]]
+    deleted: List[Tuple[int, str]]
+    truncated: bool = False
+
+
+class DiffFile:
+    """
+    Summary of one file's patch, yielded after the file's hunks.
+    Line counts cover the whole patch even when it was truncated.
+    """
+
+    __slots__ = ("modification_type", "original_path", "current_path", "lines_added",
+                 "lines_removed", "is_binary", "truncated", "patch_bytes")
+
+    def __init__(self, original_path: Optional[str], current_path: Optional[str]) -> None:
+        """
+        Creates the summary of a file whose patch is being read.
+
+        Args:
+            original_path: Path before the change, None for added files
+            current_path: Path after the change, None for removed files
+        """
+        self.modification_type = ChangeType.UNDEFINED
+        self.original_path = original_path
+        self.current_path = current_path
+        self.lines_added = 0
+        self.lines_removed = 0
+        self.is_binary = False
+        self.truncated = False
+        self.patch_bytes = 0
+
+    @property
+    def path(self) -> str:
+        return self.current_path or self.original_path or ""
+
+    def __repr__(self) -> str:
+        return (f"DiffFile({self.modification_type.name}, {self.path!r}, "
+                f"+{self.lines_added} -{self.lines_removed}, truncated={self.truncated})")
+
+
+DiffRecord = Union[DiffHunk, DiffFile]
+
+
+def _unquote_path(path: bytes) -> str:
+    """
+    Decodes a path from a diff header, undoing git's C-style quoting.
+    """
+    if path.startswith(b'"') and path.endswith(b'"'):
+        path = path[1:-1].decode("unicode_escape").encode("latin-1")
+    return path.decode("utf-8", "replace")
+
+
+def _header_paths(header: bytes) -> Tuple[str, str]:
+    """
+    Extracts both paths from ``diff --git a/<old> b/<new>``. Ambiguous for
+    renames of paths containing spaces; those are fixed by the
+    ``rename from``/``rename to`` lines that follow.
+    """
+    paths = header[len(b"diff --git "):].rstrip(b"\n")
+    if paths.startswith(b'"'):
+        end = paths.index(b'"', 1)
+        old, new = paths[:end + 1], paths[end + 2:]
+    else:
+        # Without a rename both paths are equal, so split in the middle
+        middle = len(paths) // 2
+        if paths[middle:middle + 1] == b" " and paths[2:middle] == paths[middle + 3:]:
+            old, new = paths[:middle], paths[middle + 1:]
+        else:
+            old, _, new = paths.partition(b" b/")
+            new = b"b/" + new
+    return _unquote_path(old)[2:], _unquote_path(new)[2:]
+
+
+def read_lines(stream: IO[bytes], max_length: Optional[int] = None) -> Iterator[Tuple[bytes, int]]:
+    """
+    Reads a byte stream line by line in bounded chunks.
+
+    Args:
+        stream: Binary stream, e.g. the stdout of git
+        max_length: Keep at most about this many bytes of any one line
+
+    Yields:
+        Tuple[bytes, int]: The (possibly shortened) line and its full length
+    """
+    while True:
+        line = stream.readline(READ_CHUNK_SIZE)
+        if not line:
+            return
+        length = len(line)
+        if not line.endswith(b"\n"):
+            parts = [line]
+            while True:
+                piece = stream.readline(READ_CHUNK_SIZE)
+                if not piece:
+                    break
+                if max_length is None or length < max_length:
+                    parts.append(piece)
+                length += len(piece)
+                if piece.endswith(b"\n"):
+                    break
+            line = b"".join(parts)
+        yield line, length
+
+
+def parse_diff_stream(stream: IO[bytes],
+                      max_file_bytes: Optional[int] = None,
+                      max_file_lines: Optional[int] = None) -> Generator[DiffRecord, None, None]:
+    """
+    Parses ``git diff`` output incrementally. Each hunk is yielded as soon as
+    it is complete, followed by a DiffFile once the file's patch has ended,
+    so at most one hunk is held in memory at a time.
+
+    Once a file's patch exceeds max_file_bytes or max_file_lines, its
+    remaining lines are counted but not kept: the hunk in progress is
+    yielded with truncated=True, later hunks of the file are skipped and
+    the DiffFile is marked truncated.
+
+    Args:
+        stream: Binary stream of ``git diff`` output
+        max_file_bytes: Cap on the patch size of a single file
+        max_file_lines: Cap on the number of patch lines of a single file
+
+    Yields:
+        DiffRecord: DiffHunk and DiffFile records, in patch order
+    """
+    current: Optional[DiffFile] = None
+    hunk: Optional[DiffHunk] = None
+    in_header = False
+    patch_lines = 0
+    deletion_counter = addition_counter = 0
+
+    for line, length in read_lines(stream, max_file_bytes):
+        if line.startswith(b"diff --git "):
+            if hunk is not None:
+                yield hunk
+                hunk = None
+            if current is not None:
+                yield current
+            current = DiffFile(*_header_paths(line))
+            in_header = True
+            patch_lines = 0
+
+        if current is None:
+            continue
+
+        current.patch_bytes += length
+        patch_lines += 1
+        over_cap = ((max_file_bytes is not None and current.patch_bytes > max_file_bytes) or
+                    (max_file_lines is not None and patch_lines > max_file_lines))
+        if over_cap and not current.truncated:
+            current.truncated = True
+            if hunk is not None:
+                yield hunk._replace(truncated=True)
+                hunk = None
+
+        if in_header:
+            if line.startswith(b"@@"):
+                in_header = False
+            else:
+                _parse_header_line(current, line)
+                continue
+
+        first = line[:1]
+        if first == b"@":
+            if hunk is not None:
+                yield hunk
+                hunk = None
+            header = parse_hunk_header(line.rstrip(b"\n"))
+            deletion_counter, addition_counter = header.old_start, header.new_start
+            if not current.truncated:
+                hunk = DiffHunk(current.path, header, [], [])
+        elif first == b"+":
+            current.lines_added += 1
+            if hunk is not None:
+                hunk.added.append((addition_counter, line[1:].decode("utf-8", "ignore").rstrip()))
+            addition_counter += 1
+        elif first == b"-":
+            current.lines_removed += 1
+            if hunk is not None:
+                hunk.deleted.append((deletion_counter, line[1:].decode("utf-8", "ignore").rstrip()))
+            deletion_counter += 1
+        elif first == b" ":
+            addition_counter += 1
+            deletion_counter += 1
+
+    if hunk is not None:
+        yield hunk
+    if current is not None:
+        yield current
+
+
+def _parse_header_line(file: DiffFile, line: bytes) -> None:
+    """
+    Applies one extended header line (``new file mode``, ``rename from``, ...) to the file summary.
+    """
+    line = line.rstrip(b"\n")
+    if line.startswith(b"new file mode"):
+        file.modification_type = ChangeType.ADDITION
+        file.original_path = None
+    elif line.startswith(b"deleted file mode"):
+        file.modification_type = ChangeType.REMOVED
+        file.current_path = None
+    elif line.startswith(b"rename from "):
+        file.modification_type = ChangeType.MOVED
+        file.original_path = _unquote_path(line[len(b"rename from "):])
+    elif line.startswith(b"rename to "):
+        file.current_path = _unquote_path(line[len(b"rename to "):])
+    elif line.startswith(b"copy from "):
+        file.modification_type = ChangeType.DUPLICATE
+        file.original_path = _unquote_path(line[len(b"copy from "):])
+    elif line.startswith(b"copy to "):
+        file.current_path = _unquote_path(line[len(b"copy to "):])
+    elif line.startswith(b"index ") and file.modification_type is ChangeType.UNDEFINED:
+        file.modification_type = ChangeType.CHANGED
+    elif line.startswith(b"Binary files ") or line == b"GIT binary patch":
+        file.is_binary = True
+
+
+class GitDiffStream:
+    """
+    Runs ``git diff`` as a subprocess and parses its output while it is being
+    written, so patches of any size can be processed in bounded memory.
+    """
+
+    def __init__(self,
+                 repository_path: str,
+                 max_file_bytes: Optional[int] = None,
+                 max_file_lines: Optional[int] = None) -> None:
+        """
+        Initialize the diff stream.
+
+        Args:
+            repository_path: Path to the git repository
+            max_file_bytes: Truncate the patch of a file after this many bytes
+            max_file_lines: Truncate the patch of a file after this many lines
+        """
+        self.repository_path = repository_path
+        self.max_file_bytes = max_file_bytes
+        self.max_file_lines = max_file_lines
+
+    def build_command(self, from_revision: str, to_revision: Optional[str],
+                      paths: Optional[List[str]], options: Dict[str, Any]) -> List[str]:
+        """
+        Builds the full ``git diff`` command line.
+        """
+        command = ["git", "-C", self.repository_path, "-c", "core.quotepath=off", "diff",
+                   "--no-color", "--no-ext-diff", "--no-textconv", "-M"]
+        command.extend(build_git_arguments(options))
+        command.append(from_revision)
+        if to_revision is not None:
+            command.append(to_revision)
+        command.append("--")
+        if paths:
+            command.extend(paths)
+        return command
+
+    def iter_diff(self, from_revision: str, to_revision: Optional[str] = None,
+                  paths: Optional[List[str]] = None, **options: Any) -> Generator[DiffRecord, None, None]:
+        """
+        Streams the diff between two revisions.
+
+        Args:
+            from_revision: Old side of the diff
+            to_revision: New side of the diff, the working tree if omitted
+            paths: Optional pathspecs restricting the diff
+            **options: Additional git diff options, GitPython keyword style
+                (e.g. histogram=True, w=True)
+
+        Yields:
+            DiffRecord: See parse_diff_stream
+        """
+        yield from self._run(self.build_command(from_revision, to_revision, paths, options))
+
+    def iter_commit(self, commit_hash: str, parent: Optional[str] = None,
+                    **options: Any) -> Generator[DiffRecord, None, None]:
+        """
+        Streams the changes a commit introduced, against its first parent
+        or the empty tree for root commits.
+
+        Args:
+            commit_hash: Commit to diff
+            parent: Commit to diff against, the first parent if omitted
+            **options: Additional git diff options, GitPython keyword style
+
+        Yields:
+            DiffRecord: See parse_diff_stream
+        """
+        if parent is None:
+            parents = subprocess.run(
+                ["git", "-C", self.repository_path, "rev-list", "--parents", "-n", "1", commit_hash],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False
+            ).stdout.split()
+            parent = parents[1].decode() if len(parents) > 1 else EMPTY_TREE
+        yield from self.iter_diff(parent, commit_hash, **options)
+
+    def _run(self, command: List[str]) -> Generator[DiffRecord, None, None]:
+        """
+        Starts the git process and parses its output until EOF or until the consumer stops.
+        """
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        assert process.stderr is not None
+        stderr_reader = StderrReader(process.stderr)
+        try:
+            assert process.stdout is not None
+            yield from parse_diff_stream(process.stdout, self.max_file_bytes, self.max_file_lines)
+
+            stderr = stderr_reader.text()
+            if process.wait() != 0:
+                raise Exception(f"Failed to compute diff: {stderr.strip()}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            # stderr is closed by its reader
+            if process.stdout is not None:
+                process.stdout.close()
@@ -0,0 +1,368 @@
+"""
+Streaming ``git log`` reader that parses commits incrementally from a single subprocess.
+"""
+
+import logging
+import subprocess
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any, Dict, Generator, Iterator, List, Optional, Tuple, Union
+
+from gitanalyzer.domain.commit import ChangeType
+from gitanalyzer.domain.commit_record import CommitRecord, FileStat
+from gitanalyzer.domain.developer import Developer
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Every commit starts with a record separator; header fields are split by unit separators
+RECORD_SEPARATOR = "\x1e"
+FIELD_SEPARATOR = "\x1f"
+
+LOG_FORMAT = FIELD_SEPARATOR.join([
+    "%H", "%P", "%an", "%ae", "%ad", "%cn", "%ce", "%cd", "%B"
+])
+
+STATUS_TO_CHANGE_TYPE = {
+    "A": ChangeType.ADDITION,
+    "C": ChangeType.DUPLICATE,
+    "R": ChangeType.MOVED,
+    "D": ChangeType.REMOVED,
+    "M": ChangeType.CHANGED,
+}
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class StderrReader:
+    """
+    Collects the stderr of a subprocess on a background thread. git blocks
+    once it has filled the stderr pipe, so stderr has to be drained while
+    stdout is read rather than after it.
+    """
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        """
+        Starts reading the stream; it is closed by the reader at EOF.
+
+        Args:
+            stream: stderr pipe of the process
+        """
+        self._chunks: List[bytes] = []
+        self._thread = threading.Thread(target=self._read, args=(stream,), daemon=True)
+        self._thread.start()
+
+    def _read(self, stream: IO[bytes]) -> None:
+        with stream:
+            while True:
+                chunk = stream.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    return
+                self._chunks.append(chunk)
+
+    def text(self) -> str:
+        """
+        Waits for EOF and returns everything the process wrote to stderr.
+        """
+        self._thread.join()
+        return b"".join(self._chunks).decode("utf-8", "replace")
+
+
+def build_git_arguments(options: Dict[str, Any]) -> List[str]:
+    """
+    Converts GitPython-style keyword options into command line arguments.
+
+    Args:
+        options: Mapping such as {'reverse': True, 'no-merges': True, 'since': date}
+
+    Returns:
+        List[str]: Arguments in the form accepted by git
+    """
+    arguments = []
+    for key, value in options.items():
+        if value is None or value is False:
+            continue
+
+        flag = key.replace("_", "-")
+        prefix = "-" if len(flag) == 1 else "--"
+
+        if value is True:
+            arguments.append(f"{prefix}{flag}")
+            continue
+
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        for item in values:
+            if len(flag) == 1:
+                arguments.extend([f"{prefix}{flag}", str(item)])
+            else:
+                arguments.append(f"{prefix}{flag}={item}")
+
+    return arguments
+
+
+def _parse_raw_date(raw: str) -> Tuple[datetime, int]:
+    """
+    Parses a ``--date=raw`` value such as ``1522164679 +0100``.
+
+    Returns:
+        Tuple of (aware datetime, offset in seconds west of UTC) matching GitPython
+    """
+    timestamp, offset = raw.split(" ")
+    sign = -1 if offset[0] == "-" else 1
+    east_seconds = sign * (int(offset[1:3]) * 3600 + int(offset[3:5]) * 60)
+    tz = timezone(timedelta(seconds=east_seconds))
+    return datetime.fromtimestamp(int(timestamp), tz), -east_seconds
+
+
+def parse_file_stats(tokens: List[str]) -> List[FileStat]:
+    """
+    Parses the NUL separated ``--raw --numstat -z`` section of a commit.
+
+    Raw entries come first and define the change type and paths, numstat
+    entries follow in the same order and fill in the line counts.
+    """
+    stats: List[FileStat] = []
+    position = 0
+    count = len(tokens)
+
+    while position < count and tokens[position].startswith(":"):
+        status = tokens[position].split(" ")[-1]
+        change_type = STATUS_TO_CHANGE_TYPE.get(status[0], ChangeType.UNDEFINED)
+        if status[0] in "RC":
+            old_path, new_path = tokens[position + 1], tokens[position + 2]
+            position += 3
+        else:
+            old_path = new_path = tokens[position + 1]
+            position += 2
+
+        if change_type is ChangeType.ADDITION:
+            old_path = None
+        elif change_type is ChangeType.REMOVED:
+            new_path = None
+        stats.append(FileStat(change_type, old_path, new_path))
+
+    index = 0
+    while position < count and index < len(stats):
+        added, removed, path = tokens[position].split("\t", 2)
+        # Renames and copies leave the path empty and list both paths afterwards
+        position += 3 if path == "" else 1
+
+        stat = stats[index]
+        if added == "-":
+            stat.is_binary = True
+        else:
+            stat.lines_added = int(added)
+            stat.lines_removed = int(removed)
+        index += 1
+
+    return stats
+
+
+class RecordSplitter:
+    """
+    Incrementally splits ``git log`` output into per-commit strings.
+    Shared by the blocking and the asyncio readers.
+    """
+
+    def __init__(self) -> None:
+        self._separator = RECORD_SEPARATOR.encode()
+        self._pending = bytearray()
+
+    def feed(self, chunk: bytes) -> List[str]:
+        """
+        Consumes a chunk of output and returns the commits it completed.
+        """
+        records = []
+        start = 0
+        while True:
+            end = chunk.find(self._separator, start)
+            if end == -1:
+                self._pending += chunk[start:]
+                break
+            self._pending += chunk[start:end]
+            if self._pending:
+                records.append(self._pending.decode("utf-8", "replace"))
+                self._pending = bytearray()
+            start = end + 1
+        return records
+
+    def flush(self) -> List[str]:
+        """
+        Returns the last commit once the stream has ended.
+        """
+        if not self._pending:
+            return []
+        record = self._pending.decode("utf-8", "replace")
+        self._pending = bytearray()
+        return [record]
+
+
+class GitLogStream:
+    """
+    Runs one long-lived ``git log -z`` process and yields CommitRecord objects
+    as soon as each commit has been read from the pipe.
+    """
+
+    def __init__(self,
+                 repository_path: str,
+                 with_file_stats: bool = False,
+                 developer_factory: Optional[Any] = None) -> None:
+        """
+        Initialize the log stream.
+
+        Args:
+            repository_path: Path to the git repository
+            with_file_stats: Request ``--raw --numstat`` so records carry FileStat entries
+            developer_factory: Optional factory exposing ``get_developer(name, email)``
+        """
+        self.repository_path = repository_path
+        self.with_file_stats = with_file_stats
+        self.developer_factory = developer_factory
+
+    def build_command(self, revision: Union[str, List[str], None], options: Dict[str, Any]) -> List[str]:
+        """
+        Builds the full ``git log`` command line for a revision and options.
+        A ``paths`` option restricts the log, and the file stats, to those pathspecs.
+        """
+        command = ["git", "-C", self.repository_path, "log", "-z",
+                   "--date=raw", f"--format={RECORD_SEPARATOR}{LOG_FORMAT}"]
+        if self.with_file_stats:
+            command.extend(["--raw", "--numstat", "-M", "--no-abbrev"])
+
+        # Pathspecs go after "--", like GitPython's paths argument
+        options = dict(options)
+        paths = options.pop("paths", None)
+        command.extend(build_git_arguments(options))
+
+        if isinstance(revision, str):
+            command.append(revision)
+        elif revision:
+            command.extend(revision)
+        command.append("--")
+        if paths:
+            command.extend([paths] if isinstance(paths, str) else paths)
+        return command
+
+    def iter_commits(self, revision: Union[str, List[str], None] = "HEAD",
+                     **options: Any) -> Generator[CommitRecord, None, None]:
+        """
+        Streams commits for the given revision.
+
+        Args:
+            revision: Revision or list of revision arguments
+            **options: Additional git log options, GitPython keyword style
+
+        Yields:
+            CommitRecord: One record per commit, in git log order
+        """
+        yield from self._run(self.build_command(revision, options))
+
+    def iter_listed_commits(self, commit_hashes: List[str], keep_order: bool = True,
+                            **options: Any) -> Generator[CommitRecord, None, None]:
+        """
+        Streams exactly the given commits without walking history.
+        The hashes are passed on stdin, so the list may be arbitrarily long.
+
+        Args:
+            commit_hashes: Full hashes of the commits to read
+            keep_order: Yield the commits in the given order; otherwise they are
+                sorted by commit date, newest first, or oldest first with reverse=True
+            **options: Additional git log options, GitPython keyword style
+
+        Yields:
+            CommitRecord: One record per listed commit
+        """
+        if not commit_hashes:
+            return
+        no_walk = "unsorted" if keep_order else "sorted"
+        command = self.build_command(None, dict(options, no_walk=no_walk, stdin=True))
+        yield from self._run(command, stdin_data="".join(f"{sha}\n" for sha in commit_hashes).encode())
+
+    def _run(self, command: List[str], stdin_data: Optional[bytes] = None) -> Generator[CommitRecord, None, None]:
+        """
+        Starts the git process and parses its output until EOF or until the consumer stops.
+        """
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE if stdin_data is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        assert process.stderr is not None
+        stderr_reader = StderrReader(process.stderr)
+        try:
+            if stdin_data is not None:
+                assert process.stdin is not None
+                try:
+                    process.stdin.write(stdin_data)
+                    process.stdin.close()
+                except BrokenPipeError:
+                    # git stopped reading, e.g. at an unknown hash; its error is reported below
+                    pass
+
+            assert process.stdout is not None
+            for raw_record in self._split_records(process.stdout):
+                yield self.parse_record(raw_record)
+
+            stderr = stderr_reader.text()
+            if process.wait() != 0:
+                if "does not have any commits" in stderr or "bad revision 'HEAD'" in stderr:
+                    logger.debug(f"No commits found in {self.repository_path}")
+                else:
+                    raise Exception(f"Failed to retrieve commits: {stderr.strip()}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            # stderr is closed by its reader
+            if process.stdout is not None:
+                process.stdout.close()
+
+    @staticmethod
+    def _split_records(stream: Any) -> Iterator[str]:
+        """
+        Splits the byte stream into one decoded string per commit without reading it all.
+        """
+        splitter = RecordSplitter()
+        while True:
+            chunk = stream.read1(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield from splitter.feed(chunk)
+        yield from splitter.flush()
+
+    def _make_developer(self, name: str, email: str) -> Developer:
+        if self.developer_factory is not None:
+            return self.developer_factory.get_developer(name, email)
+        return Developer(name, email)
+
+    def parse_record(self, raw_record: str) -> CommitRecord:
+        """
+        Converts the text of one commit into a CommitRecord.
+        """
+        header, _, body = raw_record.partition("\0")
+        (sha, parents, author_name, author_email, author_date,
+         committer_name, committer_email, committer_date, message) = header.split(FIELD_SEPARATOR, 8)
+
+        creation_date, author_offset = _parse_raw_date(author_date)
+        commit_date, committer_offset = _parse_raw_date(committer_date)
+
+        file_stats = None
+        if self.with_file_stats:
+            tokens = [token for token in body.lstrip("\n").split("\0") if token]
+            file_stats = parse_file_stats(tokens)
+
+        return CommitRecord(
+            sha=sha,
+            parent_commits=parents.split(" ") if parents else [],
+            author=self._make_developer(author_name, author_email),
+            code_reviewer=self._make_developer(committer_name, committer_email),
+            creation_date=creation_date,
+            commit_date=commit_date,
+            author_timezone_offset=author_offset,
+            commit_timezone_offset=committer_offset,
+            message=message.strip(),
+            file_stats=file_stats
+        )
@@ -1,6 +1,12 @@
+import logging
 import subprocess
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
 
 
 class Author:
@@ -32,20 +38,246 @@ class SimpleAuthorFactory(AuthorFactoryBase):
         return Author(name, email)
 
 
+def _parse_contact(text: str) -> Tuple[Optional[str], Optional[str], str]:
+    """
+    Splits ``Name <email> rest`` into its name, email and remaining text.
+    Name and email are None when absent.
+    """
+    start = text.find("<")
+    end = text.find(">", start + 1) if start != -1 else -1
+    if start == -1 or end == -1:
+        return None, None, text
+
+    name = text[:start].strip() or None
+    return name, text[start + 1:end], text[end + 1:]
+
+
+def _parse_check_mailmap_output(output: str) -> Tuple[str, str]:
+    """
+    Converts one ``git check-mailmap`` output line into (name, email).
+    """
+    # Handle email-only case
+    if output.startswith("<"):
+        return "", output[1:-1]
+
+    # Handle normal name + email case
+    parts = output.split(" <")
+    return parts[0], parts[1][:-1]
+
+
+class _MailmapEntry:
+    """Replacement name/email for one commit email, optionally per commit name."""
+    __slots__ = ("name", "email", "by_name")
+
+    def __init__(self) -> None:
+        self.name: Optional[str] = None
+        self.email: Optional[str] = None
+        self.by_name: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+
+class MailmapIndex:
+    """
+    In-memory lookup index built from mailmap files, following git's rules:
+    emails and names are matched case-insensitively, and entries that also
+    name the commit author take precedence over email-only entries.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, _MailmapEntry] = {}
+
+    @classmethod
+    def from_repository(cls, repo_path: str) -> "MailmapIndex":
+        """
+        Builds the index from the repository's ``.mailmap`` and the files named
+        by the ``mailmap.blob`` and ``mailmap.file`` settings, in git's order.
+
+        Args:
+            repo_path: Path to a local repository
+
+        Returns:
+            MailmapIndex for the repository
+
+        Raises:
+            Exception: If the repository or one of the configured sources cannot be read
+        """
+        root = Path(repo_path)
+        if not root.is_dir():
+            raise Exception(f"{repo_path} is not a local repository")
+
+        config = subprocess.run(
+            ["git", "-C", repo_path, "config", "--get-regexp", r"^mailmap\."],
+            capture_output=True, text=True
+        )
+        # Exit code 1 only means that no mailmap setting exists
+        if config.returncode not in (0, 1):
+            raise Exception(f"Failed to read mailmap configuration: {config.stderr.strip()}")
+        settings = dict(line.split(" ", 1) for line in config.stdout.splitlines() if " " in line)
+
+        index = cls()
+        worktree_mailmap = root / ".mailmap"
+        if worktree_mailmap.is_file():
+            index.parse(worktree_mailmap.read_text(encoding="utf-8", errors="replace"))
+
+        blob = settings.get("mailmap.blob")
+        is_bare = not (root / ".git").exists() and (root / "HEAD").is_file()
+        if blob is None and is_bare:
+            blob = "HEAD:.mailmap"
+        if blob:
+            content = subprocess.run(
+                ["git", "-C", repo_path, "cat-file", "blob", blob],
+                capture_output=True, text=True
+            )
+            # A missing default blob is fine, an explicitly configured one is not
+            if content.returncode == 0:
+                index.parse(content.stdout)
+            elif "mailmap.blob" in settings:
+                raise Exception(f"Failed to read mailmap blob {blob}: {content.stderr.strip()}")
+
+        mailmap_file = settings.get("mailmap.file")
+        if mailmap_file:
+            path = root / Path(mailmap_file).expanduser()
+            index.parse(path.read_text(encoding="utf-8", errors="replace"))
+
+        return index
+
+    def parse(self, text: str) -> None:
+        """
+        Adds every mapping of a mailmap file; later lines override earlier ones.
+
+        Args:
+            text: Content of a mailmap file
+        """
+        for line in text.splitlines():
+            if line.startswith("#"):
+                continue
+
+            new_name, new_email, rest = _parse_contact(line)
+            if new_email is None:
+                continue
+
+            old_name, old_email, _ = _parse_contact(rest)
+            if old_email is not None:
+                self._add(old_email, old_name, new_name, new_email)
+            else:
+                # "Proper Name <email>" only replaces the name
+                self._add(new_email, None, new_name, None)
+
+    def _add(self, old_email: str, old_name: Optional[str],
+             new_name: Optional[str], new_email: Optional[str]) -> None:
+        entry = self._entries.setdefault(old_email.lower(), _MailmapEntry())
+        if old_name is None:
+            entry.name = new_name or entry.name
+            entry.email = new_email or entry.email
+        else:
+            name, email = entry.by_name.get(old_name.lower(), (None, None))
+            entry.by_name[old_name.lower()] = (new_name or name, new_email or email)
+
+    def lookup(self, name: Optional[str], email: Optional[str]) -> Tuple[str, str]:
+        """
+        Returns the canonical (name, email) for a commit identity.
+        """
+        entry = self._entries.get(str(email).lower())
+        if entry is None:
+            return str(name), str(email)
+
+        mapped_name, mapped_email = entry.name, entry.email
+        if name is not None and name.lower() in entry.by_name:
+            mapped_name, mapped_email = entry.by_name[name.lower()]
+
+        return mapped_name or str(name), mapped_email or str(email)
+
+
+class CheckMailmapProcess:
+    """
+    Resolves identities through one long-lived ``git check-mailmap --stdin``
+    process, used when the mailmap cannot be indexed natively. The process
+    is started on the first lookup and stopped by close() or on leaving a
+    ``with`` block.
+    """
+
+    def __init__(self, repo_path: str) -> None:
+        self.repo_path = repo_path
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def lookup(self, name: Optional[str], email: Optional[str]) -> Tuple[str, str]:
+        """
+        Returns the canonical (name, email) reported by git.
+        """
+        with self._lock:
+            if self._process is None:
+                self._process = subprocess.Popen(
+                    ["git", "-C", self.repo_path, "check-mailmap", "--stdin"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True
+                )
+            self._process.stdin.write(f"{name} <{email}>\n")  # type: ignore
+            self._process.stdin.flush()  # type: ignore
+            output = self._process.stdout.readline().strip()  # type: ignore
+
+        if not output:
+            return str(name), str(email)
+        return _parse_check_mailmap_output(output)
+
+    def close(self) -> None:
+        """
+        Stops the git process.
+        """
+        with self._lock:
+            if self._process is not None:
+                self._process.stdin.close()  # type: ignore
+                self._process.wait()
+                self._process.stdout.close()  # type: ignore
+                self._process = None
+
+    def __enter__(self) -> "CheckMailmapProcess":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
 class GitMailMapAuthorFactory(AuthorFactoryBase):
     """Creates Author instances with mailmap support for canonical names/emails."""
     
     def __init__(self, config):
         self.mailmap_lookup_cache = {}
         self.repo_path = config.get('path_to_repo')
+        self._resolver = None
+
+    def _get_resolver(self):
+        """
+        Builds the identity resolver once per repository: the in-memory mailmap
+        index, or a single ``git check-mailmap --stdin`` process if the mailmap
+        sources cannot be read directly.
+        """
+        if self._resolver is None:
+            try:
+                self._resolver = MailmapIndex.from_repository(self.repo_path)
+            except Exception as error:
+                logger.debug(f"Falling back to git check-mailmap: {error}")
+                self._resolver = CheckMailmapProcess(self.repo_path)
+        return self._resolver
+
+    def close(self) -> None:
+        """
+        Stops the ``git check-mailmap`` process, if one was started. Identities
+        already resolved stay cached.
+        """
+        if isinstance(self._resolver, CheckMailmapProcess):
+            self._resolver.close()
+        self._resolver = None
 
     def _get_canonical_identity(self, name: Optional[str] = None, 
                               email: Optional[str] = None) -> Tuple[str, str]:
         """
-        Queries git check-mailmap to get canonical identity information.
+        Resolves the canonical identity information of an author.
         
-        Uses the repository's .mailmap file to resolve the canonical name and email
-        for a given author. Documentation available at:
+        Uses the repository's .mailmap file (and the mailmap.file/mailmap.blob
+        settings) to resolve the canonical name and email for a given author.
+        Documentation available at:
         https://github.com/codingwithshawnyt/GitAnalyzer
         
         Args:
@@ -56,28 +288,7 @@ class GitMailMapAuthorFactory(AuthorFactoryBase):
             Tuple containing canonical (name, email)
         """
         try:
-            git_process = subprocess.run(
-                ["git", "-C", self.repo_path, "check-mailmap", f"{name} <{email}>"],
-                capture_output=True,
-                text=True
-            )
-
-            if git_process.stdout:
-                output = git_process.stdout.strip()
-                
-                # Handle email-only case
-                if output.startswith("<"):
-                    return "", output[1:-1]
-                
-                # Handle normal name + email case
-                parts = output.split(" <")
-                canonical_name = parts[0]
-                canonical_email = parts[1][:-1]
-                return canonical_name, canonical_email
-                
-            # Return original values if git command produced no output
-            return str(name), str(email)
-            
+            return self._get_resolver().lookup(name, email)
         except Exception:
             # Fallback to original values on any error
             return str(name), str(email)
@@ -87,7 +298,7 @@ class GitMailMapAuthorFactory(AuthorFactoryBase):
         Creates an Author instance with canonical identity information.
         
         Checks the cache first for previously mapped authors. If not found,
-        queries git check-mailmap and caches the result for future lookups.
+        resolves it through the mailmap and caches the result for future lookups.
         
         Args:
             name: Author's display name
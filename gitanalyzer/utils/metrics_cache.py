@@ -0,0 +1,80 @@
+"""
+Process-wide cache of Lizard results keyed by blob SHA and file extension.
+
+A blob is analyzed as the current version in one commit and as the previous
+version in the next commit touching the file; since blobs are content
+addressed, the result can be shared across commits, branches and even
+repositories.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class BlobMetrics(NamedTuple):
+    """
+    Lizard results for one blob: file-level metrics and the CodeMethod list.
+    """
+    nloc: int
+    complexity: int
+    token_count: int
+    methods: List[Any]
+
+
+class BlobMetricsCache:
+    """
+    Thread-safe LRU mapping (blob SHA, extension) to BlobMetrics.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of blobs kept in memory
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], BlobMetrics]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, blob_sha: str, extension: str) -> Optional[BlobMetrics]:
+        """
+        Returns the cached metrics of a blob, or None on a cache miss.
+        """
+        key = (blob_sha, extension)
+        with self._lock:
+            metrics = self._entries.get(key)
+            if metrics is not None:
+                self._entries.move_to_end(key)
+            return metrics
+
+    def put(self, blob_sha: str, extension: str, metrics: BlobMetrics) -> None:
+        """
+        Stores the metrics of a blob, evicting the least recently used entries.
+        """
+        with self._lock:
+            self._entries[(blob_sha, extension)] = metrics
+            self._entries.move_to_end((blob_sha, extension))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drops every cached entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by every FileChange in the process
+shared_metrics_cache = BlobMetricsCache()
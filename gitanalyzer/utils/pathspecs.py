@@ -0,0 +1,32 @@
+"""
+Translation of file filters into git pathspecs.
+"""
+
+import logging
+import re
+from typing import Iterable, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Characters with a meaning in git's wildcard matching
+_WILDCARD_CHARACTERS = re.compile(r"([*?\[\\])")
+
+
+def file_type_pathspecs(file_types: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """
+    Converts file suffixes such as ``.py`` into pathspecs such as ``*.py``.
+
+    A path matches one of the pathspecs exactly when it ends with one of the
+    suffixes, in any directory, so git can select commits and diff files
+    by type instead of every commit being diffed and filtered afterwards.
+
+    Args:
+        file_types: Suffixes of the files of interest
+
+    Returns:
+        Optional[List[str]]: Sorted pathspecs, None if there is no filter
+    """
+    if not file_types:
+        return None
+    return sorted({"*" + _WILDCARD_CHARACTERS.sub(r"\\\1", suffix) for suffix in file_types})
@@ -30,6 +30,10 @@ setup(
     python_requires='>=3.5',
     install_requires=requirements_main,
     tests_require=requirements_main + requirements_test,
+    extras_require={
+        # Vectorized reductions of the columnar process metric store
+        'columnar': ['numpy'],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Environment :: Console',
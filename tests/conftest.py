@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+
+@pytest.fixture
+def fake_git(tmp_path, monkeypatch):
+    """Returns a function installing a shell script as the first git on PATH; it returns the script's directory."""
+    def install(script):
+        git = tmp_path / 'git'
+        git.write_text(f'#!/bin/sh\n{script}\n')
+        git.chmod(0o755)
+        monkeypatch.setenv('PATH', f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+        return tmp_path
+
+    return install
+
+
+@pytest.fixture
+def stderr_flooding_git(fake_git):
+    """A git writing far more to stderr than a pipe buffer holds, then failing."""
+    return fake_git('head -c 1000000 /dev/zero | tr "\\0" x >&2\nexit 1')
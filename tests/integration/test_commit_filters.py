@@ -169,6 +169,35 @@ def test_specific_commit_selection():
     assert repo_commits == 13
 
 
+def test_filters_apply_to_streamed_records():
+    records = list(Repository('test-repos/complex_repo', traversal_engine='log_stream',
+                              only_commits=["953737b199de233896f00b4d87a0bc2794317253",
+                                            "ffccf1e7497eb8136fd66ed5e42bef29677c4b71"]).traverse_commits())
+    assert [record.hash for record in records] == ["ffccf1e7497eb8136fd66ed5e42bef29677c4b71",
+                                                   "953737b199de233896f00b4d87a0bc2794317253"]
+
+    records = list(Repository('test-repos/different_files', traversal_engine='log_stream',
+                              stream_file_stats=True,
+                              only_modifications_with_file_types=['.java']).traverse_commits())
+    assert [record.hash for record in records] == ['a1b6136f978644ff1d89816bc0f2bd86f6d9d7f5',
+                                                   'b8c2be250786975f1c6f47e96922096f1bb25e39']
+
+
+@pytest.mark.parametrize('stream_file_stats', [False, True])
+def test_modifications_by_extension_with_log_stream(stream_file_stats):
+    expected = [commit.hash for commit in Repository('test-repos/different_files',
+                                                     only_modifications_with_file_types=['.java'])
+                .traverse_commits()]
+
+    records = list(Repository('test-repos/different_files', traversal_engine='log_stream',
+                              stream_file_stats=stream_file_stats,
+                              only_modifications_with_file_types=['.java']).traverse_commits())
+
+    assert [record.hash for record in records] == expected
+    if stream_file_stats:
+        assert all(stat.filename.endswith('.java') for record in records for stat in record.file_stats)
+
+
 def test_individual_commit():
     # Test specific commit
     result = list(Repository('test-repos/complex_repo',
@@ -0,0 +1,56 @@
+import pytest
+
+from gitanalyzer.domain.commit import ChangeType
+from gitanalyzer.metrics.process import columnar
+from gitanalyzer.metrics.process.columnar import ColumnarChangeStore
+
+
+@pytest.fixture(autouse=True, params=['numpy', 'python'])
+def reductions(request, monkeypatch):
+    """Runs every test with the numpy reductions and with the plain loop fallback."""
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(columnar, 'numpy', None)
+    return request.param
+
+
+def _store():
+    store = ColumnarChangeStore()
+    first = store.add_commit()
+    store.append(first, 'a.py', 100, 0, ChangeType.ADDITION)
+    store.append(first, 'b.py', 5, 1, ChangeType.ADDITION)
+    second = store.add_commit()
+    store.append(second, 'a.py', 10, 2, ChangeType.CHANGED)
+    store.append(second, 'b.py', 0, 4, ChangeType.CHANGED)
+    return store
+
+
+def test_columns():
+    store = _store()
+
+    assert len(store) == 4
+    assert store.commit_count == 2
+    assert store.paths == ['a.py', 'b.py']
+    assert list(store.path_ids) == [0, 1, 0, 1]
+    assert list(store.commit_indexes) == [0, 0, 1, 1]
+
+
+def test_reductions():
+    store = _store()
+
+    assert store.sum_by_path(store.added) == {'a.py': 110, 'b.py': 5}
+    assert store.max_by_path(store.removed) == {'a.py': 2, 'b.py': 4}
+    assert store.count_by_path() == {'a.py': 2, 'b.py': 2}
+    assert store.average_by_path(store.added) == {'a.py': 55, 'b.py': 2}
+    assert store.sum_by_path(store.volumes(use_total_changes=True)) == {'a.py': 112, 'b.py': 10}
+
+
+def test_reductions_with_mask():
+    store = _store()
+    mask = store.rows_without(ChangeType.ADDITION)
+
+    assert list(mask) == [0, 0, 1, 1]
+    assert store.sum_by_path(store.volumes(), mask) == {'a.py': 8, 'b.py': -4}
+    assert store.max_by_path(store.volumes(), mask) == {'a.py': 8, 'b.py': -4}
+    assert store.count_by_path(mask) == {'a.py': 1, 'b.py': 1}
@@ -0,0 +1,261 @@
+from datetime import datetime
+
+import pytest
+
+from gitanalyzer.domain.commit import ChangeType
+from gitanalyzer.metrics.process.accumulators import (
+    ChangeBlocksAccumulator, ChangeSetAccumulator, ChangeVolumeAccumulator, CommitChanges,
+    CommitCountAccumulator, ContributorsAccumulator, LineChangesAccumulator, MetricAccumulator, PathChange
+)
+from gitanalyzer.metrics.process.engine import (
+    ProcessMetricsEngine, load_checkpoint, merge_partitions, save_checkpoint
+)
+
+# Two commits, newest first, as the engine delivers them
+COMMITS = [
+    CommitChanges('b' * 40, 'bob@example.com', datetime(2020, 1, 2), [
+        PathChange('a.py', ChangeType.CHANGED, 10, 2, 2),
+        PathChange('b.py', ChangeType.ADDITION, 5, 0, 1),
+    ]),
+    CommitChanges('a' * 40, 'alice@example.com', datetime(2020, 1, 1), [
+        PathChange('a.py', ChangeType.ADDITION, 100, 0, 1),
+    ]),
+]
+
+
+def _feed(accumulator):
+    for commit in COMMITS:
+        accumulator.update(commit)
+    return accumulator.finalize()
+
+
+def test_change_volume_accumulator():
+    assert _feed(ChangeVolumeAccumulator()) == {
+        'total': {'a.py': 108, 'b.py': 5},
+        'peak': {'a.py': 100, 'b.py': 5},
+        'average': {'a.py': 54, 'b.py': 5},
+    }
+    assert _feed(ChangeVolumeAccumulator(skip_new_files=True, use_total_changes=True))['total'] == {'a.py': 12}
+
+
+def test_line_changes_accumulator():
+    result = _feed(LineChangesAccumulator())
+
+    assert result['total_changes'] == {'a.py': 112, 'b.py': 5}
+    assert result['max_additions'] == {'a.py': 100, 'b.py': 5}
+    assert result['average_deletions'] == {'a.py': 1, 'b.py': 0}
+
+
+def test_contributors_accumulator():
+    assert _feed(ContributorsAccumulator()) == {'total': {'a.py': 2, 'b.py': 1}, 'minor': {'a.py': 0, 'b.py': 0}}
+
+
+def test_change_blocks_and_change_set_accumulators():
+    assert _feed(ChangeBlocksAccumulator()) == {'a.py': 1.5, 'b.py': 1}
+    assert _feed(ChangeSetAccumulator()) == {'max': 2, 'average': 2}
+
+
+def test_accumulator_state_rename_and_merge():
+    older = LineChangesAccumulator()
+    older.update(COMMITS[1])
+    newer = LineChangesAccumulator()
+    newer.update(COMMITS[0])
+
+    restored = LineChangesAccumulator()
+    restored.set_state(older.get_state())
+    restored.rename_paths({'a.py': 'c.py'})
+    newer.merge(restored)
+
+    result = newer.finalize()
+    assert result['total_additions'] == {'a.py': 10, 'b.py': 5, 'c.py': 100}
+
+    newer.rename_paths({'a.py': 'c.py'})
+    assert newer.finalize()['max_additions'] == {'b.py': 5, 'c.py': 100}
+
+
+def test_accumulators_must_implement_merge():
+    class Unmergeable(MetricAccumulator):
+        def update(self, commit):
+            pass
+
+        def finalize(self):
+            return {}
+
+    with pytest.raises(TypeError):
+        Unmergeable()
+    with pytest.raises(NotImplementedError):
+        LineChangesAccumulator().evict(COMMITS[0])
+
+
+def test_set_state_keeps_the_accumulator_options():
+    saved = ChangeVolumeAccumulator()
+    saved.update(COMMITS[1])
+
+    restored = ChangeVolumeAccumulator(skip_new_files=True, use_total_changes=True)
+    restored.set_state(saved.get_state())
+
+    assert 'skip_new_files' not in saved.get_state()
+    assert restored.get_config() == {'skip_new_files': True, 'use_total_changes': True}
+    assert restored.finalize()['total'] == {'a.py': 100}
+
+
+def test_checkpoint_is_rejected_for_a_different_configuration(tmp_path):
+    engine = ProcessMetricsEngine('test-repos/gitanalyzer', [ChangeVolumeAccumulator(), 'commit_count'],
+                                  initial_commit='a' * 40, final_commit='b' * 40)
+    engine.last_commit = 'b' * 40
+    save_checkpoint(engine.checkpoint(), str(tmp_path / 'metrics.json'))
+    checkpoint = load_checkpoint(str(tmp_path / 'metrics.json'))
+
+    resumed = ProcessMetricsEngine('test-repos/gitanalyzer', [ChangeVolumeAccumulator(), 'commit_count'],
+                                   initial_commit='a' * 40, checkpoint=checkpoint)
+    assert resumed.initial_commit == 'b' * 40
+
+    with pytest.raises(ValueError, match='metric options'):
+        ProcessMetricsEngine('test-repos/gitanalyzer',
+                             [ChangeVolumeAccumulator(use_total_changes=True), 'commit_count'],
+                             checkpoint=checkpoint)
+    with pytest.raises(ValueError, match='metric options'):
+        ProcessMetricsEngine('test-repos/gitanalyzer', ['change_volume'], checkpoint=checkpoint)
+    with pytest.raises(ValueError, match='different range'):
+        ProcessMetricsEngine('test-repos/gitanalyzer', [ChangeVolumeAccumulator(), 'commit_count'],
+                             initial_commit='c' * 40, checkpoint=checkpoint)
+
+
+def test_merge_partitions_resolves_renames_across_partitions():
+    # a.py was renamed to b.py in the older partition and b.py to c.py in the newer one
+    newest = CommitCountAccumulator()
+    newest.update(CommitChanges('c' * 40, 'bob@example.com', datetime(2020, 1, 3), [
+        PathChange('c.py', ChangeType.MOVED, 0, 0)]))
+    middle = CommitCountAccumulator()
+    middle.update(CommitChanges('b' * 40, 'bob@example.com', datetime(2020, 1, 2), [
+        PathChange('b.py', ChangeType.MOVED, 0, 0)]))
+    oldest = CommitCountAccumulator()
+    oldest.update(CommitChanges('a' * 40, 'bob@example.com', datetime(2020, 1, 1), [
+        PathChange('a.py', ChangeType.ADDITION, 3, 0)]))
+
+    accumulators, renames = merge_partitions([
+        ([newest], {'b.py': 'c.py'}),
+        ([middle], {'a.py': 'b.py'}),
+        ([oldest], {}),
+    ])
+
+    assert accumulators[0].finalize() == {'c.py': 3}
+    assert renames == {'a.py': 'c.py', 'b.py': 'c.py'}
+
+
+def test_unknown_metric():
+    with pytest.raises(ValueError):
+        ProcessMetricsEngine('test-repos/gitanalyzer', ['unknown'],
+                             initial_commit='ab36bf45859a210b0eae14e17683f31d19eea041',
+                             final_commit='71e053f61fc5d31b3e31eccd9c79df27c31279bf')
+
+
+def test_engine_single_pass():
+    engine = ProcessMetricsEngine('test-repos/gitanalyzer', ['commit_count', 'change_blocks'],
+                                  initial_commit='ab36bf45859a210b0eae14e17683f31d19eea041',
+                                  final_commit='71e053f61fc5d31b3e31eccd9c79df27c31279bf')
+
+    results = engine.compute()
+
+    assert results['change_blocks']['scm/git_repository.py'] == 3
+    assert set(results['commit_count']) == set(results['change_blocks'])
+
+
+def test_numstat_is_used_unless_patches_are_needed():
+    range_args = dict(initial_commit='ab36bf45859a210b0eae14e17683f31d19eea041',
+                      final_commit='71e053f61fc5d31b3e31eccd9c79df27c31279bf')
+
+    assert ProcessMetricsEngine('test-repos/gitanalyzer', ['line_changes', 'authorship'], **range_args).use_numstat
+    assert not ProcessMetricsEngine('test-repos/gitanalyzer', ['change_blocks'], **range_args).use_numstat
+    with pytest.raises(ValueError):
+        ProcessMetricsEngine('test-repos/gitanalyzer', ['change_blocks'], use_numstat=True, **range_args)
+
+
+def test_file_summaries_are_used_unless_patches_are_needed(monkeypatch):
+    from types import SimpleNamespace
+    from gitanalyzer.domain.commit_record import FileStat
+
+    class SummaryOnlyCommit:
+        sha = 'a' * 40
+        author = SimpleNamespace(email='alice@example.com')
+        commit_date = datetime(2020, 1, 1)
+        file_summaries = [FileStat(ChangeType.ADDITION, None, 'a.py', 3, 0)]
+
+        @property
+        def file_changes(self):
+            raise AssertionError('file changes should not be computed')
+
+    engine = ProcessMetricsEngine('test-repos/gitanalyzer', ['line_changes', 'commit_count'], use_numstat=False,
+                                  initial_commit='a' * 40, final_commit='a' * 40)
+    monkeypatch.setattr(engine, '_repository', lambda: SimpleNamespace(analyze_commits=lambda: [SummaryOnlyCommit()]))
+
+    assert [commit.files for commit in engine._iter_changes({})] == [[PathChange('a.py', ChangeType.ADDITION, 3, 0)]]
+
+
+def test_second_compute_is_served_from_the_analysis_cache(tmp_path, monkeypatch):
+    import sqlite3
+    from gitanalyzer.domain.commit import CommitInfo
+
+    range_args = dict(initial_commit='ab36bf45859a210b0eae14e17683f31d19eea041',
+                      final_commit='71e053f61fc5d31b3e31eccd9c79df27c31279bf')
+    cache_path = str(tmp_path / 'cache.db')
+    metrics = ['line_changes', 'commit_count']
+
+    first = ProcessMetricsEngine('test-repos/gitanalyzer', metrics, use_numstat=False,
+                                 analysis_cache_path=cache_path, **range_args).compute()
+    with sqlite3.connect(cache_path) as connection:
+        cached_commits = connection.execute('SELECT COUNT(*) FROM file_summary_sets').fetchone()[0]
+    assert cached_commits > 0
+
+    def no_diff(commit):
+        raise AssertionError('commit was diffed again')
+
+    monkeypatch.setattr(CommitInfo, 'file_changes', property(no_diff))
+    second = ProcessMetricsEngine('test-repos/gitanalyzer', metrics, use_numstat=False,
+                                  analysis_cache_path=cache_path, **range_args).compute()
+
+    assert second == first
+
+
+def test_numstat_matches_patches():
+    range_args = dict(initial_commit='ab36bf45859a210b0eae14e17683f31d19eea041',
+                      final_commit='71e053f61fc5d31b3e31eccd9c79df27c31279bf')
+    metrics = ['line_changes', 'commit_count', 'contributors']
+
+    fast = ProcessMetricsEngine('test-repos/gitanalyzer', metrics, **range_args).compute()
+    slow = ProcessMetricsEngine('test-repos/gitanalyzer', metrics, use_numstat=False, **range_args).compute()
+
+    assert fast == slow
+
+
+def test_resume_from_checkpoint(tmp_path):
+    metrics = ['line_changes', 'commit_count', 'contributors', 'change_set']
+    full = ProcessMetricsEngine('test-repos/gitanalyzer', metrics,
+                                initial_commit='ab36bf45859a210b0eae14e17683f31d19eea041',
+                                final_commit='71e053f61fc5d31b3e31eccd9c79df27c31279bf').compute()
+
+    first = ProcessMetricsEngine('test-repos/gitanalyzer', metrics,
+                                 initial_commit='ab36bf45859a210b0eae14e17683f31d19eea041',
+                                 final_commit='fdf671856b260aca058e6595a96a7a0fba05454b')
+    first.compute()
+    save_checkpoint(first.checkpoint(), str(tmp_path / 'metrics.json'))
+
+    resumed = ProcessMetricsEngine('test-repos/gitanalyzer', metrics,
+                                   final_commit='71e053f61fc5d31b3e31eccd9c79df27c31279bf',
+                                   checkpoint=load_checkpoint(str(tmp_path / 'metrics.json')))
+
+    assert resumed.compute() == full
+    assert resumed.last_commit == '71e053f61fc5d31b3e31eccd9c79df27c31279bf'
+    with pytest.raises(ValueError):
+        ProcessMetricsEngine('test-repos/gitanalyzer', ['commit_count'], checkpoint=first.checkpoint())
+
+
+def test_parallel_partitions_match_single_pass():
+    range_args = dict(initial_commit='ab36bf45859a210b0eae14e17683f31d19eea041',
+                      final_commit='71e053f61fc5d31b3e31eccd9c79df27c31279bf')
+    metrics = ['line_changes', 'commit_count', 'contributors', 'change_blocks', 'change_set']
+
+    single = ProcessMetricsEngine('test-repos/gitanalyzer', metrics, **range_args).compute()
+    parallel = ProcessMetricsEngine('test-repos/gitanalyzer', metrics, **range_args).compute(workers=3)
+
+    assert parallel == single
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from gitanalyzer.domain.commit import ChangeType
+from gitanalyzer.metrics.process.accumulators import (
+    CommitChanges, CommitCountAccumulator, ContributorsAccumulator, LineChangesAccumulator, PathChange,
+    WindowedChangeVolumeAccumulator
+)
+from gitanalyzer.metrics.process.engine import ProcessMetricsEngine
+from gitanalyzer.metrics.process.rolling import RollingProcessMetrics
+
+COMMITS = [
+    CommitChanges('c' * 40, 'carol@example.com', datetime(2020, 1, 3), [
+        PathChange('a.py', ChangeType.MOVED, 0, 0),
+    ]),
+    CommitChanges('b' * 40, 'bob@example.com', datetime(2020, 1, 2), [
+        PathChange('a.py', ChangeType.CHANGED, 10, 2),
+    ]),
+    CommitChanges('a' * 40, 'alice@example.com', datetime(2020, 1, 1), [
+        PathChange('a.py', ChangeType.ADDITION, 100, 0),
+    ]),
+]
+
+
+def test_evict_undoes_update():
+    for accumulator_class in (WindowedChangeVolumeAccumulator, ContributorsAccumulator):
+        windowed = accumulator_class()
+        for commit in COMMITS:
+            windowed.update(commit)
+        windowed.evict(COMMITS[0])
+        windowed.evict(COMMITS[1])
+
+        expected = accumulator_class()
+        expected.update(COMMITS[2])
+        assert windowed.finalize() == expected.finalize()
+
+
+def test_evicting_the_peak():
+    windowed = WindowedChangeVolumeAccumulator()
+    for commit in reversed(COMMITS):
+        windowed.update(commit)
+    windowed.evict(COMMITS[2])
+
+    assert windowed.finalize() == {'total': {'a.py': 8}, 'peak': {'a.py': 8}, 'average': {'a.py': 4}}
+
+
+def test_contributor_without_lines_stays_in_window():
+    windowed = ContributorsAccumulator()
+    for commit in COMMITS:
+        windowed.update(commit)
+    windowed.evict(COMMITS[2])
+
+    assert windowed.finalize()['total'] == {'a.py': 2}
+
+
+def test_metrics_without_evict_are_rejected():
+    with pytest.raises(ValueError):
+        RollingProcessMetrics('test-repos/gitanalyzer', [LineChangesAccumulator()],
+                              window=timedelta(days=90), step=timedelta(days=7),
+                              start_date=datetime(2018, 1, 1), end_date=datetime(2019, 1, 1))
+    with pytest.raises(ValueError):
+        RollingProcessMetrics('test-repos/gitanalyzer', ['commit_count'],
+                              window=timedelta(days=90), step=timedelta(days=7),
+                              start_date=datetime(2018, 1, 1), end_date=datetime(2018, 2, 1))
+
+
+def test_rolling_windows():
+    rolling = RollingProcessMetrics('test-repos/gitanalyzer', ['commit_count', 'contributors'],
+                                    window=timedelta(days=30), step=timedelta(days=7),
+                                    start_date=datetime(2018, 3, 1), end_date=datetime(2018, 6, 1))
+
+    results = rolling.compute()
+
+    assert len(results) == 9
+    assert [result.end for result in results] == sorted(result.end for result in results)
+    assert all(result.end - result.start == timedelta(days=30) for result in results)
+    for result in results:
+        single = ProcessMetricsEngine('test-repos/gitanalyzer', ['commit_count', 'contributors'],
+                                      start_date=result.start, end_date=result.end).compute()
+        assert result.metrics == single
+
+
+def test_rolling_windows_with_skewed_commit_dates(monkeypatch):
+    day = timedelta(days=1)
+    origin = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    # Traversal order, newest first; the third commit carries a date from a skewed clock
+    dates = [origin + 20 * day, origin + 15 * day, origin + 18 * day, origin + 9 * day,
+             origin + 4 * day, origin + 2 * day]
+    history = [
+        CommitChanges(str(index) * 40, f'dev{index % 2}@example.com', date, [
+            PathChange('a.py', ChangeType.CHANGED, index + 1, 1),
+        ])
+        for index, date in enumerate(dates)
+    ]
+
+    rolling = RollingProcessMetrics('test-repos/gitanalyzer', ['commit_count', 'contributors'],
+                                    window=5 * day, step=2 * day,
+                                    start_date=origin, end_date=origin + 21 * day)
+    monkeypatch.setattr(rolling, '_iter_changes', lambda renames: iter(history))
+
+    results = rolling.compute()
+
+    assert len(results) == 9
+    for result in results:
+        expected = {}
+        for accumulator in (CommitCountAccumulator(), ContributorsAccumulator()):
+            for commit in history:
+                if result.start < commit.commit_date <= result.end:
+                    accumulator.update(commit)
+            expected[accumulator.name] = accumulator.finalize()
+        assert result.metrics == expected
+    assert results[-2].metrics['commit_count'] == {'a.py': 2}
@@ -0,0 +1,58 @@
+from gitanalyzer.domain.commit import ChangeType, CodeMethod
+from gitanalyzer.domain.commit_record import FileStat
+from gitanalyzer.utils.analysis_cache import AnalysisCache, options_key
+from gitanalyzer.utils.metrics_cache import BlobMetrics
+
+
+def test_options_key():
+    assert options_key() == "histogram=0;whitespace=0"
+    assert options_key(histogram=True, ignore_whitespace=True) == "histogram=1;whitespace=1"
+    assert options_key(pathspecs=["*.py", "*.java"]) == "histogram=0;whitespace=0;paths=*.java,*.py"
+
+
+def test_commit_stats_round_trip(tmp_path):
+    cache = AnalysisCache(str(tmp_path / "cache.db"))
+    stats = {"insertions": 3, "deletions": 1, "lines": 4, "files": 2}
+
+    assert cache.load_commit_stats("abc", options_key()) is None
+    cache.store_commit_stats("abc", options_key(), stats)
+    assert cache.load_commit_stats("abc", options_key()) == stats
+    assert cache.load_commit_stats("abc", options_key(histogram=True)) is None
+    cache.close()
+
+
+def test_file_summaries_survive_reopen(tmp_path):
+    database = str(tmp_path / "cache.db")
+    cache = AnalysisCache(database)
+    cache.store_file_summaries("abc", options_key(), [
+        FileStat(ChangeType.MOVED, "old.py", "new.py", 2, 1),
+        FileStat(ChangeType.ADDITION, None, "added.py", 5, 0),
+    ])
+    cache.store_file_summaries("empty", options_key(), [])
+    cache.close()
+
+    cache = AnalysisCache(database)
+    summaries = cache.load_file_summaries("abc", options_key())
+    assert [(s.modification_type, s.original_path, s.current_path, s.lines_added, s.lines_removed)
+            for s in summaries] == [
+        (ChangeType.MOVED, "old.py", "new.py", 2, 1),
+        (ChangeType.ADDITION, None, "added.py", 5, 0),
+    ]
+    assert cache.load_file_summaries("empty", options_key()) == []
+    assert cache.load_file_summaries("unknown", options_key()) is None
+    cache.close()
+
+
+def test_blob_metrics_round_trip(tmp_path):
+    cache = AnalysisCache(str(tmp_path / "cache.db"))
+    method = CodeMethod.from_fields({"method_name": "run", "full_name": "run(self)", "args": ["self"],
+                                     "code_lines": 4, "line_start": 1, "line_end": 5})
+
+    assert cache.load_blob_metrics("blob", ".py") is None
+    cache.store_blob_metrics("blob", ".py", BlobMetrics(10, 3, 42, [method]))
+    metrics = cache.load_blob_metrics("blob", ".py")
+    assert metrics[:3] == (10, 3, 42)
+    assert metrics.methods == [method]
+    assert metrics.methods[0].code_lines == 4
+    assert cache.load_blob_metrics("blob", ".java") is None
+    cache.close()
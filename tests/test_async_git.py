@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from gitanalyzer.utils.async_git import AsyncGitLogStream
+from gitanalyzer.utils.log_stream import GitLogStream
+
+
+async def _collect(stream, **options):
+    return [record async for record in stream.iter_commits_async('HEAD', **options)]
+
+
+def test_async_stream_matches_blocking_stream():
+    expected = list(GitLogStream('test-repos/small_repo', with_file_stats=True).iter_commits('HEAD', reverse=True))
+
+    stream = AsyncGitLogStream('test-repos/small_repo', with_file_stats=True, concurrency=2)
+    records = asyncio.run(_collect(stream, max_in_flight=2, reverse=True))
+
+    assert [record.sha for record in records] == [record.sha for record in expected]
+    for record, reference in zip(records, expected):
+        assert record.added_lines == reference.added_lines
+        assert record.removed_lines == reference.removed_lines
+
+
+def test_async_stream_can_be_closed_early():
+    async def first_commit():
+        records = AsyncGitLogStream('test-repos/small_repo').iter_commits_async('HEAD')
+        first = await records.__anext__()
+        await records.aclose()
+        return first
+
+    assert asyncio.run(first_commit()).sha == 'da39b1326dbc2edfe518b90672734a08f3c13458'
+
+
+def test_async_stream_reads_stderr_while_git_runs(stderr_flooding_git):
+    stream = AsyncGitLogStream(str(stderr_flooding_git))
+    with pytest.raises(Exception, match='Failed to retrieve commits: x'):
+        asyncio.run(asyncio.wait_for(_collect(stream), timeout=10))
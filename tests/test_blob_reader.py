@@ -0,0 +1,46 @@
+import subprocess
+
+import pytest
+
+from gitanalyzer.utils.blob_reader import BlobReader
+
+
+@pytest.fixture
+def blob_repository(tmp_path):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / "file.txt").write_bytes(b"first\nsecond\n")
+    subprocess.run(["git", "-C", str(tmp_path), "add", "file.txt"], check=True)
+    blob_sha = subprocess.run(["git", "-C", str(tmp_path), "hash-object", "file.txt"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    return str(tmp_path), blob_sha
+
+
+def test_read_blob(blob_repository):
+    path, blob_sha = blob_repository
+    reader = BlobReader(path)
+
+    content = reader.read(blob_sha)
+    assert content == b"first\nsecond\n"
+    # Served from the cache: the same object, not a second read
+    assert reader.read(blob_sha) is content
+    reader.close()
+
+
+def test_missing_blob(blob_repository):
+    path, _ = blob_repository
+    reader = BlobReader(path)
+
+    assert reader.read("0" * 40) is None
+    reader.close()
+
+
+def test_cache_is_bounded(blob_repository):
+    path, blob_sha = blob_repository
+    reader = BlobReader(path, max_cache_bytes=4)
+
+    content = reader.read(blob_sha)
+    assert content == b"first\nsecond\n"
+    # Too large to be kept, so it is read from git again
+    second = reader.read(blob_sha)
+    assert second == content and second is not content
+    reader.close()
@@ -0,0 +1,44 @@
+import subprocess
+
+import pytest
+
+from gitanalyzer.utils.branch_index import BranchIndex
+
+
+def _git(path, *args):
+    return subprocess.run(["git", "-C", str(path), "-c", "user.name=Dev", "-c", "user.email=dev@example.com", *args],
+                          capture_output=True, text=True, check=True).stdout.strip()
+
+
+@pytest.fixture
+def branched_repository(tmp_path):
+    _git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "file.txt").write_text("first\n")
+    _git(tmp_path, "add", "file.txt")
+    _git(tmp_path, "commit", "-q", "-m", "first")
+    root = _git(tmp_path, "rev-parse", "HEAD")
+
+    _git(tmp_path, "checkout", "-q", "-b", "feature")
+    (tmp_path / "file.txt").write_text("second\n")
+    _git(tmp_path, "commit", "-q", "-am", "second")
+    feature = _git(tmp_path, "rev-parse", "HEAD")
+    _git(tmp_path, "checkout", "-q", "main")
+    return str(tmp_path), root, feature
+
+
+def test_branches_containing(branched_repository):
+    path, root, feature = branched_repository
+    index = BranchIndex(path)
+
+    assert index.branches_containing(root) == {"main", "feature"}
+    assert index.branches_containing(feature) == {"feature"}
+    assert index.branches_containing("0" * 40) == set()
+
+
+def test_index_matches_git_branch(branched_repository):
+    path, root, feature = branched_repository
+    index = BranchIndex(path)
+
+    for commit in (root, feature):
+        expected = {line.strip("* ").strip() for line in _git(path, "branch", "--contains", commit).splitlines()}
+        assert index.branches_containing(commit) == expected
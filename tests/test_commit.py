@@ -59,6 +59,63 @@ def test_python_metrics(mock_diff):
     assert len(modified_file.methods) == 19
 
 
+def test_cached_blob_metrics_name_the_file_that_reads_them():
+    from unittest.mock import MagicMock
+    from gitanalyzer.domain.commit import FileChange
+    from gitanalyzer.utils.metrics_cache import shared_metrics_cache
+
+    shared_metrics_cache.clear()
+    changes = []
+    for path in ('src/first.py', 'copy/second.py'):
+        diff = MagicMock(a_path=None, b_path=path, new_file=True)
+        diff.b_blob.hexsha = 'a' * 40
+        diff.b_blob.data_stream.read.return_value = b"def square(x):\n    return x * x\n"
+        changes.append(FileChange(diff))
+
+    first, second = changes
+    assert [method.source_file for method in first.current_methods] == ['first.py']
+    assert [method.source_file for method in second.current_methods] == ['second.py']
+    assert len(shared_metrics_cache) == 1
+    assert first.current_methods[0].source_file == 'first.py'
+
+
+def test_file_contents_are_read_once_until_released():
+    from unittest.mock import MagicMock
+    from gitanalyzer.domain.commit import FileChange
+
+    reader = MagicMock()
+    reader.read.side_effect = lambda blob_sha: "print('hello')\n".encode()
+    diff = MagicMock(a_path=None, b_path='hello.py', new_file=True)
+    change = FileChange(diff, blob_reader=reader)
+
+    content = change.content
+    assert change.content is content
+    assert change.current_code == "print('hello')\n"
+    assert change.current_code is change.current_code
+    assert reader.read.call_count == 1
+
+    change.release_memory()
+    assert change.content is not content and change.content == content
+    assert reader.read.call_count == 2
+
+
+def test_binary_flag_survives_materialization():
+    from unittest.mock import MagicMock
+    from gitanalyzer.domain.commit import FileChange
+    from gitanalyzer.domain.commit_record import FileStat
+
+    diff = MagicMock(a_path=None, b_path='logo.png', new_file=True)
+    diff.diff = b"Binary files /dev/null and b/logo.png differ\n"
+    change = FileChange(diff)
+
+    assert change.is_binary
+    assert (change.lines_added, change.lines_removed) == (0, 0)
+    assert FileStat.from_file_change(change).is_binary
+
+    change.release_memory()
+    assert change.is_binary
+
+
 def test_method_changes():
 
     repo = Repository("test-repos/diff")
@@ -284,4 +341,40 @@ def test_multiple_authors(repo: Repository):
     commit = repo.get_commit('a455e6c8ba6960aa8b89bd0fd5f9abefcd10bcd6')
 
     assert commit.co_authors[0].name == "Somebody"
-    assert commit.co_authors[0].email == "some@body.org"
\ No newline at end of file
+    assert commit.co_authors[0].email == "some@body.org"
+
+@pytest.mark.parametrize('repository', ['test-repos/complex_repo'], indirect=True)
+def test_file_changes_are_memoized(repository: Repository):
+    commit = repository.get_commit('e7d13b0511f8a176284ce4f92ed8c6e8d09c77f2')
+
+    changes = commit.file_changes
+    assert commit.file_changes is changes
+    assert commit.modified_files is changes
+
+    commit.invalidate_file_changes()
+    assert commit.file_changes is not changes
+
+
+@pytest.mark.parametrize('repository', ['test-repos/complex_repo'], indirect=True)
+def test_release_file_changes_keeps_line_counts(repository: Repository):
+    commit = repository.get_commit('e7d13b0511f8a176284ce4f92ed8c6e8d09c77f2')
+    change = commit.file_changes[0]
+    added, removed = change.lines_added, change.lines_removed
+
+    commit.release_file_changes()
+
+    assert (change.lines_added, change.lines_removed) == (added, removed)
+    with pytest.raises(ValueError):
+        change.diff_text
+
+
+@pytest.mark.parametrize('repository', ['test-repos/complex_repo'], indirect=True)
+def test_patch_is_parsed_once(repository: Repository):
+    change = repository.get_commit('e7d13b0511f8a176284ce4f92ed8c6e8d09c77f2').file_changes[0]
+
+    patch = change.patch
+    assert change.patch is patch
+    assert change.parsed_diff['added'] is patch.added
+    assert (change.lines_added, change.lines_removed) == (patch.lines_added, patch.lines_removed)
+    assert change.change_blocks == patch.change_blocks
+    assert change.hunks is patch.hunks
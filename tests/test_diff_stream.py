@@ -0,0 +1,93 @@
+import io
+
+import pytest
+
+from gitanalyzer.domain.commit import ChangeType
+from gitanalyzer.domain.patch import Hunk
+from gitanalyzer.utils.diff_stream import DiffFile, DiffHunk, GitDiffStream, parse_diff_stream, read_lines
+
+DIFF = (
+    b"diff --git a/old name.py b/new name.py\n"
+    b"similarity index 80%\n"
+    b"rename from old name.py\n"
+    b"rename to new name.py\n"
+    b"index 1111111..2222222 100644\n"
+    b"--- a/old name.py\n"
+    b"+++ b/new name.py\n"
+    b"@@ -1,3 +1,3 @@\n"
+    b" first\n"
+    b"-second\n"
+    b"+changed second\n"
+    b" third\n"
+    b"@@ -10 +10,2 @@\n"
+    b"-last\n"
+    b"\\ No newline at end of file\n"
+    b"+last\n"
+    b"+appended\n"
+    b"diff --git a/image.png b/image.png\n"
+    b"new file mode 100644\n"
+    b"index 0000000..3333333\n"
+    b"Binary files /dev/null and b/image.png differ\n"
+    b"diff --git a/big.txt b/big.txt\n"
+    b"deleted file mode 100644\n"
+    b"index 4444444..0000000\n"
+    b"--- a/big.txt\n"
+    b"+++ /dev/null\n"
+    b"@@ -1,4 +0,0 @@\n"
+    b"-one\n"
+    b"-two\n"
+    b"-three\n"
+    b"-four\n"
+)
+
+
+def test_parse_diff_stream():
+    records = list(parse_diff_stream(io.BytesIO(DIFF)))
+
+    first, second, renamed, image, deleted_hunk, deleted = records
+    assert first == DiffHunk('new name.py', Hunk(1, 3, 1, 3), [(2, 'changed second')], [(2, 'second')])
+    assert second.added == [(10, 'last'), (11, 'appended')] and second.deleted == [(10, 'last')]
+
+    assert renamed.modification_type == ChangeType.MOVED
+    assert (renamed.original_path, renamed.current_path) == ('old name.py', 'new name.py')
+    assert (renamed.lines_added, renamed.lines_removed, renamed.truncated) == (3, 2, False)
+
+    assert image.modification_type == ChangeType.ADDITION and image.is_binary
+    assert image.original_path is None
+
+    assert deleted_hunk.path == 'big.txt' and len(deleted_hunk.deleted) == 4
+    assert deleted.modification_type == ChangeType.REMOVED and deleted.current_path is None
+
+
+def test_parse_diff_stream_truncates_files_over_the_caps():
+    records = list(parse_diff_stream(io.BytesIO(DIFF), max_file_lines=10))
+
+    hunks = [record for record in records if isinstance(record, DiffHunk)]
+    files = [record for record in records if isinstance(record, DiffFile)]
+
+    # The renamed file hits the cap inside its first hunk, the deleted file does not
+    assert hunks[0].truncated and hunks[0].path == 'new name.py'
+    assert hunks[0].deleted == [(2, 'second')] and hunks[0].added == []
+    assert [hunk.path for hunk in hunks[1:]] == ['big.txt']
+    assert [file.truncated for file in files] == [True, False, False]
+    assert (files[0].lines_added, files[0].lines_removed) == (3, 2)
+
+    files = [record for record in parse_diff_stream(io.BytesIO(DIFF), max_file_bytes=100)
+             if isinstance(record, DiffFile)]
+    assert [file.truncated for file in files] == [True, True, True]
+    assert files[0].patch_bytes == DIFF.index(b"diff --git a/image.png")
+
+
+def test_read_lines_bounds_long_lines():
+    stream = io.BytesIO(b"short\n" + b"x" * 300000 + b"\nend")
+
+    lines = list(read_lines(stream, max_length=1000))
+
+    assert lines[0] == (b"short\n", 6)
+    assert lines[1][1] == 300001 and len(lines[1][0]) < 300001
+    assert lines[2] == (b"end", 3)
+
+
+def test_diff_stream_reads_stderr_while_git_runs(stderr_flooding_git):
+    with pytest.raises(Exception, match='Failed to compute diff: x'):
+        list(GitDiffStream(str(stderr_flooding_git)).iter_diff('HEAD~1', 'HEAD'))
@@ -1,3 +1,7 @@
+import concurrent.futures
+import os
+import threading
+import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
@@ -52,6 +56,21 @@ def test_retrieve_commits(repository: Git):
     assert len(commits) == 5
 
 
+@pytest.mark.parametrize('repository', ['https://github.com/codingwithshawnyt/GitAnalyzer/small_repo/'], indirect=True)
+def test_retrieve_listed_commits(repository: Git):
+    listed = ['da39b1326dbc2edfe518b90672734a08f3c13458',
+              'a88c84ddf42066611e76e6cb690144e5357d132c',
+              '0000000000000000000000000000000000000000',
+              '09f6182cef737db02a085e1d018963c7a29bde5a']
+
+    commits = [commit.hash for commit in repository.get_listed_commits(listed)]
+
+    assert commits == ['a88c84ddf42066611e76e6cb690144e5357d132c',
+                       '09f6182cef737db02a085e1d018963c7a29bde5a',
+                       'da39b1326dbc2edfe518b90672734a08f3c13458']
+    assert [record.sha for record in repository.stream_listed_commits(listed, reverse=False)] == commits[::-1]
+
+
 @pytest.mark.parametrize('repository', ['https://github.com/codingwithshawnyt/GitAnalyzer/small_repo/'], indirect=True)
 def test_fetch_commit(repository: Git):
     commit = repository.get_commit('09f6182cef737db02a085e1d018963c7a29bde5a')
@@ -497,4 +516,66 @@ def test_diff_functionality(repository: Git):
     assert "-        return allProjectsIn(path, false);" in diff
     assert "+        return new GitRepository(path).info();" in diff
     assert "     }" in diff
-    assert "     public static SCMRepository singleProject(String path, boolean singleParentOnly) {" in diff
\ No newline at end of file
+    assert "     public static SCMRepository singleProject(String path, boolean singleParentOnly) {" in diff
+
+@pytest.mark.parametrize('repository', ['https://github.com/codingwithshawnyt/GitAnalyzer/szz/'], indirect=True)
+def test_batched_last_modified(repository: Git):
+    fixes = [repository.get_commit('e6d3b38a9ef683e8184eac10a0471075c2808bbd'),
+             repository.get_commit('9942ee9dcdd1103e5808d544a84e6bc8cade0e54'),
+             repository.get_commit('be0772cbaa2eba32bf97aae885199d1a357ddc93')]
+
+    buggy_commits = repository.analyze_fix_commits(fixes)
+
+    assert len(buggy_commits) == 3
+    assert buggy_commits['e6d3b38a9ef683e8184eac10a0471075c2808bbd'] == {
+        'B.java': {'540c7f31c18664a38190fafb6721b5174ff4a166'}}
+    assert {'2eb905e5e7be414fd184d6b4f1571b142621f4de',
+            '20a40688521c1802569e60f9d55342c3bfdd772c',
+            '22505e97dca6f843549b3a484b3609be4e3acf17'} <= buggy_commits['9942ee9dcdd1103e5808d544a84e6bc8cade0e54']['A.java']
+    assert '9568d20856728304ab0b4d2d02fb9e81d0e5156d' in buggy_commits['be0772cbaa2eba32bf97aae885199d1a357ddc93']['H.java']
+
+
+def test_line_ranges():
+    assert Git._line_ranges([]) == []
+    assert Git._line_ranges([1, 2, 3, 7, 9, 10]) == [(1, 3), (7, 7), (9, 10)]
+
+
+@pytest.mark.parametrize('repository', ['https://github.com/codingwithshawnyt/GitAnalyzer/szz/'], indirect=True)
+def test_parallel_blame_matches_sequential(repository: Git):
+    fixes = [repository.get_commit('9942ee9dcdd1103e5808d544a84e6bc8cade0e54'),
+             repository.get_commit('be0772cbaa2eba32bf97aae885199d1a357ddc93')]
+
+    assert repository.analyze_fix_commits(fixes, workers=2, timeout=60) == repository.analyze_fix_commits(fixes)
+
+
+@pytest.mark.parametrize('repository', ['https://github.com/codingwithshawnyt/GitAnalyzer/szz/'], indirect=True)
+def test_cancelled_parallel_blame(repository: Git):
+    cancel = threading.Event()
+    cancel.set()
+
+    with pytest.raises(concurrent.futures.CancelledError):
+        repository.analyze_fix_commits([repository.get_commit('9942ee9dcdd1103e5808d544a84e6bc8cade0e54')],
+                                       workers=2, cancel_event=cancel)
+
+
+@pytest.mark.parametrize('repository', ['https://github.com/codingwithshawnyt/GitAnalyzer/szz/'], indirect=True)
+def test_cancel_while_blame_is_running(repository: Git, tmp_path, fake_git):
+    fix = repository.get_commit('9942ee9dcdd1103e5808d544a84e6bc8cade0e54')
+    assert fix.modified_files
+
+    # Every blame started from now on records its pid and hangs until its timeout
+    pids = tmp_path / 'pids'
+    fake_git(f'echo $$ >> {pids}\nexec sleep 30')
+
+    cancel = threading.Event()
+    threading.Timer(0.5, cancel.set).start()
+    started = time.monotonic()
+
+    with pytest.raises(concurrent.futures.CancelledError):
+        repository.analyze_fix_commits([fix], workers=2, timeout=5, cancel_event=cancel)
+
+    assert time.monotonic() - started < 3
+    # The running blames were killed rather than left to their timeout
+    for pid in pids.read_text().split():
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid), 0)
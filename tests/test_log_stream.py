@@ -0,0 +1,112 @@
+import subprocess
+from datetime import datetime
+
+import pytest
+
+from gitanalyzer.domain.commit import ChangeType
+from gitanalyzer.utils.log_stream import GitLogStream, build_git_arguments, parse_file_stats, _parse_raw_date
+
+SMALL_REPO_COMMITS = [
+    'a88c84ddf42066611e76e6cb690144e5357d132c',
+    '6411e3096dd2070438a17b225f44475136e54e3a',
+    '09f6182cef737db02a085e1d018963c7a29bde5a',
+    '1f99848edadfffa903b8ba1286a935f1b92b2845',
+    'da39b1326dbc2edfe518b90672734a08f3c13458',
+]
+
+
+def test_build_git_arguments():
+    arguments = build_git_arguments({
+        'reverse': True,
+        'no-merges': True,
+        'all': False,
+        'author': None,
+        'since': datetime(2016, 10, 8, 17, 0, 0),
+        'n': 3,
+    })
+
+    assert arguments == ['--reverse', '--no-merges', '--since=2016-10-08T17:00:00', '-n', '3']
+
+
+def test_build_command_with_pathspecs():
+    stream = GitLogStream('repo')
+
+    command = stream.build_command('HEAD', {'paths': ['*.py'], 'full_history': True})
+
+    assert command[-4:] == ['--full-history', 'HEAD', '--', '*.py']
+
+
+def test_parse_raw_date():
+    date, offset = _parse_raw_date('1522164679 +0100')
+
+    assert date.timestamp() == 1522164679
+    assert date.utcoffset().total_seconds() == 3600
+    assert offset == -3600
+
+
+def test_parse_file_stats_with_rename_and_binary():
+    tokens = [
+        ':000000 100644 0000000 bdc955b A', 'bin.dat',
+        ':100644 100644 422c2b7 de98044 R066', 'f.txt', 'g.txt',
+        '-\t-\tbin.dat',
+        '1\t0\t', 'f.txt', 'g.txt',
+    ]
+
+    added, renamed = parse_file_stats(tokens)
+
+    assert added.modification_type == ChangeType.ADDITION
+    assert added.original_path is None
+    assert added.current_path == 'bin.dat'
+    assert added.is_binary
+
+    assert renamed.modification_type == ChangeType.MOVED
+    assert renamed.original_path == 'f.txt'
+    assert renamed.current_path == 'g.txt'
+    assert (renamed.lines_added, renamed.lines_removed) == (1, 0)
+
+
+def test_stream_commits_in_order():
+    commits = list(GitLogStream('test-repos/small_repo').iter_commits('HEAD', reverse=True))
+
+    assert [commit.sha for commit in commits] == SMALL_REPO_COMMITS
+    assert commits[-1].creation_date.timestamp() == 1522164679
+    assert commits[0].file_stats is None
+
+
+def test_stream_commits_with_file_stats():
+    commits = list(GitLogStream('test-repos/small_repo', with_file_stats=True).iter_commits('HEAD'))
+
+    for commit in commits:
+        assert commit.file_stats is not None
+        assert commit.changed_files == len(commit.file_stats)
+        assert commit.total_changes == commit.added_lines + commit.removed_lines
+
+
+def test_stream_commits_without_file_stats_raises():
+    commit = next(GitLogStream('test-repos/small_repo').iter_commits('HEAD'))
+
+    with pytest.raises(ValueError):
+        commit.added_lines
+
+
+def test_stream_listed_commits():
+    listed = [SMALL_REPO_COMMITS[3], SMALL_REPO_COMMITS[0], SMALL_REPO_COMMITS[4]]
+    commits = list(GitLogStream('test-repos/small_repo', with_file_stats=True).iter_listed_commits(listed))
+
+    assert [commit.sha for commit in commits] == listed
+    assert all(commit.file_stats is not None for commit in commits)
+    assert list(GitLogStream('test-repos/small_repo').iter_listed_commits([])) == []
+
+
+def test_stream_listed_commits_reports_unknown_hashes(tmp_path):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    # Far more input than the pipe buffer, so git exits while it is still being written
+    unknown = ['0' * 40] * 100000
+
+    with pytest.raises(Exception, match='Failed to retrieve commits: .*bad object'):
+        list(GitLogStream(str(tmp_path)).iter_listed_commits(unknown))
+
+
+def test_stream_reads_stderr_while_git_runs(stderr_flooding_git):
+    with pytest.raises(Exception, match='Failed to retrieve commits: x'):
+        list(GitLogStream(str(stderr_flooding_git)).iter_commits('HEAD'))
@@ -1,7 +1,8 @@
 import mock
 import pytest
 from gitanalyzer.domain.developer import Developer
-from gitanalyzer.utils.mailmap import DefaultDeveloperFactory, MailmapDeveloperFactory
+from gitanalyzer.utils.mailmap import CheckMailmapProcess, DefaultDeveloperFactory, MailmapDeveloperFactory, MailmapIndex
+import subprocess
 from subprocess import CompletedProcess
 
 
@@ -78,3 +79,51 @@ def test_mailmap_dev_factory_with_cache_stderr(factory, name, email, expected):
         dev = factory.create_developer(name, email)
 
         assert dev == expected
+
+
+def test_mailmap_index_follows_git_rules():
+    index = MailmapIndex()
+    index.parse(
+        "# comment\n"
+        "Proper Name <commit@example.com>\n"
+        "<proper@example.com> <other@example.com>\n"
+        "Jane Doe <jane@example.com> jane <JANE@old.example.com>\n"
+    )
+
+    assert index.lookup("Someone", "commit@example.com") == ("Proper Name", "commit@example.com")
+    assert index.lookup("Someone", "OTHER@example.com") == ("Someone", "proper@example.com")
+    assert index.lookup("Jane", "jane@old.example.com") == ("Jane Doe", "jane@example.com")
+    assert index.lookup("Not Jane", "jane@old.example.com") == ("Not Jane", "jane@old.example.com")
+    assert index.lookup("Bob", "bob@example.com") == ("Bob", "bob@example.com")
+
+
+def test_mailmap_index_reads_mailmap_file_setting(tmp_path):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".mailmap").write_text("First <first@example.com> <alias@example.com>\n")
+    (tmp_path / "extra.mailmap").write_text("Second <second@example.com> <alias@example.com>\n")
+    subprocess.run(["git", "-C", str(tmp_path), "config", "mailmap.file", "extra.mailmap"], check=True)
+
+    index = MailmapIndex.from_repository(str(tmp_path))
+
+    assert index.lookup("Alias", "alias@example.com") == ("Second", "second@example.com")
+
+
+def test_check_mailmap_process_stops_git_on_exit(tmp_path, monkeypatch):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".mailmap").write_text("First <first@example.com> <alias@example.com>\n")
+
+    started = []
+    popen = subprocess.Popen
+
+    def recording_popen(*args, **kwargs):
+        started.append(popen(*args, **kwargs))
+        return started[-1]
+
+    monkeypatch.setattr(subprocess, "Popen", recording_popen)
+
+    with CheckMailmapProcess(str(tmp_path)) as resolver:
+        assert resolver.lookup("Alias", "alias@example.com") == ("First", "first@example.com")
+        assert resolver.lookup("Bob", "bob@example.com") == ("Bob", "bob@example.com")
+
+    assert len(started) == 1 and started[0].poll() is not None
+    resolver.close()
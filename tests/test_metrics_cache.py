@@ -0,0 +1,22 @@
+from gitanalyzer.utils.metrics_cache import BlobMetrics, BlobMetricsCache
+
+
+def test_cache_hit_is_keyed_by_extension():
+    cache = BlobMetricsCache()
+    metrics = BlobMetrics(10, 2, 40, [])
+    cache.put("blob", ".py", metrics)
+
+    assert cache.get("blob", ".py") is metrics
+    assert cache.get("blob", ".java") is None
+
+
+def test_cache_evicts_least_recently_used():
+    cache = BlobMetricsCache(max_entries=2)
+    cache.put("a", ".py", BlobMetrics(1, 1, 1, []))
+    cache.put("b", ".py", BlobMetrics(2, 2, 2, []))
+    cache.get("a", ".py")
+    cache.put("c", ".py", BlobMetrics(3, 3, 3, []))
+
+    assert len(cache) == 2
+    assert cache.get("b", ".py") is None
+    assert cache.get("a", ".py") is not None
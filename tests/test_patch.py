@@ -0,0 +1,51 @@
+from gitanalyzer.domain.patch import Hunk, parse_hunk_header, parse_patch, parse_patch_bytes
+
+PATCH = (
+    "@@ -1,4 +1,5 @@\n"
+    " first\n"
+    "-second\n"
+    "+changed second\n"
+    "+inserted\n"
+    " third\n"
+    " fourth\n"
+    "@@ -10 +11,2 @@\n"
+    "-last\n"
+    "\\ No newline at end of file\n"
+    "+last\n"
+    "+appended\n"
+)
+
+
+def test_parse_hunk_header():
+    assert parse_hunk_header("@@ -1,4 +1,5 @@ def main():") == Hunk(1, 4, 1, 5)
+    assert parse_hunk_header("@@ -10 +11,2 @@") == Hunk(10, 1, 11, 2)
+
+
+def test_parse_patch():
+    patch = parse_patch(PATCH)
+
+    assert (patch.lines_added, patch.lines_removed) == (4, 2)
+    assert patch.change_blocks == 3
+    assert patch.hunks == [Hunk(1, 4, 1, 5), Hunk(10, 1, 11, 2)]
+    assert patch.deleted == [(2, "second"), (10, "last")]
+    assert patch.added == [(2, "changed second"), (3, "inserted"), (11, "last"), (12, "appended")]
+
+
+def test_parse_empty_patch():
+    patch = parse_patch("")
+
+    assert (patch.lines_added, patch.lines_removed, patch.change_blocks) == (0, 0, 0)
+    assert patch.hunks == [] and patch.added == [] and patch.deleted == []
+
+
+def test_parse_patch_bytes_matches_text():
+    raw = PATCH.replace("inserted", "ins\u00e9r\u00e9 \r").encode() + b"+\xff invalid\n"
+    text = parse_patch(raw.decode("utf-8", "ignore"))
+    patch = parse_patch_bytes(raw)
+
+    assert (patch.lines_added, patch.lines_removed, patch.change_blocks) == (5, 2, 3)
+    assert patch.hunks == text.hunks
+    assert patch.added_line_numbers == [2, 3, 11, 12, 13]
+    assert patch._added is None
+    assert patch.added == text.added
+    assert patch.deleted == text.deleted
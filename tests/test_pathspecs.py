@@ -0,0 +1,8 @@
+from gitanalyzer.utils.pathspecs import file_type_pathspecs
+
+
+def test_file_type_pathspecs():
+    assert file_type_pathspecs(None) is None
+    assert file_type_pathspecs(set()) is None
+    assert file_type_pathspecs({'.py', '.java'}) == ['*.java', '*.py']
+    assert file_type_pathspecs(['[1].txt']) == ['*\\[1].txt']
@@ -3,6 +3,8 @@ from datetime import datetime
 import os
 import pytest
 import sys
+import threading
+import time
 
 from gitanalyzer import Repository, Git
 from gitanalyzer.repository import MalformedUrl
@@ -308,4 +310,137 @@ def test_deleted_files_in_repository():
                    filepath='.bettercodehub.yml',
                    include_deleted_files=True).traverse_commits()
     )
-    assert len(deleted_commits) > 0
\ No newline at end of file
+    assert len(deleted_commits) > 0
+
+
+def test_process_executor_preserves_order():
+    expected, binary_flags = [], []
+    for commit in Repository('test-repos/small_repo').traverse_commits():
+        expected.append(commit.hash)
+        binary_flags.append([change.is_binary for change in commit.file_changes])
+
+    records = list(Repository('test-repos/small_repo', thread_count=3, executor='process').traverse_commits())
+
+    assert [record.hash for record in records] == expected
+    assert all(record.file_stats is not None for record in records)
+    assert [[stat.is_binary for stat in record.file_stats] for record in records] == binary_flags
+
+
+def test_unknown_executor():
+    with pytest.raises(ValueError):
+        Repository('test-repos/small_repo', executor='fibers')
+
+
+def test_bounded_map_preserves_order_and_limits_look_ahead():
+    from concurrent.futures import ThreadPoolExecutor
+    from gitanalyzer.repository import _bounded_map
+
+    pulled = []
+
+    def items():
+        for value in range(10):
+            pulled.append(value)
+            yield value
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = _bounded_map(executor, lambda value: value * 2, items(), max_in_flight=3)
+        assert next(results) == 0
+        assert len(pulled) == 3
+        assert list(results) == [value * 2 for value in range(1, 10)]
+
+
+def test_split_in_chunks():
+    from gitanalyzer.repository import GitRepo
+
+    assert GitRepo._split_in_chunks(list(range(5)), 2) == [[0, 1, 2], [3, 4]]
+    assert GitRepo._split_in_chunks([], 4) == []
+
+
+@pytest.mark.parametrize('preserve_order', [True, False])
+def test_shard_executor(preserve_order):
+    expected = [commit.hash for commit in Repository('test-repos/small_repo').traverse_commits()]
+
+    records = list(Repository('test-repos/small_repo', thread_count=2, executor='shard',
+                              preserve_order=preserve_order).traverse_commits())
+
+    if preserve_order:
+        assert [record.hash for record in records] == expected
+    else:
+        assert sorted(record.hash for record in records) == sorted(expected)
+
+
+def test_drain_shard_queue_fails_when_a_worker_dies(monkeypatch):
+    import queue
+    from types import SimpleNamespace
+    from gitanalyzer import repository
+
+    monkeypatch.setattr(repository, '_SHARD_POLL_INTERVAL', 0.01)
+    results = queue.Queue()
+    results.put((0, 'record'))
+    results.put((0, repository._SHARD_DONE))
+    workers = {0: SimpleNamespace(exitcode=0), 1: SimpleNamespace(exitcode=-9)}
+
+    drained = repository._drain_shard_queue(results, workers)
+    assert next(drained) == 'record'
+    with pytest.raises(Exception, match='Shard 1 worker exited with code -9'):
+        next(drained)
+
+
+def test_repo_concurrency_tags_repositories():
+    repositories = ["test-repos/small_repo", "test-repos/branches_merged"]
+
+    tagged = list(Repository(path_to_repo=repositories, repo_concurrency=2).traverse_commits())
+
+    assert len(tagged) == 9
+    assert {item.repository_name for item in tagged} == {'small_repo', 'branches_merged'}
+
+
+class _FakeRepository:
+    """Stands in for the per-repository GitRepo of a parallel traversal."""
+
+    def __init__(self, name, commit_count):
+        self.name = name
+        self.commit_count = commit_count
+        self.closed = threading.Event()
+
+    def analyze_commits(self):
+        try:
+            for index in range(self.commit_count):
+                yield f'{self.name}-{index}'
+        finally:
+            self.closed.set()
+
+
+@pytest.fixture
+def fake_repositories(monkeypatch):
+    from gitanalyzer.repository import GitRepo
+
+    fakes = {}
+    monkeypatch.setattr(GitRepo, '_for_single_repository', lambda self, path: fakes[path])
+    monkeypatch.setattr(GitRepo, '_repository_name', lambda self, path: path)
+    return fakes
+
+
+def test_repo_concurrency_stops_producers_on_early_break(fake_repositories):
+    fake_repositories.update({'big': _FakeRepository('big', 10 ** 9), 'huge': _FakeRepository('huge', 10 ** 9)})
+
+    commits = Repository(path_to_repo=['big', 'huge'], repo_concurrency=2, max_in_flight=1).traverse_commits()
+    for _ in range(5):
+        next(commits)
+    started = time.monotonic()
+    commits.close()
+
+    assert time.monotonic() - started < 1
+    assert all(fake.closed.wait(timeout=5) for fake in fake_repositories.values())
+
+
+def test_repo_concurrency_interleaves_repositories(fake_repositories):
+    fake_repositories.update({'large': _FakeRepository('large', 1000), 'small': _FakeRepository('small', 3)})
+
+    tagged = list(Repository(path_to_repo=['large', 'small'], repo_concurrency=2,
+                             max_in_flight=2).traverse_commits())
+
+    assert len(tagged) == 1003
+    # The small repository is not starved until the large one is exhausted
+    small_positions = [position for position, item in enumerate(tagged) if item.repository_name == 'small']
+    assert len(small_positions) == 3 and small_positions[-1] < 100